@@ -0,0 +1,127 @@
+import gc
+import json
+import platform
+import statistics
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+
+class Benchmark:
+    def __init__(self, name, func, number=1000, repeat=5):
+        self.name = name
+        # Callable taking no arguments, any setup must be done before building the Benchmark.
+        self.func = func
+        # Calls per timed run.
+        self.number = number
+        # Timed runs, the median is used for comparisons.
+        self.repeat = repeat
+
+
+class BenchmarkResult:
+    def __init__(self, name, number, run_times):
+        self.name = name
+        self.number = number
+        # Seconds per call for each timed run.
+        self.per_call = [run_time / number for run_time in run_times]
+
+    def get_median(self):
+        return statistics.median(self.per_call)
+
+    def to_dict(self):
+        return {
+            'number': self.number,
+            'repeat': len(self.per_call),
+            'median_us': round(self.get_median() * 1e6, 4),
+            'min_us': round(min(self.per_call) * 1e6, 4),
+            'max_us': round(max(self.per_call) * 1e6, 4),
+            'stdev_us': round(statistics.pstdev(self.per_call) * 1e6, 4)
+        }
+
+
+class BenchmarkRunner:
+    @staticmethod
+    def run(benchmarks, name_filter=None, quick=False):
+        results = []
+        for benchmark in benchmarks:
+            if name_filter and name_filter not in benchmark.name:
+                continue
+            number = max(1, benchmark.number // 10) if quick else benchmark.number
+            repeat = min(3, benchmark.repeat) if quick else benchmark.repeat
+            result = BenchmarkRunner.run_benchmark(benchmark, number, repeat)
+            print(f'{benchmark.name:<60} {result.get_median() * 1e6:>12.3f} us/call')
+            results.append(result)
+        return results
+
+    @staticmethod
+    def run_benchmark(benchmark, number, repeat):
+        func = benchmark.func
+        # Warm up caches and lazy initializations.
+        func()
+
+        run_times = []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start = perf_counter()
+                for _ in range(number):
+                    func()
+                run_times.append(perf_counter() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        return BenchmarkResult(benchmark.name, number, run_times)
+
+    @staticmethod
+    def to_report(results):
+        return {
+            'date': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'results': {result.name: result.to_dict() for result in results}
+        }
+
+    @staticmethod
+    def save(report, file_path):
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+
+    @staticmethod
+    def load(file_path):
+        try:
+            with open(file_path, 'r') as report_file:
+                return json.load(report_file)
+        except (OSError, ValueError):
+            return None
+
+    # Returns a list of (name, baseline median, current median, ratio) and whether any benchmark regressed.
+    @staticmethod
+    def compare(report, baseline, threshold):
+        comparison = []
+        regressed = False
+        for name, result in report['results'].items():
+            baseline_result = baseline['results'].get(name)
+            if not baseline_result or not baseline_result['median_us']:
+                continue
+            ratio = result['median_us'] / baseline_result['median_us']
+            if ratio > 1.0 + threshold:
+                regressed = True
+            comparison.append((name, baseline_result['median_us'], result['median_us'], ratio))
+        return comparison, regressed
+
+    @staticmethod
+    def print_comparison(comparison, threshold):
+        print(f'\n{"Benchmark":<60} {"Baseline us":>12} {"Current us":>12} {"Change":>9}')
+        for name, baseline_median, current_median, ratio in comparison:
+            if ratio > 1.0 + threshold:
+                status = 'SLOWER'
+            elif ratio < 1.0 - threshold:
+                status = 'FASTER'
+            else:
+                status = ''
+            print(f'{name:<60} {baseline_median:>12.3f} {current_median:>12.3f} {(ratio - 1.0) * 100:>+8.1f}% {status}')
@@ -0,0 +1,51 @@
+from sqlalchemy import String, inspect
+
+
+# Benchmarks never touch a database. Must be called before importing any game module, some of them query
+# the database at import time.
+def install_database_stubs():
+    from database.dbc.DbcDatabaseManager import DbcDatabaseManager
+    DbcDatabaseManager.map_get_all_ids = staticmethod(lambda: [])
+    DbcDatabaseManager.area_get_all_ids = staticmethod(lambda: [])
+    DbcDatabaseManager.area_get_by_id_and_map_id = staticmethod(lambda area_id, map_id: None)
+
+
+# Builds a detached model instance with every column set to an empty value, then applies the given overrides.
+def make_model_row(model, **values):
+    row = model()
+    for column_attribute in inspect(model).column_attrs:
+        setattr(row, column_attribute.key, '' if isinstance(column_attribute.columns[0].type, String) else 0)
+    for key, value in values.items():
+        setattr(row, key, value)
+    return row
+
+
+# Returns a copy of the global config with the given Server.Settings values replaced, used to turn on features like
+# map tiles for a single module without a dedicated config file.
+def get_config_with_settings(config, **settings):
+    return config._replace(Server=config.Server._replace(Settings=config.Server.Settings._replace(**settings)))
+
+
+class FakeWorldObject:
+    def __init__(self, guid, type_id, location, map_id=0, instance_id=0):
+        self.guid = guid
+        self.type_id = type_id
+        self.location = location
+        self.map_id = map_id
+        self.instance_id = instance_id
+        self.current_cell = ''
+        # Cells bucket creatures by faction template.
+        self.faction = 0
+
+    def get_type_id(self):
+        return self.type_id
+
+
+class FakeRequester:
+    def __init__(self, guid):
+        self.guid = guid
+        self.group_manager = None
+
+    # noinspection PyMethodMayBeStatic
+    def player_or_group_require_quest_item(self, _item_entry):
+        return False
@@ -0,0 +1,55 @@
+import argparse
+import os
+import sys
+
+from benchmarks.BenchmarkRunner import BenchmarkRunner
+from benchmarks.Stubs import install_database_stubs
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'baseline.json')
+
+# Usage, from the repository root (a config.yml is required, no database or client is needed):
+#   python -m benchmarks                        Run all benchmarks and compare against benchmarks/baseline.json.
+#   python -m benchmarks --save-baseline        Run all benchmarks and store the results as the new baseline.
+#   python -m benchmarks -f grid -o out.json    Run benchmarks containing 'grid' and write results to out.json.
+parser = argparse.ArgumentParser(prog='python -m benchmarks')
+parser.add_argument('-f', '--filter', help='only run benchmarks whose name contains this text', default=None)
+parser.add_argument('-o', '--output', help='write results as JSON to this file', default=None)
+parser.add_argument('-b', '--baseline', help='baseline JSON file to compare against', default=BASELINE_PATH)
+parser.add_argument('--save-baseline', help='store results as the new baseline', action='store_true')
+parser.add_argument('-t', '--threshold', help='relative change reported as a regression (default 0.1 = 10%%)',
+                    type=float, default=0.1)
+parser.add_argument('-q', '--quick', help='fewer iterations, for smoke testing', action='store_true')
+args = parser.parse_args()
+
+
+def get_benchmarks():
+    # Imported after the database stubs are installed. The world server entry module goes first, same as main.py,
+    # to resolve circular imports between managers.
+    from game.world import WorldManager  # noqa: F401
+    from benchmarks.suites import GridBenchmarks, LootBenchmarks, MapBenchmarks, PacketBenchmarks
+    benchmarks = []
+    for suite in [PacketBenchmarks, GridBenchmarks, MapBenchmarks, LootBenchmarks]:
+        benchmarks.extend(suite.get_benchmarks())
+    return benchmarks
+
+
+if __name__ == '__main__':
+    install_database_stubs()
+    results = BenchmarkRunner.run(get_benchmarks(), name_filter=args.filter, quick=args.quick)
+    report = BenchmarkRunner.to_report(results)
+
+    if args.output:
+        BenchmarkRunner.save(report, args.output)
+    if args.save_baseline:
+        BenchmarkRunner.save(report, args.baseline)
+        print(f'Baseline saved to {args.baseline}')
+        sys.exit(0)
+
+    baseline = BenchmarkRunner.load(args.baseline)
+    if not baseline:
+        print(f'No baseline found at {args.baseline}, run with --save-baseline to create one.')
+        sys.exit(0)
+
+    comparison, regressed = BenchmarkRunner.compare(report, baseline, args.threshold)
+    BenchmarkRunner.print_comparison(comparison, args.threshold)
+    sys.exit(1 if regressed else 0)
@@ -0,0 +1,53 @@
+from random import Random
+
+from benchmarks.BenchmarkRunner import Benchmark
+from benchmarks.Stubs import FakeWorldObject
+from game.world.managers.abstractions.Vector import Vector
+from game.world.managers.maps.GridManager import GridManager
+from game.world.managers.maps.helpers.CellUtils import CELL_SIZE, CellUtils
+from utils.constants.MiscCodes import ObjectTypeIds
+
+MAP_ID = 0
+# Northshire Abbey.
+CENTER_X = -8949.95
+CENTER_Y = -132.49
+# Synthetic populations spread over a 5x5 cells area around the center.
+POPULATION_SIZES = [100, 1000, 5000]
+POPULATION_TYPES = [ObjectTypeIds.ID_PLAYER, ObjectTypeIds.ID_UNIT, ObjectTypeIds.ID_UNIT, ObjectTypeIds.ID_UNIT,
+                    ObjectTypeIds.ID_GAMEOBJECT, ObjectTypeIds.ID_GAMEOBJECT]
+
+
+def _build_grid(population_size):
+    rng = Random(population_size)
+    grid_manager = GridManager(MAP_ID, MAP_ID, lambda world_object: None)
+    spread = CELL_SIZE * 2.5
+    for guid in range(1, population_size + 1):
+        location = Vector(CENTER_X + rng.uniform(-spread, spread), CENTER_Y + rng.uniform(-spread, spread), 60.0)
+        world_object = FakeWorldObject(guid, rng.choice(POPULATION_TYPES), location, MAP_ID, MAP_ID)
+        cell = grid_manager._get_create_cell(location, MAP_ID, MAP_ID)
+        cell.add_world_object(world_object)
+    return grid_manager
+
+
+def get_benchmarks():
+    benchmarks = [
+        Benchmark('cell_utils.get_cell_key',
+                  lambda: CellUtils.get_cell_key(CENTER_X, CENTER_Y, MAP_ID, MAP_ID), number=20000),
+        Benchmark('cell_utils.generate_coord_data',
+                  lambda: CellUtils.generate_coord_data(CENTER_X, CENTER_Y), number=20000)
+    ]
+
+    # Units do not go through Far Sight checks, so this only measures the cells lookup and merging.
+    requester = FakeWorldObject(0, ObjectTypeIds.ID_UNIT, Vector(CENTER_X, CENTER_Y, 60.0), MAP_ID, MAP_ID)
+    all_types = [ObjectTypeIds.ID_PLAYER, ObjectTypeIds.ID_UNIT, ObjectTypeIds.ID_GAMEOBJECT]
+    for population_size in POPULATION_SIZES:
+        grid_manager = _build_grid(population_size)
+        benchmarks.append(Benchmark(f'grid.get_surrounding_objects.all_types.{population_size}',
+                                    lambda grid=grid_manager: grid.get_surrounding_objects(requester, all_types),
+                                    number=200))
+        benchmarks.append(Benchmark(f'grid.get_surrounding_objects.players.{population_size}',
+                                    lambda grid=grid_manager: grid.get_surrounding_objects(
+                                        requester, [ObjectTypeIds.ID_PLAYER]),
+                                    number=200))
+
+    return benchmarks
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from benchmarks.BenchmarkRunner import Benchmark
+from benchmarks.Stubs import FakeRequester, make_model_row
+from database.world.WorldDatabaseManager import WorldDatabaseManager
+from database.world.WorldModels import CreatureLootTemplate, ItemTemplate, ReferenceLootTemplate
+from game.world.managers.objects.units.creature.CreatureLootManager import CreatureLootManager
+
+LOOT_ID = 1
+REFERENCE_ID = 100
+FIRST_ITEM_ENTRY = 1000
+# Grey drops, 10 ungrouped items.
+UNGROUPED_ITEMS = 10
+# Equal chance groups of 8 items each.
+GROUPS = 3
+GROUP_SIZE = 8
+REFERENCE_SIZE = 20
+
+
+def _load_templates():
+    entries = iter(range(FIRST_ITEM_ENTRY, FIRST_ITEM_ENTRY + 1000))
+    holder = WorldDatabaseManager.CreatureLootTemplateHolder
+
+    def _add_creature_loot(chance, group_id, min_count_or_ref=1):
+        entry = next(entries)
+        WorldDatabaseManager.ItemTemplateHolder.load_item_template(
+            make_model_row(ItemTemplate, entry=entry, name=f'Item {entry}', display_id=entry, stackable=20))
+        holder.load_creature_loot_template(
+            make_model_row(CreatureLootTemplate, entry=LOOT_ID, item=entry, ChanceOrQuestChance=chance,
+                           groupid=group_id, mincountOrRef=min_count_or_ref, maxcount=3))
+
+    for _ in range(UNGROUPED_ITEMS):
+        _add_creature_loot(30.0, 0)
+    for group_id in range(1, GROUPS + 1):
+        for _ in range(GROUP_SIZE):
+            _add_creature_loot(0.0, group_id)
+    # Reference to a shared group, always rolled.
+    _add_creature_loot(100.0, 0, min_count_or_ref=-REFERENCE_ID)
+
+    for _ in range(REFERENCE_SIZE):
+        entry = next(entries)
+        WorldDatabaseManager.ItemTemplateHolder.load_item_template(
+            make_model_row(ItemTemplate, entry=entry, name=f'Item {entry}', display_id=entry, stackable=1))
+        WorldDatabaseManager.ReferenceLootTemplateHolder.load_reference_loot_template(
+            make_model_row(ReferenceLootTemplate, entry=REFERENCE_ID, item=entry, ChanceOrQuestChance=0.0,
+                           groupid=1, mincountOrRef=1, maxcount=1))
+
+
+def get_benchmarks():
+    _load_templates()
+    creature = SimpleNamespace(creature_template=SimpleNamespace(loot_id=LOOT_ID, skinning_loot_id=0, gold_min=10,
+                                                                 gold_max=100))
+    loot_manager = CreatureLootManager(creature)
+    requester = FakeRequester(1)
+
+    loot_groups = loot_manager.generate_loot_groups(loot_manager.loot_template)
+    return [
+        Benchmark('loot.generate_loot', lambda: loot_manager.generate_loot(requester), number=500),
+        Benchmark('loot.process_loot_groups',
+                  lambda: loot_manager.process_loot_groups(loot_groups, requester), number=2000),
+        Benchmark('loot.generate_loot_groups',
+                  lambda: loot_manager.generate_loot_groups(loot_manager.loot_template), number=5000)
+    ]
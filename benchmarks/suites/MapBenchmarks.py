@@ -0,0 +1,107 @@
+import atexit
+import math
+import os
+import shutil
+import tempfile
+from itertools import cycle
+from random import Random
+from struct import pack
+
+import game.world.managers.maps.MapManager as MapManagerModule
+import game.world.managers.maps.MapTile as MapTileModule
+from benchmarks.BenchmarkRunner import Benchmark
+from benchmarks.Stubs import get_config_with_settings
+from game.world.managers.maps.MapManager import MapManager, MAPS, MAPS_TILES
+from game.world.managers.maps.MapTile import MapTile
+from game.world.managers.maps.helpers.Constants import RESOLUTION_ZMAP, RESOLUTION_AREA_INFO, RESOLUTION_LIQUIDS
+from network.packet.PacketWriter import PacketWriter
+from utils.PathManager import PathManager
+
+MAP_ID = 0
+# Tile holding Northshire Abbey.
+ADT_X = 48
+ADT_Y = 32
+# World coordinates inside the tile above, away from its borders.
+MIN_X, MAX_X = -9050.0, -8550.0
+MIN_Y, MAX_Y = -520.0, -10.0
+
+
+class BenchmarkMap:
+    def __init__(self, map_id):
+        self.map_id = map_id
+
+    # noinspection PyMethodMayBeStatic
+    def get_liquid_or_create(self, liquid_type, height, use_float_16):
+        return MapManager.get_liquid_or_create(liquid_type, height, use_float_16)
+
+
+# Writes a .map file with rolling terrain, a single zone and a lake, in the same layout the extractor produces.
+def _write_map_file(maps_path):
+    data = bytearray(PacketWriter.string_to_bytes(MapTile.EXPECTED_VERSION))
+    for x in range(RESOLUTION_ZMAP):
+        for y in range(RESOLUTION_ZMAP):
+            data.extend(pack('<f', 60.0 + 8.0 * math.sin(x / 16.0) * math.cos(y / 16.0)))
+    for _ in range(RESOLUTION_AREA_INFO * RESOLUTION_AREA_INFO):
+        data.extend(pack('<i', 12))  # Elwynn Forest.
+        data.extend(pack('<i2BH', 9, 0, 1, 0))
+    for x in range(RESOLUTION_LIQUIDS):
+        for y in range(RESOLUTION_LIQUIDS):
+            if x < 32 and y < 32:
+                data.extend(pack('<bf', 0, 55.0))
+            else:
+                data.extend(pack('<b', -1))
+
+    file_name = f'{MAP_ID:03}{ADT_X:02}{ADT_Y:02}.map'
+    with open(os.path.join(maps_path, file_name), 'wb') as map_file:
+        map_file.write(data)
+
+
+def get_benchmarks():
+    # Map tiles are disabled in the default config, enable them for the modules under test only.
+    settings_config = get_config_with_settings(MapTileModule.config, use_map_tiles=True, use_nav_tiles=False,
+                                               use_float_16=False)
+    MapTileModule.config = settings_config
+    MapManagerModule.config = settings_config
+
+    root_path = tempfile.mkdtemp(prefix='alpha_benchmarks_')
+    atexit.register(shutil.rmtree, root_path, True)
+    PathManager.set_root_path(root_path)
+    os.makedirs(PathManager.get_maps_path(), exist_ok=True)
+    _write_map_file(PathManager.get_maps_path())
+
+    benchmark_map = BenchmarkMap(MAP_ID)
+    benchmarks = [Benchmark('map_tile.load_maps_data',
+                            lambda: MapTile(benchmark_map, ADT_X, ADT_Y).load_maps_data(), number=3, repeat=3)]
+
+    # Register a single ready tile so calculate_z goes through the map files path.
+    tile = MapTile(benchmark_map, ADT_X, ADT_Y)
+    tile.initialized = True
+    tile.has_maps = tile.load_maps_data()
+    tile.ready = True
+    MAPS[MAP_ID] = {}
+    MAPS_TILES[MAP_ID] = [[None for _ in range(64)] for _ in range(64)]
+    MAPS_TILES[MAP_ID][ADT_X][ADT_Y] = tile
+
+    rng = Random(MAP_ID)
+    points = cycle([(rng.uniform(MIN_X, MAX_X), rng.uniform(MIN_Y, MAX_Y)) for _ in range(1024)])
+
+    def _calculate_z():
+        x, y = next(points)
+        return MapManager.calculate_z(MAP_ID, x, y)
+
+    def _calculate_z_near_height():
+        x, y = next(points)
+        # A current z far from the terrain forces the expanded search.
+        return MapManager.calculate_z(MAP_ID, x, y, current_z=200.0)
+
+    def _normalized_height():
+        x, y = next(points)
+        adt_x, adt_y, cell_x, cell_y = MapManager.calculate_tile(x, y)
+        return MapManager.get_normalized_height_for_cell(MAP_ID, x, y, adt_x, adt_y, cell_x, cell_y)
+
+    benchmarks.append(Benchmark('map_manager.calculate_z', _calculate_z, number=10000))
+    benchmarks.append(Benchmark('map_manager.calculate_z_near_height', _calculate_z_near_height, number=2000))
+    benchmarks.append(Benchmark('map_manager.get_normalized_height_for_cell', _normalized_height, number=10000))
+    benchmarks.append(Benchmark('map_manager.get_area_information',
+                                lambda: MapManager.get_area_information(MAP_ID, *next(points)), number=10000))
+    return benchmarks
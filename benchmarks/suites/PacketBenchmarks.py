@@ -0,0 +1,67 @@
+from struct import pack
+
+from benchmarks.BenchmarkRunner import Benchmark
+from benchmarks.Stubs import FakeRequester
+from game.world.managers.objects.ObjectManager import ObjectManager
+from network.packet.PacketReader import PacketReader
+from network.packet.PacketWriter import PacketWriter
+from utils.constants.OpCodes import OpCode
+from utils.constants.UpdateFields import PlayerFields, UnitFields
+
+OWNER_GUID = 1
+OTHER_GUID = 2
+
+
+def _get_player_fields_object():
+    world_object = ObjectManager(guid=OWNER_GUID)
+    world_object.update_packet_factory.init_values(OWNER_GUID, PlayerFields)
+    # Touch every field so create blocks carry the full field set.
+    for index in range(PlayerFields.END):
+        world_object.set_uint32(index, index + 1)
+    return world_object
+
+
+def get_benchmarks():
+    benchmarks = []
+    world_object = _get_player_fields_object()
+    owner = FakeRequester(OWNER_GUID)
+    other = FakeRequester(OTHER_GUID)
+
+    benchmarks.append(Benchmark('update_fields.create_block_owner',
+                                lambda: world_object._get_fields_update(True, owner), number=200))
+    benchmarks.append(Benchmark('update_fields.create_block_other',
+                                lambda: world_object._get_fields_update(True, other), number=200))
+
+    # Typical partial update, a handful of changed unit fields.
+    partial_object = _get_player_fields_object()
+    partial_object.update_packet_factory.reset()
+    changed_fields = [UnitFields.UNIT_FIELD_HEALTH, UnitFields.UNIT_FIELD_POWER1, UnitFields.UNIT_FIELD_TARGET]
+    for field in changed_fields:
+        partial_object.set_uint32(field, 0xDEAD)
+    benchmarks.append(Benchmark('update_fields.partial_block_other',
+                                lambda: partial_object._get_fields_update(False, other), number=500))
+
+    set_values = iter(range(1 << 30))
+    benchmarks.append(Benchmark('update_fields.set_uint32',
+                                lambda: partial_object.set_uint32(UnitFields.UNIT_FIELD_HEALTH, next(set_values)),
+                                number=20000))
+
+    movement_data = pack('<Q9fI', 0, 0.0, 0.0, 0.0, 0.0, -8949.95, -132.49, 83.53, 1.5, 0.0, 0x1)
+    benchmarks.append(Benchmark('packet_writer.get_packet_movement',
+                                lambda: PacketWriter.get_packet(OpCode.MSG_MOVE_HEARTBEAT, movement_data),
+                                number=20000))
+    large_data = bytes(range(256)) * 16
+    benchmarks.append(Benchmark('packet_writer.get_packet_4k',
+                                lambda: PacketWriter.get_packet(OpCode.SMSG_UPDATE_OBJECT, large_data), number=20000))
+    benchmarks.append(Benchmark('packet_writer.string_to_bytes',
+                                lambda: PacketWriter.string_to_bytes('Welcome to the Friends and Family Alpha!'),
+                                number=20000))
+
+    movement_packet = PacketWriter.get_packet(OpCode.MSG_MOVE_HEARTBEAT, movement_data)
+    benchmarks.append(Benchmark('packet_reader.parse_header',
+                                lambda: PacketReader(movement_packet), number=20000))
+    chat_data = pack('<2I', 0, 7) + PacketWriter.string_to_bytes('Selling linen cloth, whisper me.')
+    benchmarks.append(Benchmark('packet_reader.read_string',
+                                lambda: PacketReader.read_string(chat_data, 8), number=20000))
+
+    return benchmarks
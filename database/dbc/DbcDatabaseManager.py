@@ -7,6 +7,7 @@ from sqlalchemy.orm import sessionmaker, scoped_session
 
 from database.dbc.DbcModels import *
 from game.world.managers.maps.helpers.AreaInformation import AreaInformation
+from game.world.managers.maps.helpers.StaticPointIndex import StaticPointIndex
 from game.world.managers.objects.locks.LockHolder import LockHolder
 from utils.ConfigManager import *
 from utils.constants.SpellCodes import SpellImplicitTargets
@@ -466,6 +467,8 @@ class DbcDatabaseManager:
     class TaxiNodesHolder:
         EASTERN_KINGDOMS_TAXI_NODES = {}
         KALIMDOR_TAXI_NODES = {}
+        # Taxi node ids by location, per continent.
+        TAXI_NODES_INDEX = StaticPointIndex()
 
         @staticmethod
         def load_taxi_node(taxi_node):
@@ -473,6 +476,15 @@ class DbcDatabaseManager:
                 DbcDatabaseManager.TaxiNodesHolder.EASTERN_KINGDOMS_TAXI_NODES[taxi_node.ID] = taxi_node
             elif taxi_node.ContinentID == 1:
                 DbcDatabaseManager.TaxiNodesHolder.KALIMDOR_TAXI_NODES[taxi_node.ID] = taxi_node
+            else:
+                return
+            DbcDatabaseManager.TaxiNodesHolder.TAXI_NODES_INDEX.add_point(taxi_node.ContinentID, taxi_node.X,
+                                                                          taxi_node.Y, taxi_node.Z, taxi_node.ID)
+
+        @staticmethod
+        def taxi_node_get_nearest_id(map_id, vector):
+            node_id = DbcDatabaseManager.TaxiNodesHolder.TAXI_NODES_INDEX.get_nearest(map_id, vector)
+            return -1 if node_id is None else node_id
 
         @staticmethod
         def taxi_nodes_get_by_map_id(map_id):
@@ -602,10 +614,23 @@ class DbcDatabaseManager:
 
     class FactionTemplateHolder:
         FACTION_TEMPLATES = {}
+        # Reaction matrix between faction templates, filled on demand: (own template id, target template id): reaction.
+        FACTION_REACTIONS = {}
 
         @staticmethod
         def load_faction_template(faction_template):
             DbcDatabaseManager.FactionTemplateHolder.FACTION_TEMPLATES[faction_template.ID] = faction_template
+            DbcDatabaseManager.FactionTemplateHolder.FACTION_REACTIONS.clear()
+
+        @staticmethod
+        def faction_template_get_reaction(own_faction_template_id, target_faction_template_id):
+            return DbcDatabaseManager.FactionTemplateHolder.FACTION_REACTIONS.get(
+                (own_faction_template_id, target_faction_template_id))
+
+        @staticmethod
+        def faction_template_set_reaction(own_faction_template_id, target_faction_template_id, reaction):
+            DbcDatabaseManager.FactionTemplateHolder.FACTION_REACTIONS[
+                (own_faction_template_id, target_faction_template_id)] = reaction
 
         @staticmethod
         def faction_template_get_by_id(faction_template_id):
@@ -814,20 +814,23 @@ class RealmDatabaseManager(object):
         return accounts
 
     @staticmethod
-    def guild_update(guild):
+    def guild_save(guild, guild_members):
         realm_db_session = SessionHolder()
-        realm_db_session.merge(guild)
-        realm_db_session.flush()
-        realm_db_session.commit()
-        realm_db_session.close()
-
-    @staticmethod
-    def guild_update_member(guild_member):
-        realm_db_session = SessionHolder()
-        realm_db_session.merge(guild_member)
-        realm_db_session.flush()
-        realm_db_session.commit()
-        realm_db_session.close()
+        try:
+            if guild:
+                realm_db_session.merge(guild)
+            # Skip members whose character was deleted, their row is already gone on cascade.
+            member_guids = [guild_member.guid for guild_member in guild_members]
+            existing_guids = {guid for guid, in realm_db_session.query(Character.guid).filter(
+                Character.guid.in_(member_guids))} if member_guids else set()
+            for guild_member in guild_members:
+                if guild_member.guid in existing_guids:
+                    realm_db_session.merge(guild_member)
+            realm_db_session.flush()
+            realm_db_session.commit()
+        finally:
+            # Also discards the transaction if anything failed.
+            realm_db_session.close()
 
     @staticmethod
     def guild_destroy(guild):
@@ -1,4 +1,5 @@
 import _queue
+import signal
 import socket
 import threading
 import traceback
@@ -8,10 +9,13 @@ from apscheduler.schedulers.background import BackgroundScheduler
 
 from database.world.WorldDatabaseManager import *
 from game.world.WorldLoader import WorldLoader
+from game.world.WorldMetrics import WorldMetrics
 from game.world.WorldSessionStateHandler import WorldSessionStateHandler
 from game.world.managers.maps.MapManager import MapManager
 from game.world.managers.objects.units.player.PlayerManager import PlayerManager
+from game.world.managers.objects.units.player.guild.GuildManager import GuildManager
 from game.world.opcode_handling.Definitions import Definitions
+from game.world.opcode_handling.HandlerProfiler import HandlerProfiler
 from network.packet.PacketReader import *
 from network.packet.PacketWriter import *
 from utils.Logger import Logger
@@ -40,6 +44,9 @@ class WorldServerSessionHandler:
 
         self.incoming_pending = _queue.SimpleQueue()
         self.outgoing_pending = _queue.SimpleQueue()
+        # Broadcasts from surrounding objects, sent as a single buffer on each flush.
+        self.broadcast_pending = []
+        self.broadcast_lock = threading.Lock()
 
     def handle(self):
         try:
@@ -71,11 +78,32 @@ class WorldServerSessionHandler:
         WorldSessionStateHandler.save_character(self.player_mgr)
 
     def enqueue_packets(self, packets):
-        [self.outgoing_pending.put_nowait(packet) for packet in packets if self.keep_alive]
+        # Pending broadcasts go first to keep packets in the order they were sent.
+        with self.broadcast_lock:
+            self._flush_broadcast_packets()
+            [self.outgoing_pending.put_nowait(packet) for packet in packets if self.keep_alive]
 
     def enqueue_packet(self, data):
         if self.keep_alive:
-            self.outgoing_pending.put_nowait(data)
+            with self.broadcast_lock:
+                self._flush_broadcast_packets()
+                self.outgoing_pending.put_nowait(data)
+
+    def enqueue_broadcast_packet(self, data):
+        if self.keep_alive:
+            with self.broadcast_lock:
+                self.broadcast_pending.append(data)
+
+    def flush_broadcast_packets(self):
+        with self.broadcast_lock:
+            self._flush_broadcast_packets()
+
+    def _flush_broadcast_packets(self):
+        if not self.broadcast_pending:
+            return
+        if self.keep_alive:
+            self.outgoing_pending.put_nowait(b''.join(self.broadcast_pending))
+        self.broadcast_pending.clear()
 
     def process_outgoing(self):
         while self.keep_alive:
@@ -100,7 +128,10 @@ class WorldServerSessionHandler:
                     continue
                 handler, found = Definitions.get_handler_from_packet(self, reader.opcode)
                 if handler:
-                    res = handler(self, reader)
+                    if HandlerProfiler.enabled:
+                        res = HandlerProfiler.profile(handler, self, reader)
+                    else:
+                        res = handler(self, reader)
                     if res == 0:
                         Logger.debug(f'[{self.client_address[0]}] Handling {reader.opcode_str()}')
                     elif res == 1:
@@ -220,50 +251,65 @@ class WorldServerSessionHandler:
         realm_saving_scheduler._daemon = True
         realm_saving_scheduler.add_job(WorldSessionStateHandler.save_characters, 'interval',
                                        seconds=config.Server.Settings.realm_saving_interval_seconds, max_instances=1)
+        # Flush pending guild changes.
+        realm_saving_scheduler.add_job(GuildManager.flush_guilds, 'interval',
+                                       seconds=config.Server.Settings.realm_saving_interval_seconds, max_instances=1)
         realm_saving_scheduler.start()
 
         # Player updates.
         player_update_scheduler = BackgroundScheduler()
         player_update_scheduler._daemon = True
-        player_update_scheduler.add_job(WorldSessionStateHandler.update_players, 'interval', seconds=0.1,
-                                        max_instances=1)
+        player_update_scheduler.add_job(WorldMetrics.timed_phase(WorldSessionStateHandler.update_players, 0.1),
+                                        'interval', seconds=0.1, max_instances=1)
         player_update_scheduler.start()
 
+        # Broadcast packets flushing.
+        broadcast_flush_scheduler = BackgroundScheduler()
+        broadcast_flush_scheduler._daemon = True
+        broadcast_flush_scheduler.add_job(WorldSessionStateHandler.flush_broadcast_packets, 'interval', seconds=0.05,
+                                          max_instances=1)
+        broadcast_flush_scheduler.start()
+
         # Creature updates.
         creature_update_scheduler = BackgroundScheduler()
         creature_update_scheduler._daemon = True
-        creature_update_scheduler.add_job(MapManager.update_creatures, 'interval', seconds=0.2, max_instances=1)
+        creature_update_scheduler.add_job(WorldMetrics.timed_phase(MapManager.update_creatures, 0.2),
+                                          'interval', seconds=0.2, max_instances=1)
         creature_update_scheduler.start()
 
         # Gameobject updates.
         gameobject_update_scheduler = BackgroundScheduler()
         gameobject_update_scheduler._daemon = True
-        gameobject_update_scheduler.add_job(MapManager.update_gameobjects, 'interval', seconds=1.0, max_instances=1)
+        gameobject_update_scheduler.add_job(WorldMetrics.timed_phase(MapManager.update_gameobjects, 1.0),
+                                            'interval', seconds=1.0, max_instances=1)
         gameobject_update_scheduler.start()
 
         # Dynamicobject updates.
         dynobject_update_scheduler = BackgroundScheduler()
         dynobject_update_scheduler._daemon = True
-        dynobject_update_scheduler.add_job(MapManager.update_dynobjects, 'interval', seconds=1.0, max_instances=1)
+        dynobject_update_scheduler.add_job(WorldMetrics.timed_phase(MapManager.update_dynobjects, 1.0),
+                                           'interval', seconds=1.0, max_instances=1)
         dynobject_update_scheduler.start()
 
         # Creature and Gameobject spawn updates (mostly to handle respawn logic).
         spawn_update_scheduler = BackgroundScheduler()
         spawn_update_scheduler._daemon = True
-        spawn_update_scheduler.add_job(MapManager.update_spawns, 'interval', seconds=1.0, max_instances=1)
+        spawn_update_scheduler.add_job(WorldMetrics.timed_phase(MapManager.update_spawns, 1.0),
+                                       'interval', seconds=1.0, max_instances=1)
         spawn_update_scheduler.start()
 
         # Corpses updates.
         corpses_update_scheduler = BackgroundScheduler()
         corpses_update_scheduler._daemon = True
-        corpses_update_scheduler.add_job(MapManager.update_corpses, 'interval', seconds=10.0, max_instances=1)
+        corpses_update_scheduler.add_job(WorldMetrics.timed_phase(MapManager.update_corpses, 10.0),
+                                         'interval', seconds=10.0, max_instances=1)
         corpses_update_scheduler.start()
 
         # Scripts/MapEvents events updates.
         map_events_update_scheduler = BackgroundScheduler()
         map_events_update_scheduler._daemon = True
-        map_events_update_scheduler.add_job(MapManager.update_map_scripts_and_events, 'interval', seconds=1.0,
-                                            max_instances=1)
+        map_events_update_scheduler.add_job(WorldMetrics.timed_phase(MapManager.update_map_scripts_and_events, 1.0),
+                                            'interval', seconds=1.0, max_instances=1)
         map_events_update_scheduler.start()
 
         # MapManager tile loading.
@@ -278,6 +324,19 @@ class WorldServerSessionHandler:
         cell_unloading_scheduler.add_job(MapManager.deactivate_cells, 'interval', seconds=120.0, max_instances=1)
         cell_unloading_scheduler.start()
 
+        # Handler profiling dumps.
+        if config.Server.Logging.profiling_dump_interval_seconds > 0:
+            profiling_dump_scheduler = BackgroundScheduler()
+            profiling_dump_scheduler._daemon = True
+            profiling_dump_scheduler.add_job(HandlerProfiler.dump, 'interval',
+                                             seconds=config.Server.Logging.profiling_dump_interval_seconds,
+                                             max_instances=1)
+            profiling_dump_scheduler.start()
+
+        # Tick phases, maps and queues metrics endpoint.
+        if config.Server.Connection.Metrics.enabled:
+            WorldMetrics.start_endpoint()
+
         # Chat logging queue.
         if config.Server.Logging.log_player_chat:
             logging_thread = threading.Thread(target=ChatLogManager.process_logs)
@@ -299,16 +358,33 @@ class WorldServerSessionHandler:
 
         WorldServerSessionHandler.schedule_background_tasks()
 
+        # The main process stops the world process with SIGTERM, leave the loop below so shutdown tasks still run.
+        signal.signal(signal.SIGTERM, WorldServerSessionHandler._on_terminate)
+
         real_binding = server_socket.getsockname()
         Logger.success(f'World server started, listening on {real_binding[0]}:{real_binding[1]}\a')
 
-        while WORLD_ON:  # sck.accept() is a blocking call, we can't exit this loop gracefully.
-            # noinspection PyBroadException
-            try:
-                client_socket, client_address = server_socket.accept()
-                server_handler = WorldServerSessionHandler(client_socket, client_address)
-                world_session_thread = threading.Thread(target=server_handler.handle)
-                world_session_thread.daemon = True
-                world_session_thread.start()
-            except:
-                break
+        try:
+            while WORLD_ON:  # sck.accept() is a blocking call, we can't exit this loop gracefully.
+                # noinspection PyBroadException
+                try:
+                    client_socket, client_address = server_socket.accept()
+                    server_handler = WorldServerSessionHandler(client_socket, client_address)
+                    world_session_thread = threading.Thread(target=server_handler.handle)
+                    world_session_thread.daemon = True
+                    world_session_thread.start()
+                except:
+                    break
+        finally:
+            WorldServerSessionHandler.on_shutdown()
+
+    @staticmethod
+    def on_shutdown():
+        # Don't get interrupted by further termination requests while saving.
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        Logger.info('Saving pending guild changes...')
+        GuildManager.flush_guilds()
+
+    @staticmethod
+    def _on_terminate(signum, frame):
+        raise SystemExit
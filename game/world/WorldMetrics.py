@@ -0,0 +1,178 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+
+from game.world.WorldSessionStateHandler import WorldSessionStateHandler
+from game.world.managers.maps.MapManager import MAPS, PENDING_TILE_INITIALIZATION_QUEUE
+from game.world.opcode_handling.HandlerProfiler import HandlerProfiler
+from utils.ConfigManager import config
+from utils.Logger import Logger
+
+
+class TickPhaseStats:
+    def __init__(self, name, interval):
+        self.name = name
+        self.interval = interval
+        self.count = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+        self.max_time = 0.0
+        self.overruns = 0
+
+    def record(self, elapsed):
+        self.count += 1
+        self.total_time += elapsed
+        self.last_time = elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        # Took longer than its scheduling interval, next run will be late.
+        if elapsed > self.interval:
+            self.overruns += 1
+
+
+class WorldMetrics:
+    # Each phase runs on its own scheduler with max_instances=1, so every TickPhaseStats has a single writer.
+    PHASES: dict[str, TickPhaseStats] = {}
+
+    @staticmethod
+    def timed_phase(func, interval):
+        stats = WorldMetrics.PHASES[func.__name__] = TickPhaseStats(func.__name__, interval)
+
+        def _run():
+            start = perf_counter()
+            try:
+                func()
+            finally:
+                stats.record(perf_counter() - start)
+
+        return _run
+
+    @staticmethod
+    def start_endpoint():
+        host = config.Server.Connection.Metrics.host
+        port = config.Server.Connection.Metrics.port
+        try:
+            server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+        except OSError as e:
+            Logger.error(f'[Metrics] Unable to bind metrics endpoint on {host}:{port}: {e}')
+            return
+
+        server.daemon_threads = True
+        metrics_thread = threading.Thread(target=server.serve_forever)
+        metrics_thread.daemon = True
+        metrics_thread.start()
+        Logger.success(f'[Metrics] Serving metrics on http://{host}:{port}/metrics')
+
+    # Prometheus text exposition format.
+    @staticmethod
+    def render():
+        lines = []
+
+        WorldMetrics._add_header(lines, 'alpha_tick_phase_duration_seconds', 'summary', 'Tick phase durations.')
+        for stats in list(WorldMetrics.PHASES.values()):
+            labels = f'{{phase="{stats.name}"}}'
+            lines.append(f'alpha_tick_phase_duration_seconds_sum{labels} {stats.total_time:.6f}')
+            lines.append(f'alpha_tick_phase_duration_seconds_count{labels} {stats.count}')
+        WorldMetrics._add_header(lines, 'alpha_tick_phase_last_duration_seconds', 'gauge', 'Last tick phase duration.')
+        for stats in list(WorldMetrics.PHASES.values()):
+            lines.append(f'alpha_tick_phase_last_duration_seconds{{phase="{stats.name}"}} {stats.last_time:.6f}')
+        WorldMetrics._add_header(lines, 'alpha_tick_phase_max_duration_seconds', 'gauge', 'Max tick phase duration.')
+        for stats in list(WorldMetrics.PHASES.values()):
+            lines.append(f'alpha_tick_phase_max_duration_seconds{{phase="{stats.name}"}} {stats.max_time:.6f}')
+        WorldMetrics._add_header(lines, 'alpha_tick_phase_overruns_total', 'counter',
+                                 'Tick phases which took longer than their interval.')
+        for stats in list(WorldMetrics.PHASES.values()):
+            lines.append(f'alpha_tick_phase_overruns_total{{phase="{stats.name}"}} {stats.overruns}')
+
+        WorldMetrics._render_maps(lines)
+        WorldMetrics._render_queues(lines)
+        WorldMetrics._render_handlers(lines)
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _render_maps(lines):
+        map_lines = {'alpha_map_cells': [], 'alpha_map_active_cells': [], 'alpha_map_active_objects': []}
+        for map_id, instances in list(MAPS.items()):
+            for instance_id, instance_map in list(instances.items()):
+                grid_manager = instance_map.grid_manager
+                labels = f'map="{map_id}",instance="{instance_id}"'
+                map_lines['alpha_map_cells'].append(f'alpha_map_cells{{{labels}}} {len(grid_manager.cells)}')
+                active_cells = [grid_manager.cells[key] for key in list(grid_manager.active_cell_keys)
+                                if key in grid_manager.cells]
+                map_lines['alpha_map_active_cells'].append(f'alpha_map_active_cells{{{labels}}} {len(active_cells)}')
+                # Nothing running on this map, skip objects.
+                if not active_cells:
+                    continue
+                counts = {
+                    'player': sum(len(cell.players) for cell in active_cells),
+                    'creature': sum(len(cell.creatures) for cell in active_cells),
+                    'gameobject': sum(len(cell.gameobjects) for cell in active_cells),
+                    'dynamicobject': sum(len(cell.dynamic_objects) for cell in active_cells),
+                    'corpse': sum(len(cell.corpses) for cell in active_cells)
+                }
+                for object_type, count in counts.items():
+                    map_lines['alpha_map_active_objects'].append(
+                        f'alpha_map_active_objects{{{labels},type="{object_type}"}} {count}')
+
+        WorldMetrics._add_header(lines, 'alpha_map_cells', 'gauge', 'Cells created per map instance.')
+        lines.extend(map_lines['alpha_map_cells'])
+        WorldMetrics._add_header(lines, 'alpha_map_active_cells', 'gauge', 'Active cells per map instance.')
+        lines.extend(map_lines['alpha_map_active_cells'])
+        WorldMetrics._add_header(lines, 'alpha_map_active_objects', 'gauge', 'Objects within active cells.')
+        lines.extend(map_lines['alpha_map_active_objects'])
+
+    @staticmethod
+    def _render_queues(lines):
+        sessions = WorldSessionStateHandler.get_world_sessions()
+        incoming = [session.incoming_pending.qsize() for session in sessions]
+        outgoing = [session.outgoing_pending.qsize() for session in sessions]
+
+        WorldMetrics._add_header(lines, 'alpha_world_sessions', 'gauge', 'Connected world sessions.')
+        lines.append(f'alpha_world_sessions {len(sessions)}')
+        WorldMetrics._add_header(lines, 'alpha_session_queue_pending', 'gauge', 'Pending packets over all sessions.')
+        lines.append(f'alpha_session_queue_pending{{queue="incoming"}} {sum(incoming)}')
+        lines.append(f'alpha_session_queue_pending{{queue="outgoing"}} {sum(outgoing)}')
+        WorldMetrics._add_header(lines, 'alpha_session_queue_max_pending', 'gauge', 'Largest session queue.')
+        lines.append(f'alpha_session_queue_max_pending{{queue="incoming"}} {max(incoming, default=0)}')
+        lines.append(f'alpha_session_queue_max_pending{{queue="outgoing"}} {max(outgoing, default=0)}')
+        WorldMetrics._add_header(lines, 'alpha_pending_tile_initialization', 'gauge', 'ADT tiles waiting to load.')
+        lines.append(f'alpha_pending_tile_initialization {PENDING_TILE_INITIALIZATION_QUEUE.qsize()}')
+
+    @staticmethod
+    def _render_handlers(lines):
+        handler_stats = HandlerProfiler.get_opcode_stats()
+        if not handler_stats:
+            return
+        WorldMetrics._add_header(lines, 'alpha_handler_duration_seconds', 'summary', 'Opcode handler durations.')
+        for stats in handler_stats:
+            labels = f'{{opcode="{stats.opcode}"}}'
+            lines.append(f'alpha_handler_duration_seconds_sum{labels} {stats.total_time:.6f}')
+            lines.append(f'alpha_handler_duration_seconds_count{labels} {stats.calls}')
+        WorldMetrics._add_header(lines, 'alpha_handler_errors_total', 'counter', 'Opcode handler errors.')
+        for stats in handler_stats:
+            lines.append(f'alpha_handler_errors_total{{opcode="{stats.opcode}"}} {stats.errors}')
+
+    @staticmethod
+    def _add_header(lines, name, metric_type, description):
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {metric_type}')
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    # noinspection PyPep8Naming
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+
+        body = WorldMetrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Silence default stderr request logging.
+    def log_message(self, format_, *args):
+        pass
@@ -89,6 +89,11 @@ class WorldSessionStateHandler(object):
     def find_player_by_name(name_to_search):
         return PLAYER_BY_NAME.get(name_to_search.lower())
 
+    @staticmethod
+    def flush_broadcast_packets():
+        for session in WORLD_SESSIONS:
+            session.flush_broadcast_packets()
+
     @staticmethod
     def update_players():
         now = time.time()
@@ -12,6 +12,7 @@ from game.world.managers.objects.units.DamageInfoHolder import DamageInfoHolder
 from game.world.managers.objects.units.ChatManager import ChatManager
 from game.world.managers.objects.units.player.guild.GuildManager import GuildManager
 from game.world.managers.objects.units.creature.CreatureBuilder import CreatureBuilder
+from game.world.opcode_handling.HandlerProfiler import HandlerProfiler
 from utils.ConfigManager import config
 from utils.GitUtils import GitUtils
 from utils.TextUtils import GameTextFormatter
@@ -912,6 +913,9 @@ class CommandManager(object):
             if session.player_mgr and session.player_mgr.online:
                 session.disconnect()
 
+        # Write pending guild changes.
+        GuildManager.flush_guilds()
+
         return 0, ''
 
     @staticmethod
@@ -934,6 +938,34 @@ class CommandManager(object):
 
         return 0, message
 
+    @staticmethod
+    def handlerstats(world_session, args):
+        arg = str(args).strip().lower()
+        if arg in ('on', 'off'):
+            HandlerProfiler.set_enabled(arg == 'on')
+            return 0, f'Handler profiling {"enabled" if arg == "on" else "disabled"}.'
+        elif arg == 'reset':
+            HandlerProfiler.reset()
+            return 0, 'Handler stats reset.'
+        elif arg == 'dump':
+            HandlerProfiler.dump()
+            return 0, f'Handler stats saved to {HandlerProfiler.PROFILING_FULL_PATH}.'
+        elif arg and arg != 'handlers':
+            return -1, 'please use it like .handlerstats [handlers|on|off|reset|dump]'
+
+        stats = HandlerProfiler.get_handler_stats() if arg == 'handlers' else HandlerProfiler.get_opcode_stats()
+        if not stats:
+            return 0, f'No handler stats recorded, profiling is {"on" if HandlerProfiler.enabled else "off"}.'
+
+        message = f'Profiling {"on" if HandlerProfiler.enabled else "off"}, since {HandlerProfiler.started:%H:%M:%S}.\n'
+        # Top 10 by total time spent.
+        for entry in stats[:10]:
+            name = entry.handler_name if arg == 'handlers' else entry.opcode
+            message += f'{name}: {entry.calls} calls, {entry.errors} errors, ' \
+                       f'total {entry.total_time * 1000:.1f}ms, avg {entry.get_average() * 1000:.2f}ms, ' \
+                       f'p95 {entry.get_percentile(95) * 1000:.2f}ms, max {entry.max_time * 1000:.2f}ms\n'
+        return 0, message.rstrip('\n')
+
     @staticmethod
     def createmonster(world_session, args):
         try:
@@ -1076,7 +1108,8 @@ GM_COMMAND_DEFINITIONS = {
     'qadd': [CommandManager.qadd, 'adds a quest to your log'],
     'qdel': [CommandManager.qdel, 'delete active or completed quest'],
     'fevent': [CommandManager.fevent, 'force the given event to execute'],
-    'gmtag': [CommandManager.gmtag, 'enable or disable the <GM> tag']
+    'gmtag': [CommandManager.gmtag, 'enable or disable the <GM> tag'],
+    'handlerstats': [CommandManager.handlerstats, 'print opcode handler profiling stats']
 }
 
 DEV_COMMAND_DEFINITIONS = {
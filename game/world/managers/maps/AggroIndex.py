@@ -0,0 +1,118 @@
+import math
+from threading import RLock
+
+from utils.constants.MiscCodes import ObjectTypeIds
+
+# Side length of the buckets used to index detection circles.
+BUCKET_SIZE = 16.0
+
+
+class AggroIndex:
+    """Per map index of creature detection circles, used to find which creatures can notice a moving unit."""
+
+    def __init__(self):
+        self.index_lock = RLock()
+        # (bucket_x, bucket_y): {guid: creature}
+        self.buckets: dict[tuple, dict] = {}
+        # guid: (bucket keys, x, y, detection range)
+        self.entries: dict[int, tuple] = {}
+        # (observer guid, target guid): (observer, target)
+        self.pending_los: dict[tuple, tuple] = {}
+
+    def update_creature(self, creature):
+        detection_range = creature.get_detection_range()
+        if detection_range <= 0:
+            self.remove_creature(creature)
+            return
+
+        x = creature.location.x
+        y = creature.location.y
+        entry = self.entries.get(creature.guid)
+        # Nothing changed since the last update, skip.
+        if entry and entry[1] == x and entry[2] == y and entry[3] == detection_range:
+            return
+
+        bucket_keys = AggroIndex._get_bucket_keys(x, y, detection_range)
+        with self.index_lock:
+            if entry:
+                for key in entry[0] - bucket_keys:
+                    self._remove_from_bucket(key, creature.guid)
+            for key in bucket_keys:
+                bucket = self.buckets.get(key)
+                if bucket is None:
+                    bucket = self.buckets[key] = {}
+                bucket[creature.guid] = creature
+            self.entries[creature.guid] = (bucket_keys, x, y, detection_range)
+
+    def remove_creature(self, creature):
+        with self.index_lock:
+            entry = self.entries.pop(creature.guid, None)
+            if not entry:
+                return
+            for key in entry[0]:
+                self._remove_from_bucket(key, creature.guid)
+
+    # Returns creatures whose detection circle contains the given location.
+    def get_observers(self, vector):
+        key = (math.floor(vector.x / BUCKET_SIZE), math.floor(vector.y / BUCKET_SIZE))
+        with self.index_lock:
+            bucket = self.buckets.get(key)
+            if not bucket:
+                return []
+            candidates = list(bucket.values())
+
+        return [creature for creature in candidates
+                if creature.location.distance(vector) <= creature.get_detection_range()]
+
+    # Defer the line of sight check between an observer and a moving target, a given pair is only checked once.
+    def enqueue_los_check(self, observer, target):
+        with self.index_lock:
+            self.pending_los[(observer.guid, target.guid)] = (observer, target)
+
+    def process_pending_los(self, map_):
+        with self.index_lock:
+            if not self.pending_los:
+                return
+            pending = self.pending_los
+            self.pending_los = {}
+
+        candidates = []
+        for observer, target in pending.values():
+            # Either unit might have died, left the map or been despawned while waiting.
+            if not observer.is_alive or not target.is_alive:
+                continue
+            if observer.map_id != map_.map_id or target.map_id != map_.map_id:
+                continue
+            if observer.instance_id != map_.instance_id or target.instance_id != map_.instance_id:
+                continue
+            if observer.get_type_id() == ObjectTypeIds.ID_UNIT and not observer.is_spawned:
+                continue
+            if observer.threat_manager.has_aggro_from(target):
+                continue
+            candidates.append((observer, target))
+
+        if not candidates:
+            return
+
+        # Resolve line of sight for all remaining pairs at once.
+        in_sight = map_.los_check_batch([(observer.get_ray_position(), target.get_ray_position())
+                                         for observer, target in candidates])
+        for (observer, target), has_los in zip(candidates, in_sight):
+            if has_los:
+                observer.on_move_in_line_of_sight(target)
+
+    def _remove_from_bucket(self, key, guid):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            return
+        bucket.pop(guid, None)
+        if not bucket:
+            del self.buckets[key]
+
+    @staticmethod
+    def _get_bucket_keys(x, y, radius):
+        min_x = math.floor((x - radius) / BUCKET_SIZE)
+        max_x = math.floor((x + radius) / BUCKET_SIZE)
+        min_y = math.floor((y - radius) / BUCKET_SIZE)
+        max_y = math.floor((y + radius) / BUCKET_SIZE)
+        return {(bucket_x, bucket_y) for bucket_x in range(min_x, max_x + 1) for bucket_y in range(min_y, max_y + 1)}
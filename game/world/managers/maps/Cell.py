@@ -1,7 +1,12 @@
+import time
+
 from game.world.managers.objects.farsight.FarSightManager import FarSightManager
 from utils.constants.MiscCodes import ObjectTypeIds
 from threading import RLock
 
+# How long a snapshot of player positions is used for broadcast range checks, matches the broadcast flush interval.
+PLAYERS_SNAPSHOT_INTERVAL = 0.05
+
 
 class Cell:
     def __init__(self, min_x=0.0, min_y=0.0, max_x=0.0, max_y=0.0, map_id=0, instance_id=0, key=''):
@@ -22,6 +27,12 @@ class Cell:
         self.players = dict()
         self.dynamic_objects = dict()
         self.corpses = dict()
+        # [(player_mgr, location)] used by broadcasts, rebuilt once per interval or when players enter or leave.
+        self.players_snapshot = []
+        self.players_snapshot_timestamp = 0
+        # Creatures bucketed by faction template, {faction: {guid: creature}}, plus the faction each one was added with.
+        self.creatures_by_faction = dict()
+        self.creature_factions = dict()
         # Spawns.
         self.creatures_spawns = dict()
         self.gameobject_spawns = dict()
@@ -60,8 +71,10 @@ class Cell:
 
         if world_object.get_type_id() == ObjectTypeIds.ID_PLAYER:
             self.players[world_object.guid] = world_object
+            self.players_snapshot_timestamp = 0
         elif world_object.get_type_id() == ObjectTypeIds.ID_UNIT:
             self.creatures[world_object.guid] = world_object
+            self._add_creature_faction(world_object)
         elif world_object.get_type_id() == ObjectTypeIds.ID_GAMEOBJECT:
             self.gameobjects[world_object.guid] = world_object
         elif world_object.get_type_id() == ObjectTypeIds.ID_DYNAMICOBJECT:
@@ -136,9 +149,11 @@ class Cell:
         guid = world_object.guid
         if world_object.get_type_id() == ObjectTypeIds.ID_PLAYER and guid in self.players:
             self.players.pop(world_object.guid, None)
+            self.players_snapshot_timestamp = 0
             return True
         elif world_object.get_type_id() == ObjectTypeIds.ID_UNIT and guid in self.creatures:
             self.creatures.pop(world_object.guid, None)
+            self._remove_creature_faction(guid)
             return True
         elif world_object.get_type_id() == ObjectTypeIds.ID_GAMEOBJECT and guid in self.gameobjects:
             self.gameobjects.pop(world_object.guid, None)
@@ -151,9 +166,44 @@ class Cell:
             return True
         return False
 
+    # Move the creature to its current faction bucket if its faction changed since it was added.
+    def update_creature_faction(self, creature):
+        if self.creature_factions.get(creature.guid, creature.faction) == creature.faction:
+            return
+        self._remove_creature_faction(creature.guid)
+        self._add_creature_faction(creature)
+
+    def get_creatures_by_faction(self, faction):
+        return self.creatures_by_faction.get(faction)
+
+    def _add_creature_faction(self, creature):
+        self.creature_factions[creature.guid] = creature.faction
+        bucket = self.creatures_by_faction.get(creature.faction)
+        if bucket is None:
+            bucket = self.creatures_by_faction[creature.faction] = dict()
+        bucket[creature.guid] = creature
+
+    def _remove_creature_faction(self, guid):
+        faction = self.creature_factions.pop(guid, None)
+        bucket = self.creatures_by_faction.get(faction)
+        if bucket is None:
+            return
+        bucket.pop(guid, None)
+        if not bucket:
+            del self.creatures_by_faction[faction]
+
+    def get_players_snapshot(self):
+        now = time.time()
+        if now - self.players_snapshot_timestamp >= PLAYERS_SNAPSHOT_INTERVAL:
+            self.players_snapshot = [(player_mgr, player_mgr.location.copy())
+                                     for player_mgr in list(self.players.values())]
+            self.players_snapshot_timestamp = now
+        return self.players_snapshot
+
+    # Packets are buffered on each player session and sent together on the next broadcast flush.
     def send_all(self, packet, source, include_source=False, exclude=None, use_ignore=False):
         players_reached = set()
-        for guid, player_mgr in list(self.players.items()):
+        for player_mgr, location in self.get_players_snapshot():
             if not player_mgr.online:
                 continue
             if not include_source and player_mgr.guid == source.guid:
@@ -166,7 +216,7 @@ class Cell:
             if not player_mgr.guid == source.guid and source.guid not in player_mgr.known_objects:
                 continue
             players_reached.add(player_mgr.guid)
-            player_mgr.enqueue_packet(packet)
+            player_mgr.enqueue_broadcast_packet(packet)
 
         # If this cell has cameras, route packets.
         for camera in FarSightManager.get_cell_cameras(self):
@@ -177,8 +227,9 @@ class Cell:
             self.send_all(packet, source, exclude)
         else:
             players_reached = set()
-            for guid, player_mgr in list(self.players.items()):
-                if not player_mgr.online or not player_mgr.location.distance(source.location) <= range_:
+            range_sqrd = range_ * range_
+            for player_mgr, location in self.get_players_snapshot():
+                if not player_mgr.online or location.distance_sqrd(source.location) > range_sqrd:
                     continue
                 if not include_source and player_mgr.guid == source.guid:
                     continue
@@ -188,7 +239,7 @@ class Cell:
                 if not player_mgr.guid == source.guid and source.guid not in player_mgr.known_objects:
                     continue
                 players_reached.add(player_mgr.guid)
-                player_mgr.enqueue_packet(packet)
+                player_mgr.enqueue_broadcast_packet(packet)
 
             # If this cell has cameras, route packets.
             for camera in FarSightManager.get_cell_cameras(self):
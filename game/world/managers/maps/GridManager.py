@@ -2,11 +2,13 @@ from __future__ import annotations
 from threading import RLock
 import time
 
+from game.world.managers.maps.AggroIndex import AggroIndex
 from game.world.managers.maps.Cell import Cell
+from game.world.managers.maps.ProximityTriggerIndex import ProximityTriggerIndex
 from game.world.managers.maps.helpers.CellUtils import CELL_SIZE, CellUtils
 from game.world.managers.objects.farsight.FarSightManager import FarSightManager
 from utils.Logger import Logger
-from utils.constants.MiscCodes import ObjectTypeIds
+from utils.constants.MiscCodes import ObjectTypeIds, ObjectTypeFlags
 
 
 class GridManager:
@@ -17,6 +19,8 @@ class GridManager:
         self.active_cell_keys: set[str] = set()
         self.cells: dict[str, Cell] = {}
         self.active_cell_callback = active_cell_callback
+        self.aggro_index = AggroIndex()
+        self.proximity_trigger_index = ProximityTriggerIndex()
 
     def spawn_object(self, world_object_spawn=None, world_object_instance=None):
         if world_object_instance:
@@ -58,10 +62,25 @@ class GridManager:
                 self._activate_cell_by_world_object(world_object)
                 Logger.warning(f'Unit {world_object.get_name()} triggered inactive cell {current_cell_key}')
             world_object.on_cell_change()
+        # Keep this creature detection circle and faction bucket up to date.
+        elif world_object.get_type_id() == ObjectTypeIds.ID_UNIT:
+            self.aggro_index.update_creature(world_object)
+            cell = self.cells.get(current_cell_key)
+            if cell:
+                cell.update_creature_faction(world_object)
+
+        # Let traps know about units standing within their radius.
+        if self.proximity_trigger_index.has_triggers() and world_object.get_type_mask() & ObjectTypeFlags.TYPE_UNIT:
+            for trap_manager in self.proximity_trigger_index.get_triggers(world_object.location):
+                trap_manager.on_unit_in_range(world_object)
 
     # Remove a world_object from its cell and notify surrounding players if required.
     def remove_object(self, world_object, update_players=True):
         cell = self.cells.get(world_object.current_cell)
+        if world_object.get_type_id() == ObjectTypeIds.ID_UNIT:
+            self.aggro_index.remove_creature(world_object)
+        elif world_object.get_type_id() == ObjectTypeIds.ID_GAMEOBJECT and world_object.trap_manager:
+            self.proximity_trigger_index.remove_trigger(world_object)
         if cell and cell.remove(world_object) and update_players:
             self._update_players_surroundings(cell.key)
 
@@ -101,6 +120,11 @@ class GridManager:
         cell: Cell = self._get_create_cell(world_object.location, world_object.map_id, world_object.instance_id)
         cell.add_world_object(world_object)
 
+        if world_object.get_type_id() == ObjectTypeIds.ID_UNIT:
+            self.aggro_index.update_creature(world_object)
+        elif world_object.get_type_id() == ObjectTypeIds.ID_GAMEOBJECT and world_object.trap_manager:
+            self._add_proximity_trigger(world_object.trap_manager)
+
         # TODO: Need to change the way we handle this.
         #  There must be active/inactive world objects, not cells.
         #  Do leave maps/navs loading only for players.
@@ -117,6 +141,16 @@ class GridManager:
 
             self._update_players_surroundings(cell.key)
 
+    def _add_proximity_trigger(self, trap_manager):
+        self.proximity_trigger_index.add_trigger(trap_manager)
+        # Units already standing in the trap area won't move into it.
+        trap_object = trap_manager.trap_object
+        creatures, players = self.get_surrounding_units_by_location(trap_object.location, self.map_id,
+                                                                    self.instance_id, trap_manager.radius,
+                                                                    include_players=True)
+        for unit in list(creatures.values()) + list(players.values()):
+            trap_manager.on_unit_in_range(unit)
+
     def _activate_cell_by_world_object(self, world_object):
         affected_cells = list(self._get_surrounding_cells_by_object(world_object))
         # Try to load tile maps for affected cells if needed.
@@ -247,7 +281,14 @@ class GridManager:
         else:
             return res[0]
 
-    def get_creature_spawn_by_id(self, spawn_id):
+    def get_creature_spawn_by_id(self, spawn_id, location=None):
+        # Spawns are stored in the cell holding their spawn location, check that one first when known.
+        if location:
+            cell = self.cells.get(CellUtils.get_cell_key(location.x, location.y, self.map_id, self.instance_id))
+            spawn_found = cell.creatures_spawns.get(spawn_id) if cell else None
+            if spawn_found:
+                return spawn_found
+
         for cell in set(self.cells.values()):
             spawn_found = cell.creatures_spawns.get(spawn_id)
             if spawn_found:
@@ -285,6 +326,27 @@ class GridManager:
                     units[1][guid] = player
         return units
 
+    # Creatures in range whose faction template passes faction_filter, only visiting the matching faction buckets.
+    def get_surrounding_creatures_by_faction(self, vector, target_map, target_instance, range_, faction_filter):
+        creatures = {}
+        for cell in self._get_surrounding_cells_by_location(vector.x, vector.y, target_map, target_instance):
+            for faction, bucket in list(cell.creatures_by_faction.items()):
+                if not faction_filter(faction):
+                    continue
+                for guid, creature in list(bucket.items()):
+                    if creature.location.distance(vector) <= range_:
+                        creatures[guid] = creature
+        return creatures
+
+    def get_aggro_observers(self, vector):
+        return self.aggro_index.get_observers(vector)
+
+    def enqueue_los_check(self, observer, target):
+        self.aggro_index.enqueue_los_check(observer, target)
+
+    def process_pending_los(self, map_):
+        self.aggro_index.process_pending_los(map_)
+
     def get_surrounding_players_by_location(self, vector, target_map, target_instance, range_):
         players = {}
         for cell in self._get_surrounding_cells_by_location(vector.x, vector.y, target_map, target_instance):
@@ -134,6 +134,9 @@ class Map:
     def calculate_path(self, start_vector, end_vector, los=False) -> tuple:  # bool failed, in_place, path list.
         return self.map_manager.calculate_path(self.map_id, start_vector, end_vector, los=los)
 
+    def find_random_point_around_circle(self, origin, radius) -> tuple:  # bool found, Vector.
+        return self.map_manager.find_random_point_around_circle(self.map_id, origin, radius)
+
     def calculate_z_for_object(self, world_object):
         return self.map_manager.calculate_z_for_object(world_object)
 
@@ -143,6 +146,9 @@ class Map:
     def los_check(self, start_vector, end_vector):
         return self.map_manager.los_check(self.map_id, start_vector, end_vector)
 
+    def los_check_batch(self, pairs):  # [(start_vector, end_vector)]
+        return self.map_manager.los_check_batch(self.map_id, pairs)
+
     def get_tile(self, x, y):
         return self.map_manager.get_tile(x, y)
 
@@ -175,8 +181,8 @@ class Map:
     def get_surrounding_units(self, world_object, include_players=False):
         return self.grid_manager.get_surrounding_units(world_object, include_players)
 
-    def get_creature_spawn_by_id(self, spawn_id):
-        return self.grid_manager.get_creature_spawn_by_id(spawn_id)
+    def get_creature_spawn_by_id(self, spawn_id, location=None):
+        return self.grid_manager.get_creature_spawn_by_id(spawn_id, location)
 
     def get_gameobject_spawn_by_id(self, spawn_id):
         return self.grid_manager.get_gameobject_spawn_by_id(spawn_id)
@@ -187,6 +193,16 @@ class Map:
     def get_surrounding_players_by_location(self, vector, target_map, target_instance, range_):
         return self.grid_manager.get_surrounding_players_by_location(vector, target_map, target_instance, range_)
 
+    def get_surrounding_creatures_by_faction(self, vector, target_map, target_instance, range_, faction_filter):
+        return self.grid_manager.get_surrounding_creatures_by_faction(vector, target_map, target_instance, range_,
+                                                                      faction_filter)
+
+    def get_aggro_observers(self, vector):
+        return self.grid_manager.get_aggro_observers(vector)
+
+    def enqueue_los_check(self, observer, target):
+        self.grid_manager.enqueue_los_check(observer, target)
+
     def get_surrounding_gameobjects(self, world_object):
         return self.grid_manager.get_surrounding_gameobjects(world_object)
 
@@ -214,6 +230,8 @@ class Map:
     # Objects updates.
     def update_creatures(self):
         self.grid_manager.update_creatures()
+        # Resolve line of sight checks deferred by moving units.
+        self.grid_manager.process_pending_los(self)
 
     def update_gameobjects(self):
         self.grid_manager.update_gameobjects()
@@ -35,6 +35,12 @@ LIQUIDS_CACHE = {}
 PENDING_TILE_INITIALIZATION = {}
 PENDING_TILE_INITIALIZATION_QUEUE = _queue.SimpleQueue()
 QUEUE_LOCK = RLock()
+# Navmesh random points per map, quantized origin and radius. Up to RANDOM_POINTS_POOL_SIZE points are queried
+# for each key, afterwards requests are served from the pool.
+RANDOM_POINTS_CACHE: dict[tuple, list] = {}
+RANDOM_POINTS_CACHE_MAX_SIZE = 4096
+RANDOM_POINTS_POOL_SIZE = 8
+RANDOM_POINTS_QUANTIZATION = 4.0
 
 
 # noinspection PyBroadException
@@ -291,6 +297,40 @@ class MapManager:
 
         return namigator.line_of_sight(src_loc.x, src_loc.y, src_loc.z, dst_loc.x, dst_loc.y, dst_loc.z, doodads)
 
+    # Same as los_check for a list of (source, destination) pairs, returns a list of booleans in the same order.
+    # Settings and namigator are resolved once per batch and each tile readiness is only checked once.
+    @staticmethod
+    def los_check_batch(map_id, pairs, doodads=False) -> list[bool]:
+        # No nav tiles or unable to load Namigator, can't check LoS.
+        if not config.Server.Settings.use_nav_tiles or not MapManager.NAMIGATOR_LOADED:
+            return [True] * len(pairs)
+
+        # Grab namigator instance if available.
+        namigator = MAPS_NAMIGATOR.get(map_id, None)
+        if not namigator:
+            return [True] * len(pairs)
+
+        tiles_ready = {}
+        results = []
+        for src_loc, dst_loc in pairs:
+            # Return True for this pair if either tile is not loaded or unable to load.
+            if not MapManager._is_tile_ready(map_id, src_loc, tiles_ready) or \
+                    not MapManager._is_tile_ready(map_id, dst_loc, tiles_ready):
+                results.append(True)
+                continue
+            results.append(namigator.line_of_sight(src_loc.x, src_loc.y, src_loc.z, dst_loc.x, dst_loc.y, dst_loc.z,
+                                                   doodads))
+        return results
+
+    @staticmethod
+    def _is_tile_ready(map_id, location, tiles_ready):
+        adt_x, adt_y = MapManager.get_tile(location.x, location.y)
+        ready = tiles_ready.get((adt_x, adt_y))
+        if ready is None:
+            ready = MapManager._check_tile_load(map_id, location.x, location.y, adt_x, adt_y) == MapTileStates.READY
+            tiles_ready[(adt_x, adt_y)] = ready
+        return ready
+
     @staticmethod
     def can_reach_object(src_object, dst_object):
         if src_object.map_id != dst_object.map_id:
@@ -355,6 +395,50 @@ class MapManager:
 
         return False, False if len(vectors) > 0 else True, vectors
 
+    @staticmethod
+    def find_random_point_around_circle(map_id, origin, radius) -> tuple:  # bool found, Vector.
+        # Without navs there is nothing to validate against, any point within radius will do.
+        if not config.Server.Settings.use_nav_tiles or not MapManager.NAMIGATOR_LOADED \
+                or map_id not in MAPS_NAMIGATOR:
+            return True, origin.get_random_point_in_radius(radius, map_id)
+
+        key = (map_id, int(origin.x // RANDOM_POINTS_QUANTIZATION), int(origin.y // RANDOM_POINTS_QUANTIZATION),
+               int(origin.z // RANDOM_POINTS_QUANTIZATION), radius)
+        points = RANDOM_POINTS_CACHE.get(key)
+        if points and len(points) >= RANDOM_POINTS_POOL_SIZE:
+            return True, choice(points).copy()
+
+        found, point = MapManager._query_random_point_around_circle(map_id, origin, radius)
+        if not found:
+            return (True, choice(points).copy()) if points else (False, origin)
+
+        if points is None:
+            if len(RANDOM_POINTS_CACHE) >= RANDOM_POINTS_CACHE_MAX_SIZE:
+                RANDOM_POINTS_CACHE.clear()
+            points = RANDOM_POINTS_CACHE.setdefault(key, [])
+        points.append(point)
+        return True, point.copy()
+
+    @staticmethod
+    def _query_random_point_around_circle(map_id, origin, radius) -> tuple:  # bool found, Vector.
+        namigator = MAPS_NAMIGATOR[map_id]
+        adt_x, adt_y = MapManager.get_tile(origin.x, origin.y)
+        if MapManager._check_tile_load(map_id, origin.x, origin.y, adt_x, adt_y) != MapTileStates.READY:
+            return False, origin
+
+        # Bindings without Detour random sampling, validate a single random point with a path query instead.
+        if not hasattr(namigator, 'find_random_point_around_circle'):
+            point = origin.get_random_point_in_radius(radius, map_id)
+            failed, in_place, path = MapManager.calculate_path(map_id, origin, point, los=True)
+            return (False, origin) if failed or in_place else (True, path[-1])
+
+        result = namigator.find_random_point_around_circle(origin.x, origin.y, origin.z, radius)
+        if not result:
+            return False, origin
+
+        from game.world.managers.abstractions.Vector import Vector
+        return True, Vector(result[0], result[1], result[2])
+
     @staticmethod
     def validate_teleport_destination(map_id, x, y):
         # Can't validate if not using tile files, so return as True.
@@ -0,0 +1,65 @@
+import math
+from threading import RLock
+
+# Side length of the buckets used to index trigger areas.
+BUCKET_SIZE = 16.0
+
+
+class ProximityTriggerIndex:
+    """Per map index of gameobject trap areas, used to find which traps a moving unit is standing in."""
+
+    def __init__(self):
+        self.index_lock = RLock()
+        # (bucket_x, bucket_y): {guid: trap_manager}
+        self.buckets: dict[tuple, dict] = {}
+        # guid: bucket keys
+        self.entries: dict[int, set] = {}
+
+    def has_triggers(self):
+        return len(self.entries) > 0
+
+    def add_trigger(self, trap_manager):
+        trap_object = trap_manager.trap_object
+        bucket_keys = ProximityTriggerIndex._get_bucket_keys(trap_object.location.x, trap_object.location.y,
+                                                             trap_manager.radius)
+        with self.index_lock:
+            self.remove_trigger(trap_object)
+            for key in bucket_keys:
+                bucket = self.buckets.get(key)
+                if bucket is None:
+                    bucket = self.buckets[key] = {}
+                bucket[trap_object.guid] = trap_manager
+            self.entries[trap_object.guid] = bucket_keys
+
+    def remove_trigger(self, trap_object):
+        with self.index_lock:
+            bucket_keys = self.entries.pop(trap_object.guid, None)
+            if not bucket_keys:
+                return
+            for key in bucket_keys:
+                bucket = self.buckets.get(key)
+                if bucket is None:
+                    continue
+                bucket.pop(trap_object.guid, None)
+                if not bucket:
+                    del self.buckets[key]
+
+    # Returns trap managers whose trigger radius contains the given location.
+    def get_triggers(self, vector):
+        key = (math.floor(vector.x / BUCKET_SIZE), math.floor(vector.y / BUCKET_SIZE))
+        with self.index_lock:
+            bucket = self.buckets.get(key)
+            if not bucket:
+                return []
+            candidates = list(bucket.values())
+
+        return [trap_manager for trap_manager in candidates
+                if trap_manager.trap_object.location.distance(vector) <= trap_manager.radius]
+
+    @staticmethod
+    def _get_bucket_keys(x, y, radius):
+        min_x = math.floor((x - radius) / BUCKET_SIZE)
+        max_x = math.floor((x + radius) / BUCKET_SIZE)
+        min_y = math.floor((y - radius) / BUCKET_SIZE)
+        max_y = math.floor((y + radius) / BUCKET_SIZE)
+        return {(bucket_x, bucket_y) for bucket_x in range(min_x, max_x + 1) for bucket_y in range(min_y, max_y + 1)}
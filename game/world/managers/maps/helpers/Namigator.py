@@ -13,5 +13,8 @@ class Namigator:
     def find_path(self, start_x, start_y, start_z, end_x, end_y, end_z):
         pass
 
+    def find_random_point_around_circle(self, x, y, z, radius):
+        pass
+
     def load_adt(self, adt_x, adt_y):
         pass
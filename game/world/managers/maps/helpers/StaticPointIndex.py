@@ -0,0 +1,87 @@
+import math
+
+# Side length of the grid buckets points are stored in.
+BUCKET_SIZE = 256.0
+
+
+class StaticPointIndex:
+    """Read only per map uniform grid of static points (e.g. taxi nodes), filled once while loading world data."""
+
+    def __init__(self, bucket_size=BUCKET_SIZE):
+        self.bucket_size = bucket_size
+        # map_id: {(bucket_x, bucket_y): [(x, y, z, value)]}
+        self.buckets: dict[int, dict[tuple, list]] = {}
+        # map_id: [min bucket x, min bucket y, max bucket x, max bucket y]
+        self.bounds: dict[int, list] = {}
+
+    def add_point(self, map_id, x, y, z, value):
+        bucket_x, bucket_y = self._get_bucket_key(x, y)
+        self.buckets.setdefault(map_id, {}).setdefault((bucket_x, bucket_y), []).append((x, y, z, value))
+
+        bounds = self.bounds.get(map_id)
+        if not bounds:
+            self.bounds[map_id] = [bucket_x, bucket_y, bucket_x, bucket_y]
+            return
+        bounds[0] = min(bounds[0], bucket_x)
+        bounds[1] = min(bounds[1], bucket_y)
+        bounds[2] = max(bounds[2], bucket_x)
+        bounds[3] = max(bounds[3], bucket_y)
+
+    # Value of the closest point to the given location, None if the map has no points.
+    def get_nearest(self, map_id, vector):
+        map_buckets = self.buckets.get(map_id)
+        if not map_buckets:
+            return None
+
+        min_x, min_y, max_x, max_y = self.bounds[map_id]
+        center_x, center_y = self._get_bucket_key(vector.x, vector.y)
+        # Rings beyond this one can't hold any bucket of this map.
+        max_ring = max(center_x - min_x, max_x - center_x, center_y - min_y, max_y - center_y)
+
+        nearest_distance_sqrd = -1
+        nearest_value = None
+        for ring in range(max_ring + 1):
+            for key in StaticPointIndex._get_ring_keys(center_x, center_y, ring):
+                for x, y, z, value in map_buckets.get(key, ()):
+                    distance_sqrd = (x - vector.x) ** 2 + (y - vector.y) ** 2 + (z - vector.z) ** 2
+                    if distance_sqrd < nearest_distance_sqrd or nearest_distance_sqrd == -1:
+                        nearest_distance_sqrd = distance_sqrd
+                        nearest_value = value
+            # Any point in the next rings is at least this far away.
+            if nearest_distance_sqrd != -1 and nearest_distance_sqrd <= (ring * self.bucket_size) ** 2:
+                break
+
+        return nearest_value
+
+    # Values of all points within radius of the given location.
+    def get_within_radius(self, map_id, vector, radius):
+        map_buckets = self.buckets.get(map_id)
+        if not map_buckets:
+            return []
+
+        min_x, min_y = self._get_bucket_key(vector.x - radius, vector.y - radius)
+        max_x, max_y = self._get_bucket_key(vector.x + radius, vector.y + radius)
+        radius_sqrd = radius ** 2
+        values = []
+        for bucket_x in range(min_x, max_x + 1):
+            for bucket_y in range(min_y, max_y + 1):
+                for x, y, z, value in map_buckets.get((bucket_x, bucket_y), ()):
+                    if (x - vector.x) ** 2 + (y - vector.y) ** 2 + (z - vector.z) ** 2 <= radius_sqrd:
+                        values.append(value)
+        return values
+
+    def _get_bucket_key(self, x, y):
+        return math.floor(x / self.bucket_size), math.floor(y / self.bucket_size)
+
+    @staticmethod
+    def _get_ring_keys(center_x, center_y, ring):
+        if ring == 0:
+            return [(center_x, center_y)]
+        keys = []
+        for offset in range(-ring, ring + 1):
+            keys.append((center_x + offset, center_y - ring))
+            keys.append((center_x + offset, center_y + ring))
+        for offset in range(-ring + 1, ring):
+            keys.append((center_x - ring, center_y + offset))
+            keys.append((center_x + ring, center_y + offset))
+        return keys
@@ -486,19 +486,34 @@ class ObjectManager:
         return self if include_self else None
 
     def _allegiance_status_checker(self, target) -> UnitReaction:
-        own_faction = DbcDatabaseManager.FactionTemplateHolder.faction_template_get_by_id(self.faction)
-        target_faction = DbcDatabaseManager.FactionTemplateHolder.faction_template_get_by_id(target.faction)
+        # TODO: Reputation standing checks first.
+
+        return ObjectManager.get_faction_reaction(self.faction, target.faction)
+
+    @staticmethod
+    def get_faction_reaction(own_faction_id, target_faction_id) -> UnitReaction:
+        # Reactions between faction templates never change, resolve each pair only once.
+        reaction = DbcDatabaseManager.FactionTemplateHolder.faction_template_get_reaction(own_faction_id,
+                                                                                          target_faction_id)
+        if reaction is None:
+            reaction = ObjectManager._get_faction_templates_reaction(own_faction_id, target_faction_id)
+            DbcDatabaseManager.FactionTemplateHolder.faction_template_set_reaction(own_faction_id, target_faction_id,
+                                                                                   reaction)
+        return reaction
+
+    @staticmethod
+    def _get_faction_templates_reaction(own_faction_id, target_faction_id) -> UnitReaction:
+        own_faction = DbcDatabaseManager.FactionTemplateHolder.faction_template_get_by_id(own_faction_id)
+        target_faction = DbcDatabaseManager.FactionTemplateHolder.faction_template_get_by_id(target_faction_id)
 
         if not own_faction:
-            Logger.warning(f'Invalid faction template: {self.faction}.')
+            Logger.warning(f'Invalid faction template: {own_faction_id}.')
             return UnitReaction.UNIT_REACTION_NEUTRAL
 
         if not target_faction:
-            Logger.warning(f'Invalid faction template: {target.faction}.')
+            Logger.warning(f'Invalid faction template: {target_faction_id}.')
             return UnitReaction.UNIT_REACTION_NEUTRAL
 
-        # TODO: Reputation standing checks first.
-
         if target_faction.FactionGroup & own_faction.EnemyGroup != 0:
             return UnitReaction.UNIT_REACTION_HOSTILE
 
@@ -16,7 +16,7 @@ class TotemAI(CreatureAI):
         if not owner:
             return
 
-        self.creature.threat_manager.holders = owner.threat_manager.holders.copy()
+        self.creature.threat_manager.copy_holders_from(owner.threat_manager)
 
         if self.has_spell_list():
             self.update_spell_list(elapsed)
@@ -1,3 +1,4 @@
+from utils.constants.MiscCodes import ObjectTypeIds
 from utils.constants.SpellCodes import SpellTargetMask
 
 
@@ -20,6 +21,8 @@ class TrapManager:
         # If no diameter is defined, use 2.5 yd as radius by default as it seems to be the most common value among traps
         # that have one defined.
         self.radius = 2.5 if not self.radius else self.radius  # If radius was 0, initialize to 2.5.
+        # Units that moved into the trap radius, reported by the map proximity trigger index. {guid: unit}
+        self.units_in_range = {}
 
     def is_ready(self):
         return self.remaining_cooldown == 0
@@ -29,18 +32,16 @@ class TrapManager:
             self.remaining_cooldown = max(0, self.remaining_cooldown - elapsed)
             return
 
-        # If the trap should be triggered by creatures, search for them along with players.
-        if self.spell_id in TrapManager.TRIGGERED_BY_CREATURES:
-            surrounding_creatures, surrounding_players = self.trap_object.get_map().get_surrounding_units_by_location(
-                self.trap_object.location, self.trap_object.map_id, self.trap_object.instance_id,
-                self.radius, include_players=True)
-            surrounding_units = surrounding_creatures | surrounding_players
-        else:
-            # This trap can only be triggered by players.
-            surrounding_units = self.trap_object.get_map().get_surrounding_players_by_location(
-                self.trap_object.location, self.trap_object.map_id, self.trap_object.instance_id, self.radius)
-
-        for unit in surrounding_units.values():
+        # Nobody around, nothing to do.
+        if not self.units_in_range:
+            return
+
+        for guid, unit in list(self.units_in_range.items()):
+            # Unit left the trap area since it was reported.
+            if not self._is_unit_in_range(unit):
+                del self.units_in_range[guid]
+                continue
+
             # Keep looping until we find a valid unit.
             if not self.trap_object.can_attack_target(unit):
                 continue
@@ -51,6 +52,19 @@ class TrapManager:
                 self.trap_object.despawn()
             break
 
+    def on_unit_in_range(self, unit):
+        # Only a few traps can be triggered by creatures, the rest only by players.
+        if unit.get_type_id() != ObjectTypeIds.ID_PLAYER and self.spell_id not in TrapManager.TRIGGERED_BY_CREATURES:
+            return
+        self.units_in_range[unit.guid] = unit
+
+    def _is_unit_in_range(self, unit):
+        if not unit.is_spawned or unit.get_type_id() == ObjectTypeIds.ID_PLAYER and not unit.online:
+            return False
+        if unit.map_id != self.trap_object.map_id or unit.instance_id != self.trap_object.instance_id:
+            return False
+        return unit.location.distance(self.trap_object.location) <= self.radius
+
     def trigger(self, who):
         self.trap_object.spell_manager.handle_cast_attempt(self.spell_id, who, SpellTargetMask.UNIT, validate=True)
         self.remaining_cooldown = self.cooldown
@@ -1,3 +1,4 @@
+from game.world.managers.objects.item.ContainerSlots import ContainerSlots
 from game.world.managers.objects.item.ItemManager import ItemManager
 from utils.constants.ItemCodes import InventorySlots, ItemClasses, ItemSubClasses, BagFamilies
 from utils.constants.MiscCodes import ObjectTypeFlags, ObjectTypeIds, HighGuid, ItemBondingTypes
@@ -16,7 +17,7 @@ class ContainerManager(ItemManager):
         if self.is_backpack:
             self.current_slot = InventorySlots.SLOT_INBACKPACK.value
 
-        self.sorted_slots = dict()
+        self.sorted_slots = ContainerSlots()
 
         if not self.is_backpack:
             self.total_slots = self.item_template.container_slots
@@ -99,22 +100,16 @@ class ContainerManager(ItemManager):
             amount_left = self.add_item_to_existing_stacks(item_template, amount_left)
 
         item_mgr = None
-        if amount_left > 0:
-            for x in range(self.start_slot, self.max_slot):
-                if amount_left == 0:
-                    break
-                if x in self.sorted_slots:
-                    continue  # Skip any reserved slots
-                if not self.is_full():
-                    if amount_left > item_template.stackable:
-                        item_mgr = self.set_item(item_template, self.next_available_slot(),
-                                                 count=item_template.stackable, perm_enchant=perm_enchant,
-                                                 created_by=created_by)
-                        amount_left -= item_template.stackable
-                    else:
-                        item_mgr = self.set_item(item_template, self.next_available_slot(),
-                                                 count=amount_left, perm_enchant=perm_enchant, created_by=created_by)
-                        amount_left = 0
+        while amount_left > 0 and not self.is_full():
+            if amount_left > item_template.stackable:
+                item_mgr = self.set_item(item_template, self.next_available_slot(),
+                                         count=item_template.stackable, perm_enchant=perm_enchant,
+                                         created_by=created_by)
+                amount_left -= item_template.stackable
+            else:
+                item_mgr = self.set_item(item_template, self.next_available_slot(),
+                                         count=amount_left, perm_enchant=perm_enchant, created_by=created_by)
+                amount_left = 0
         return amount_left, item_mgr
 
     def add_item_to_existing_stacks(self, item_template, count):
@@ -122,13 +117,13 @@ class ContainerManager(ItemManager):
         if not self.can_contain_item(item_template):
             return amount_left
 
-        # Check occupied slots for stacking
-        for x in range(self.start_slot, self.start_slot + self.total_slots):
-            if x not in self.sorted_slots:
-                continue  # Skip any empty slots
-            item_mgr = self.sorted_slots[x]
-            if item_mgr.item_template.entry == item_template.entry and \
-                    item_mgr.item_instance.stackcount < item_mgr.item_template.stackable:
+        # Check occupied slots for stacking, lowest slots first.
+        same_entry_items = self.sorted_slots.get_items_by_entry(item_template.entry)
+        for x in sorted(same_entry_items):
+            if not self.start_slot <= x < self.start_slot + self.total_slots:
+                continue
+            item_mgr = same_entry_items[x]
+            if item_mgr.item_instance.stackcount < item_mgr.item_template.stackable:
                 stack_missing = item_template.stackable - item_mgr.item_instance.stackcount
                 if stack_missing >= amount_left:
                     new_stack_count = item_mgr.item_instance.stackcount + amount_left
@@ -144,11 +139,8 @@ class ContainerManager(ItemManager):
     def contains_item(self, item_template):
         if not self.can_contain_item(item_template):
             return False
-        for x in range(self.start_slot, self.start_slot + self.total_slots):
-            item_mgr = self.sorted_slots[x]
-            if item_mgr.item_template.entry == item_template.entry:
-                return True
-        return False
+        return any(self.start_slot <= x < self.start_slot + self.total_slots
+                   for x in self.sorted_slots.get_items_by_entry(item_template.entry))
 
     def get_item(self, slot):
         if slot in self.sorted_slots:
@@ -168,17 +160,12 @@ class ContainerManager(ItemManager):
         return False
 
     def next_available_slot(self):
-        for slot in range(self.start_slot, self.start_slot + self.total_slots):
-            if slot not in self.sorted_slots:
-                return slot
-        return -1
+        return self.sorted_slots.get_first_free_slot(self.start_slot, self.start_slot + self.total_slots)
 
     def get_empty_slots(self):
         if self.is_backpack:
-            item_count = 0
-            for bag_slot in range(InventorySlots.SLOT_ITEM_START, InventorySlots.SLOT_ITEM_END):
-                if bag_slot in self.sorted_slots:
-                    item_count += 1
+            item_count = self.sorted_slots.get_occupied_count(InventorySlots.SLOT_ITEM_START,
+                                                              InventorySlots.SLOT_ITEM_END)
             return self.total_slots - item_count
         else:
             return self.total_slots - len(self.sorted_slots)
@@ -188,10 +175,8 @@ class ContainerManager(ItemManager):
 
     def is_empty(self):
         if self.is_backpack:
-            for bag_slot in range(InventorySlots.SLOT_ITEM_START, InventorySlots.SLOT_ITEM_END):
-                if bag_slot in self.sorted_slots:
-                    return False
-            return True
+            return self.sorted_slots.get_occupied_count(InventorySlots.SLOT_ITEM_START,
+                                                        InventorySlots.SLOT_ITEM_END) == 0
         else:
             return len(self.sorted_slots) == 0
 
@@ -0,0 +1,92 @@
+_EMPTY_SLOTS = {}
+
+
+# Slot: item dict used as ContainerManager.sorted_slots.
+# Items are also indexed by entry and guid, and occupied slots are tracked as a bitmask, so lookups and free slot
+# searches don't need to walk every slot. All mutations go through the dict methods below, including the ones done
+# directly on sorted_slots by InventoryManager.
+class ContainerSlots(dict):
+    def __init__(self):
+        super().__init__()
+        self.items_by_entry: dict[int, dict] = {}  # Entry: {slot: item}
+        self.slots_by_guid: dict[int, int] = {}  # Guid: slot
+        self.occupied_mask = 0
+
+    def __setitem__(self, slot, item):
+        previous_item = self.get(slot)
+        if previous_item is not None:
+            self._unindex(slot, previous_item)
+        super().__setitem__(slot, item)
+        self._index(slot, item)
+
+    def __delitem__(self, slot):
+        item = self[slot]
+        super().__delitem__(slot)
+        self._unindex(slot, item)
+
+    def pop(self, slot, *default):
+        if slot not in self:
+            return super().pop(slot, *default)
+        item = super().pop(slot)
+        self._unindex(slot, item)
+        return item
+
+    def clear(self):
+        super().clear()
+        self.items_by_entry.clear()
+        self.slots_by_guid.clear()
+        self.occupied_mask = 0
+
+    def get_items_by_entry(self, entry) -> dict:
+        return self.items_by_entry.get(entry, _EMPTY_SLOTS)
+
+    def get_slot_by_guid(self, guid):
+        return self.slots_by_guid.get(guid, -1)
+
+    def get_item_by_guid(self, guid):
+        slot = self.slots_by_guid.get(guid)
+        return self.get(slot) if slot is not None else None
+
+    # Lowest free slot in [start_slot, end_slot), -1 if there is none.
+    def get_first_free_slot(self, start_slot, end_slot):
+        free_mask = ~self.occupied_mask & ContainerSlots._get_range_mask(start_slot, end_slot)
+        if not free_mask:
+            return -1
+        return (free_mask & -free_mask).bit_length() - 1
+
+    def get_occupied_count(self, start_slot, end_slot):
+        return bin(self.occupied_mask & ContainerSlots._get_range_mask(start_slot, end_slot)).count('1')
+
+    def get_free_count(self, start_slot, end_slot):
+        return max(0, end_slot - start_slot) - self.get_occupied_count(start_slot, end_slot)
+
+    # Room left in partial stacks of the given item template in [start_slot, end_slot).
+    def get_stack_space(self, item_template, start_slot, end_slot):
+        space = 0
+        for slot, item in self.get_items_by_entry(item_template.entry).items():
+            if start_slot <= slot < end_slot:
+                space += item_template.stackable - item.item_instance.stackcount
+        return space
+
+    def _index(self, slot, item):
+        self.items_by_entry.setdefault(item.item_template.entry, {})[slot] = item
+        self.slots_by_guid[item.guid] = slot
+        self.occupied_mask |= 1 << slot
+
+    def _unindex(self, slot, item):
+        entry = item.item_template.entry
+        entry_slots = self.items_by_entry.get(entry)
+        if entry_slots is not None:
+            entry_slots.pop(slot, None)
+            if not entry_slots:
+                del self.items_by_entry[entry]
+        # During swaps an item can be set in its new slot before its old slot is overwritten.
+        if self.slots_by_guid.get(item.guid) == slot:
+            del self.slots_by_guid[item.guid]
+        self.occupied_mask &= ~(1 << slot)
+
+    @staticmethod
+    def _get_range_mask(start_slot, end_slot):
+        if end_slot <= start_slot:
+            return 0
+        return (1 << end_slot) - (1 << start_slot)
@@ -80,6 +80,8 @@ class ItemManager(ObjectManager):
         self.display_id = 0
         self.loot_manager = None  # Optional.
         self.equip_slot = 0
+        # Encoded create packets by requester being the owner or not: (fields version, packet).
+        self.create_packet_cache = {}
 
         if self.item_template:
             self.load_item_template(self.item_template)
@@ -355,6 +357,23 @@ class ItemManager(ObjectManager):
 
             self.initialized = True
 
+    # override
+    def generate_create_packet(self, requester):
+        # Item create packets only change along with the item fields, and private fields are only sent to the owner.
+        # Bags full of unchanged items are sent again on every login and visibility change, reuse the last packet.
+        if not self.initialized:
+            self.initialize_field_values()
+
+        is_owner = requester.guid == self.update_packet_factory.owner_guid
+        fields_version = self.update_packet_factory.fields_version
+        cached_version, cached_packet = self.create_packet_cache.get(is_owner, (-1, None))
+        if cached_version == fields_version:
+            return cached_packet
+
+        packet = super().generate_create_packet(requester)
+        self.create_packet_cache[is_owner] = (fields_version, packet)
+        return packet
+
     def get_owner_guid(self):
         return self.item_instance.owner if self.item_instance else 0
 
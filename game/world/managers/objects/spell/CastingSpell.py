@@ -613,6 +613,10 @@ class CastingSpell:
             for effect in self.get_effects():
                 effect.applied_aura_duration -= pushback_length
                 effect.remove_old_periodic_effect_ticks()
+                # Expiry and ticks of the resulting auras moved closer, reschedule them.
+                for target in effect.targets.get_resolved_effect_targets_by_type(ObjectManager):
+                    if target.get_type_mask() & ObjectTypeFlags.TYPE_UNIT:
+                        target.aura_manager.schedule_auras_from_spell(self)
 
             pushback_length = min(remaining_cast_before_pushback, pushback_length)
             self.cast_end_timestamp -= pushback_length / 1000
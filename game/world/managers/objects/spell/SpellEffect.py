@@ -71,6 +71,12 @@ class SpellEffect:
         self.applied_aura_duration -= (timestamp - self.last_update_timestamp) * 1000
         self.last_update_timestamp = timestamp
 
+    def get_remaining_aura_duration(self, timestamp):
+        if self.applied_aura_duration == -1:
+            return -1
+
+        return self.applied_aura_duration - (timestamp - self.last_update_timestamp) * 1000
+
     def remove_old_periodic_effect_ticks(self):
         # Periodic effects with an infinite duration only have one tick internally.
         if self.casting_spell.get_duration() == -1:
@@ -47,6 +47,8 @@ class AppliedAura:
                 break
 
         self.index = -1  # Set on application
+        # Deadline this aura is scheduled for in its target's AuraManager, None if it doesn't need updates.
+        self.next_update_timestamp = None
 
     def is_passive(self) -> bool:
         return self.passive
@@ -58,15 +60,16 @@ class AppliedAura:
         return self.spell_effect.is_periodic()
 
     def has_duration(self) -> bool:
-        return self.get_duration() != -1
+        return self.source_spell.get_duration() != -1 and self.spell_effect.applied_aura_duration != -1
 
-    def get_duration(self):
+    def get_duration(self, timestamp=None):
         if self.source_spell.get_duration() == -1:
             # Infinite duration aura.
             # Don't compare to applied_aura_duration as it's still set for periodic effects.
             return -1
 
-        return self.spell_effect.applied_aura_duration
+        # applied_aura_duration is only synced on updates, which AuraManager skips until the aura's next deadline.
+        return self.spell_effect.get_remaining_aura_duration(time.time() if timestamp is None else timestamp)
 
     def get_dispel_mask(self):
         dispel_type = self.source_spell.spell_entry.custom_DispelType
@@ -94,11 +97,36 @@ class AppliedAura:
 
         self.spell_effect.remove_old_periodic_effect_ticks()
 
+    def get_next_update_timestamp(self):
+        # Earliest timestamp at which update() or the heartbeat resist check can do anything, None if never.
+        if self.spell_effect.area_aura_holder:
+            return None  # Area auras are managed by AreaAuraHolder.
+
+        spell_effect = self.spell_effect
+        timestamps = []
+        if self.has_duration():
+            timestamps.append(spell_effect.last_update_timestamp + spell_effect.applied_aura_duration / 1000)
+
+        if self.is_periodic() and spell_effect.periodic_effect_ticks and spell_effect.applied_aura_duration != -1:
+            next_tick = spell_effect.applied_aura_duration - spell_effect.periodic_effect_ticks[-1]
+            timestamps.append(spell_effect.last_update_timestamp + next_tick / 1000)
+
+        if not self.passive and self.target is self.caster and self.source_spell.spell_entry.ManaPerSecond:
+            timestamps.append(spell_effect.last_cost_timestamp + 1)
+
+        if self.can_heartbeat_resist():
+            timestamps.append(self.previous_heartbeat + 5)
+
+        return min(timestamps, default=None)
+
+    def can_heartbeat_resist(self):
+        return self.has_duration() and self.harmful and not self.passive and \
+            self.source_spell.spell_entry.Attributes & SpellAttributes.SPELL_ATTR_HEARTBEAT_RESIST
+
     def get_heartbeat_resist_result(self, timestamp):
         # PvE heartbeat resist, same as VMaNGOS.
 
-        if not self.has_duration() or not self.harmful or self.passive or not \
-            self.source_spell.spell_entry.Attributes & SpellAttributes.SPELL_ATTR_HEARTBEAT_RESIST:
+        if not self.can_heartbeat_resist():
             return False
 
         if timestamp - self.previous_heartbeat <= 5:
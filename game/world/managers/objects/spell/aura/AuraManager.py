@@ -1,3 +1,5 @@
+import heapq
+from itertools import count
 from struct import pack
 from typing import Optional
 
@@ -14,12 +16,27 @@ from utils.constants.SpellCodes import AuraTypes, AuraSlots, SpellAuraInterruptF
 from utils.constants.UnitCodes import UnitFlags, StandState
 from utils.constants.UpdateFields import UnitFields
 
+# Proc flags in dispatch order.
+PROC_FLAGS = [proc_flag for proc_flag in ProcFlags if proc_flag != ProcFlags.NONE]
+# Melee outcomes which can proc on the victim, copied from DamageInfo.proc_victim.
+AVOIDANCE_PROC_MASK = ProcFlags.DODGE | ProcFlags.PARRY | ProcFlags.BLOCK
+
 
 class AuraManager:
     def __init__(self, unit_mgr):
         self.unit_mgr = unit_mgr
         self.active_auras = {}  # (int: Aura) to have persistent indices.
         self.current_flags = 0x0
+        # ProcFlags bit: {aura index: aura}, only holds auras with proc flags.
+        self.auras_by_proc_flag = {}
+        # Aura index: proc flags it was indexed with, so removal undoes exactly what was added.
+        self.indexed_proc_flags = {}
+        # All proc flags carried by active auras, used to skip proc checks for events no aura listens to.
+        self.proc_flags_mask = ProcFlags.NONE
+        # Min-heap of (timestamp, sequence, aura) holding the next expiry/periodic tick/resource cost/heartbeat resist
+        # deadline of each aura. Entries are invalidated lazily, see _is_scheduled().
+        self.aura_deadlines = []
+        self.deadline_sequence = count()
 
     def apply_spell_effect_aura(self, caster, casting_spell, spell_effect):
         aura = AppliedAura(caster, casting_spell, spell_effect, self.unit_mgr)
@@ -50,6 +67,7 @@ class AuraManager:
                 similar_aura.applied_stacks += 1  # Add a stack if the aura isn't at max already
 
             similar_aura.spell_effect.start_aura_duration(overwrite=True)  # Refresh duration
+            self.schedule_aura_update(similar_aura)
 
             # Note that this aura will not be actually applied.
             # Index and stacks are copied for sending information and updating effect points.
@@ -58,21 +76,58 @@ class AuraManager:
         else:
             aura.index = self.get_next_aura_index(aura)
             self.active_auras[aura.index] = aura
+            self.schedule_aura_update(aura)
 
         # Handle effects after possible stack increase/refresh to update stats properly.
         AuraEffectHandler.handle_aura_effect_change(aura, aura.target)
 
+        # Index procs once effects are applied, some handlers set proc flags (e.g. damage shields).
+        if self.active_auras.get(aura.index) is aura:
+            self._add_proc_aura(aura)
+
         self.write_aura_to_unit(aura, is_refresh=is_refresh)
         return aura.index
 
     def update(self, timestamp):
-        for aura in list(self.active_auras.values()):
-            if aura.spell_effect.area_aura_holder:
-                continue  # Area auras are updated by AreaAuraHolder.
+        if not self.aura_deadlines or self.aura_deadlines[0][0] > timestamp:
+            return
+
+        # Collect due auras first, rescheduled deadlines which are already due are handled on the next update.
+        due_auras = {}
+        while self.aura_deadlines and self.aura_deadlines[0][0] <= timestamp:
+            deadline, _, aura = heapq.heappop(self.aura_deadlines)
+            if self._is_scheduled(aura, deadline):
+                due_auras[aura.index] = aura
+
+        for aura in due_auras.values():
+            # Previous updates can remove other auras (e.g. other effects of the same spell).
+            if self.active_auras.get(aura.index) is not aura:
+                continue
 
             aura.update(timestamp)  # Update duration and handle periodic effects.
-            if aura.has_duration() and aura.get_duration() <= 0 or aura.get_heartbeat_resist_result(timestamp):
+            if aura.has_duration() and aura.get_duration(timestamp) <= 0 or \
+                    aura.get_heartbeat_resist_result(timestamp):
                 self.remove_aura(aura)
+                continue
+
+            self.schedule_aura_update(aura)
+
+    def schedule_aura_update(self, aura):
+        # Must be called whenever an aura's timers are changed outside of update() (refresh, channel pushback).
+        # Earlier deadlines are harmless, as the aura is simply rescheduled after an update without effect.
+        deadline = aura.get_next_update_timestamp()
+        aura.next_update_timestamp = deadline
+        if deadline is not None:
+            heapq.heappush(self.aura_deadlines, (deadline, next(self.deadline_sequence), aura))
+
+    def schedule_auras_from_spell(self, casting_spell):
+        for aura in list(self.active_auras.values()):
+            if aura.source_spell is casting_spell:
+                self.schedule_aura_update(aura)
+
+    def _is_scheduled(self, aura, deadline):
+        # Skip entries of removed auras and entries superseded by a later schedule_aura_update() call.
+        return self.active_auras.get(aura.index) is aura and aura.next_update_timestamp == deadline
 
     def can_apply_aura(self, aura) -> bool:
         # TODO Similar (stat mod?) harmful auras (2x. slows etc.) should not stack.
@@ -162,9 +217,33 @@ class AuraManager:
     # Involved unit is the secondary unit in the proc event.
     # is_receiver is set to false if the player is causing damage and set to true if the player is taking damage.
     def check_aura_procs(self, involved_cast=None, killed_unit=False, damage_info=None, is_melee_swing=False):
+        # No active aura can proc, nothing to do.
+        if not self.proc_flags_mask:
+            return
+
         is_receiver = (damage_info and damage_info.target is self.unit_mgr) or \
                       (involved_cast and involved_cast.spell_caster is not self.unit_mgr)
 
+        # Heartbeat effects are handled in their respective places on update, the flag is never set here.
+        event_mask = ProcFlags.NONE
+        if damage_info:
+            if damage_info.total_damage > 0:
+                # DEAL_COMBAT_DMG -> cast on target.
+                event_mask |= ProcFlags.TAKE_COMBAT_DMG if is_receiver else ProcFlags.DEAL_COMBAT_DMG
+            if is_receiver:
+                event_mask |= damage_info.proc_victim & AVOIDANCE_PROC_MASK
+        if killed_unit:
+            event_mask |= ProcFlags.KILL
+        if is_melee_swing and not is_receiver:
+            event_mask |= ProcFlags.SWING
+        if involved_cast:
+            # SPELL_CAST is only used by zzOLDMind Bomb.
+            event_mask |= ProcFlags.SPELL_HIT if is_receiver else ProcFlags.SPELL_CAST
+
+        event_mask &= self.proc_flags_mask
+        if not event_mask:
+            return
+
         # Always pass the second unit as the effect target. The handler will choose the target based on the spell.
         if damage_info:
             effect_target = damage_info.attacker if is_receiver else damage_info.target
@@ -175,25 +254,14 @@ class AuraManager:
         else:
             effect_target = self.unit_mgr
 
-        flag_cases = {
-            ProcFlags.DEAL_COMBAT_DMG: not is_receiver and damage_info and damage_info.total_damage > 0,  # -> cast on target.
-            ProcFlags.TAKE_COMBAT_DMG: is_receiver and damage_info and damage_info.total_damage > 0,
-            ProcFlags.KILL: killed_unit,
-            ProcFlags.HEARTBEAT: False,  # Heartbeat effects are handled in their respective places on update - ignore the flag here.
-            ProcFlags.DODGE: is_receiver and damage_info and damage_info.proc_victim & ProcFlags.DODGE,
-            ProcFlags.PARRY: is_receiver and damage_info and damage_info.proc_victim & ProcFlags.PARRY,
-            ProcFlags.BLOCK: is_receiver and damage_info and damage_info.proc_victim & ProcFlags.BLOCK,
-            ProcFlags.SWING: not is_receiver and is_melee_swing,
-            ProcFlags.SPELL_CAST: not is_receiver and involved_cast,  # Only used by zzOLDMind Bomb.
-            ProcFlags.SPELL_HIT: is_receiver and involved_cast,
-        }
-        for aura in list(self.active_auras.values()):
-            flags = aura.proc_flags
-            if not flags:
-                continue
+        triggered_auras = {}
+        for proc_flag in PROC_FLAGS:
+            if event_mask & proc_flag:
+                triggered_auras.update(self.auras_by_proc_flag[proc_flag])
 
-            for proc_flag, condition in flag_cases.items():
-                if proc_flag & flags and condition and aura.proc_charges != 0:  # Proc charges are set to -1 for auras with no charges so check for 0.
+        for aura in triggered_auras.values():
+            for proc_flag in PROC_FLAGS:
+                if proc_flag & aura.proc_flags & event_mask and aura.proc_charges != 0:  # Proc charges are set to -1 for auras with no charges so check for 0.
                     # Remove charge before trigger to avoid infinite loops with procs.
                     aura.proc_charges -= 1
                     AuraEffectHandler.handle_aura_effect_change(aura, effect_target, is_proc=True)
@@ -201,6 +269,30 @@ class AuraManager:
                     if aura.proc_charges == 0:
                         self.remove_aura(aura)
 
+    def _add_proc_aura(self, aura):
+        if not aura.proc_flags:
+            return
+        self.indexed_proc_flags[aura.index] = aura.proc_flags
+        for proc_flag in PROC_FLAGS:
+            if aura.proc_flags & proc_flag:
+                self.auras_by_proc_flag.setdefault(proc_flag, {})[aura.index] = aura
+                self.proc_flags_mask |= proc_flag
+
+    def _remove_proc_aura(self, aura):
+        proc_flags = self.indexed_proc_flags.pop(aura.index, ProcFlags.NONE)
+        if not proc_flags:
+            return
+        for proc_flag in PROC_FLAGS:
+            if not proc_flags & proc_flag:
+                continue
+            auras = self.auras_by_proc_flag.get(proc_flag)
+            if auras is None:
+                continue
+            auras.pop(aura.index, None)
+            if not auras:
+                del self.auras_by_proc_flag[proc_flag]
+                self.proc_flags_mask &= ~proc_flag
+
     def remove_colliding_effects(self, aura):
         # Special case with SpellEffect mounting and mounting by aura
         if aura.spell_effect.aura_type == AuraTypes.SPELL_AURA_MOUNTED and \
@@ -357,6 +449,8 @@ class AuraManager:
         AuraEffectHandler.handle_aura_effect_change(aura, aura.target, remove=True)
         if not self.active_auras.pop(aura.index, None):
             return
+        self._remove_proc_aura(aura)
+        aura.next_update_timestamp = None
 
         # Cancel other effects of this aura.
         self.remove_auras_from_spell(aura.source_spell)
@@ -1802,36 +1802,39 @@ class UnitManager(ObjectManager):
 
         map_ = self.get_map()
         self_is_player = self.get_type_id() == ObjectTypeIds.ID_PLAYER
-        surrounding_units = map_.get_surrounding_units(self, not self_is_player)
 
-        # Merge units and players.
+        # Creatures whose detection range contains our new position.
+        for unit in map_.get_aggro_observers(self.location):
+            if unit is not self:
+                self._notify_move_in_line_of_sight_to(map_, unit, self_is_player)
+
+        # Moving creatures can also be noticed by players within the creature detection range.
         if not self_is_player:
-            surrounding_units = list(surrounding_units[0].values()) + list(surrounding_units[1].values())
-        # Only creatures.
-        else:
-            surrounding_units = surrounding_units.values()
+            detection_range = self.get_detection_range()
+            if detection_range <= 0:
+                return
+            players = map_.get_surrounding_players_by_location(self.location, self.map_id, self.instance_id,
+                                                               detection_range)
+            for player in players.values():
+                self._notify_move_in_line_of_sight_to(map_, player, self_is_player)
 
-        for unit in surrounding_units:
-            distance = unit.location.distance(self.location)
-            unit_is_player = unit.get_type_id() == ObjectTypeIds.ID_PLAYER
-            detection_range = self.get_detection_range() if unit_is_player else unit.get_detection_range()
-            if distance > detection_range or not unit.is_hostile_to(self) or not unit.can_attack_target(self):
-                continue
-            if unit.threat_manager.has_aggro_from(self):
-                continue
-            # Check for stealth/invisibility.
-            unit_can_detect_self, alert = unit.can_detect_target(self, distance)
-            if alert and self_is_player:
-                unit.object_ai.send_ai_reaction(self, AIReactionStates.AI_REACT_ALERT)
-            if not unit_can_detect_self:
-                continue
-            if not map_.los_check(unit.get_ray_position(), self.get_ray_position()):
-                continue
-            # Player standing still case.
-            if unit_is_player and not unit.pending_relocation and not unit.beast_master:
-                unit.pending_relocation = True
-            elif not unit_is_player:
-                unit.object_ai.move_in_line_of_sight(self)
+    def _notify_move_in_line_of_sight_to(self, map_, unit, self_is_player):
+        if not unit.is_hostile_to(self) or not unit.can_attack_target(self):
+            return
+        if unit.threat_manager.has_aggro_from(self):
+            return
+        # Check for stealth/invisibility.
+        unit_can_detect_self, alert = unit.can_detect_target(self, unit.location.distance(self.location))
+        if alert and self_is_player:
+            unit.object_ai.send_ai_reaction(self, AIReactionStates.AI_REACT_ALERT)
+        if not unit_can_detect_self:
+            return
+        # Line of sight is resolved later on by the map, once per unit pair.
+        map_.enqueue_los_check(unit, self)
+
+    # Called once the map confirms this unit has line of sight to a moving hostile target.
+    def on_move_in_line_of_sight(self, target):
+        self.object_ai.move_in_line_of_sight(target)
 
     def set_has_moved(self, has_moved, has_turned, flush=False):
         # Only turn off once processed.
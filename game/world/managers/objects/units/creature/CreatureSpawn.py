@@ -26,6 +26,11 @@ class CreatureSpawn:
         self.respawn_time = 0
         self.last_tick = 0
         self.borrowed = False
+        # Wandering points around this spawn which passed path validation, shared by all its creature instances.
+        self.wander_points: list[Vector] = []
+        self.wander_point_attempts = 0
+        # (from node, to node): whether a direct wander path exists, nodes as in WanderingMovement.
+        self.wander_paths: dict[tuple[int, int], bool] = {}
 
     def update(self, now):
         if now > self.last_tick > 0:
@@ -1,13 +1,17 @@
+import heapq
 import random
 import time
 from dataclasses import dataclass
+from itertools import count
+from threading import RLock
 from typing import Optional
 
+from game.world.managers.objects.ObjectManager import ObjectManager
 from game.world.managers.objects.units.UnitManager import UnitManager
 from utils.Logger import Logger
 from utils.constants.MiscCodes import ObjectTypeFlags
 from utils.constants.ScriptCodes import AttackingTarget
-from utils.constants.UnitCodes import CreatureReactStates, UnitStates, UnitFlags
+from utils.constants.UnitCodes import CreatureReactStates, UnitStates, UnitFlags, UnitReaction
 
 
 @dataclass
@@ -29,6 +33,14 @@ class ThreatManager:
         self.holders: dict[int, ThreatHolder] = {}
         self.current_holder: Optional[ThreatHolder] = None
         self._call_for_help_range = call_for_help_range
+        # Max heap of (-total threat, time added, sequence, holder). A holder gets a new entry each time its threat
+        # changes, outdated entries are discarded once they reach the top.
+        self._threat_heap = []
+        self._heap_sequence = count()
+        # Holder guid: sequence of its latest heap entry. Kept here since holders can be shared (e.g. totems).
+        self._heap_sequences: dict[int, int] = {}
+        # Threat is added from the player thread while creatures pick targets from theirs.
+        self._heap_lock = RLock()
 
     def has_aggro_from(self, target):
         return target.guid in self.holders
@@ -42,6 +54,13 @@ class ThreatManager:
     def get_threat_holder_units(self):
         return [holder.unit for holder in list(self.holders.values())]
 
+    # Share the threat list of another unit, e.g. totems using their owner's.
+    def copy_holders_from(self, threat_manager):
+        with threat_manager._heap_lock, self._heap_lock:
+            self.holders = threat_manager.holders.copy()
+            self._threat_heap = threat_manager._threat_heap.copy()
+            self._heap_sequences = threat_manager._heap_sequences.copy()
+
     def update_unit_threat_modifier(self, unit_mgr, remove=False):
         max_holder = self._get_max_threat_holder()
         threat = 0  # Modifier does not affect current raw threat.
@@ -53,6 +72,7 @@ class ThreatManager:
         # Remove modifier if player exist as a threat holder.
         elif holder:
             holder.threat_mod = threat_mod
+            self._push_holder(holder)
 
     def reset(self):
         # Remove threat between self and attackers.
@@ -62,7 +82,10 @@ class ThreatManager:
             self.remove_unit_threat(unit)
             unit.threat_manager.remove_unit_threat(self.unit)
 
-        self.holders.clear()
+        with self._heap_lock:
+            self.holders.clear()
+            self._threat_heap.clear()
+            self._heap_sequences.clear()
         self.current_holder = None
 
     def remove_unit_threat(self, unit):
@@ -72,6 +95,7 @@ class ThreatManager:
                 self.current_holder = None
             # Pop unit from threat holders.
             self.holders.pop(unit.guid)
+            self._heap_sequences.pop(unit.guid, None)
             # Remove from self casts if needed.
             if not unit.is_alive:
                 self.unit.spell_manager.remove_unit_from_all_cast_targets(unit.guid)
@@ -109,11 +133,14 @@ class ThreatManager:
                 new_threat = source_holder.total_raw_threat + threat
                 source_holder.total_raw_threat = max(new_threat, 0.0)
                 source_holder.threat_mod = threat_mod
+                self._push_holder(source_holder)
             # New holder.
             elif threat >= 0.0:
                 if not is_call_for_help:
                     self.call_for_help(source, threat)
-                self.holders[source.guid] = ThreatHolder(source, threat, threat_mod, time.time())
+                source_holder = ThreatHolder(source, threat, threat_mod, time.time())
+                self.holders[source.guid] = source_holder
+                self._push_holder(source_holder)
                 # Force both units to be linked through threat.
                 if not source.threat_manager.has_aggro_from(self.unit):
                     source.threat_manager.add_threat(self.unit)
@@ -177,10 +204,20 @@ class ThreatManager:
     def call_for_help(self, source, threat=THREAT_NOT_TO_LEAVE_COMBAT):
         if not self._call_for_help_range:
             return
-        units = self.unit.get_map().get_surrounding_units_by_location(self.unit.location, self.unit.map_id,
-                                                                      self.unit.instance_id,
-                                                                      self._call_for_help_range)[0].values()
-        helping_units = [unit for unit in units if self.unit_can_assist_help_call(unit, source)]
+        # Only creatures of factions this unit is not hostile to can answer, skip other faction buckets entirely.
+        own_faction = self.unit.faction
+        units = self.unit.get_map().get_surrounding_creatures_by_faction(
+            self.unit.location, self.unit.map_id, self.unit.instance_id, self._call_for_help_range,
+            lambda faction: faction == own_faction or
+            ObjectManager.get_faction_reaction(own_faction, faction) >= UnitReaction.UNIT_REACTION_NEUTRAL).values()
+        helping_units = [unit for unit in units if self.unit_can_assist_help_call(unit, source, check_los=False)]
+        if not helping_units:
+            return
+        # Line of sight for all candidates at once.
+        ray_position = self.unit.get_ray_position()
+        in_sight = self.unit.get_map().los_check_batch([(ray_position, unit.get_ray_position())
+                                                        for unit in helping_units])
+        helping_units = [unit for unit, has_los in zip(helping_units, in_sight) if has_los]
         [unit.threat_manager.add_threat(source, threat, is_call_for_help=True) for unit in helping_units]
 
     def can_resolve_target(self):
@@ -198,7 +235,7 @@ class ThreatManager:
         return True
 
     # 0.5.3 has no faction template flags.
-    def unit_can_assist_help_call(self, caller_unit, source):
+    def unit_can_assist_help_call(self, caller_unit, source, check_los=True):
         if caller_unit == self.unit:
             return False
         elif caller_unit.is_pet() or caller_unit.is_evading:
@@ -221,14 +258,50 @@ class ThreatManager:
             return False
         elif caller_unit.get_creature_family() != self.unit.get_creature_family():
             return False
-        elif not caller_unit.get_map().los_check(self.unit.get_ray_position(), caller_unit.get_ray_position()):
+        elif check_los and \
+                not caller_unit.get_map().los_check(self.unit.get_ray_position(), caller_unit.get_ray_position()):
             return False
         return True
 
-    # TODO: Optimize this method?
     def _get_max_threat_holder(self) -> Optional[ThreatHolder]:
-        relevant_holders = self._get_sorted_threat_collection()
-        return None if not relevant_holders else relevant_holders[0]
+        max_holder = None
+        skipped_entries = []
+        with self._heap_lock:
+            while self._threat_heap:
+                entry = self._threat_heap[0]
+                if not self._is_current_heap_entry(entry):
+                    heapq.heappop(self._threat_heap)
+                    continue
+                if self._is_relevant_holder(entry[3]):
+                    max_holder = entry[3]
+                    break
+                # Still a valid holder, but can't be targeted right now.
+                skipped_entries.append(heapq.heappop(self._threat_heap))
+
+            for entry in skipped_entries:
+                heapq.heappush(self._threat_heap, entry)
+
+        return max_holder
+
+    def _push_holder(self, holder):
+        with self._heap_lock:
+            sequence = next(self._heap_sequence)
+            self._heap_sequences[holder.unit.guid] = sequence
+            heapq.heappush(self._threat_heap, (-holder.get_total_threat(), holder.time_added, sequence, holder))
+
+            # Constant heals and damage keep pushing entries for the same holders, drop outdated ones once in a while.
+            if len(self._threat_heap) > 2 * len(self.holders) + 16:
+                self._threat_heap = [entry for entry in self._threat_heap if self._is_current_heap_entry(entry)]
+                heapq.heapify(self._threat_heap)
+
+    def _is_current_heap_entry(self, entry):
+        guid = entry[3].unit.guid
+        return self._heap_sequences.get(guid) == entry[2] and self.holders.get(guid) is entry[3]
+
+    def _is_relevant_holder(self, holder):
+        if not holder.unit.is_alive:
+            return False
+        return self.unit.can_attack_target(holder.unit) or holder.unit.is_hostile_to(self.unit)
 
     def _get_sorted_threat_collection(self) -> Optional[list[ThreatHolder]]:
         relevant_holders = []
@@ -236,9 +309,7 @@ class ThreatManager:
             return relevant_holders
 
         for holder in list(self.holders.values()):
-            if not holder.unit.is_alive:
-                continue
-            if self.unit.can_attack_target(holder.unit) or holder.unit.is_hostile_to(self.unit):
+            if self._is_relevant_holder(holder):
                 relevant_holders.append(holder)
 
         # Sort by threat and time added, to avoid unstable sorting when more than 1 unit have the same threat.
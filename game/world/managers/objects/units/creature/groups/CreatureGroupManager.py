@@ -16,6 +16,10 @@ class CreatureGroupManager:
         self.leader = None
         self.members: dict[int, CreatureGroupMember] = {}
         self.group_flags = 0
+        # Formation slot of each follower around the leader, computed for all members at once whenever the leader
+        # moves or turns. {guid: Vector}
+        self.formation_slots = {}
+        self.formation_leader_position = None
 
     @staticmethod
     def get_create_group(creature_group):
@@ -94,6 +98,21 @@ class CreatureGroupManager:
         self.members.clear()
         CREATURE_GROUPS.pop(self.original_leader_spawn_id)
 
+    def get_formation_slot(self, group_member):
+        leader_location = self.leader.location
+        leader_position = (self.leader.guid, leader_location.x, leader_location.y, leader_location.z,
+                           leader_location.o)
+        if leader_position != self.formation_leader_position:
+            self.formation_leader_position = leader_position
+            self.formation_slots = {guid: leader_location.get_point_in_radius_and_angle(member.distance_leader,
+                                                                                        member.angle)
+                                    for guid, member in self.members.items()}
+        slot = self.formation_slots.get(group_member.creature.guid)
+        if not slot:  # Joined after the slots were computed.
+            slot = leader_location.get_point_in_radius_and_angle(group_member.distance_leader, group_member.angle)
+            self.formation_slots[group_member.creature.guid] = slot
+        return slot
+
     def is_formation(self):
         return self.group_flags & CreatureGroupFlags.OPTION_FORMATION_MOVE
 
@@ -14,6 +14,8 @@ class MovementInfo:
         self.turned = False
         self.jumped = False
         self.collided = False
+        # Last heartbeat also broadcast to mid range observers.
+        self.last_mid_heartbeat_timestamp = 0
 
     def update(self, reader, unit_mover):
         from game.world.managers.objects.units.movement.helpers.Spline import Spline
@@ -16,8 +16,7 @@ MAX_QUIET_DISTANCE = 43.0 - SEARCH_RANDOM_RADIUS
 FLEE_ASSISTANCE_RADIUS = 30.0
 
 
-# TODO: Namigator: FindRandomPointAroundCircle (Detour)
-#  We need a valid path for fear else unexpected collisions can mess things up.
+# We need a valid path for fear else unexpected collisions can mess things up.
 class FearMovement(BaseMovement):
     def __init__(self, fear_duration_secs, spline_callback, target=None, seek_assist=False):
         super().__init__(move_type=MoveType.FEAR, spline_callback=spline_callback)
@@ -101,12 +100,12 @@ class FearMovement(BaseMovement):
     def _get_path(self, fear_point):
         if not config.Server.Settings.use_nav_tiles:
             return [fear_point]
-        for search_range in range(0, int(SEARCH_RANDOM_RADIUS)):
-            destination = fear_point.get_random_point_in_radius(search_range, self.unit.map_id)
-            failed, in_place, path = self.unit.get_map().calculate_path(self.unit.location, destination)
-            if not failed:
-                return path
-        return [fear_point]
+        map_ = self.unit.get_map()
+        found, destination = map_.find_random_point_around_circle(fear_point, SEARCH_RANDOM_RADIUS)
+        if not found:
+            return [fear_point]
+        failed, in_place, path = map_.calculate_path(self.unit.location, destination)
+        return path if not failed else [fear_point]
 
     def _get_fear_point(self):
         # Looking for assist.
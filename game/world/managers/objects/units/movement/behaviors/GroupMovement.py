@@ -96,15 +96,15 @@ class GroupMovement(BaseMovement):
             return None, 0
         group_member = creature_group.members[creature_mgr.guid]
         speed = self._get_speed(creature_group)
-        leader_distance = max(0.2, group_member.distance_leader - (elapsed * speed))
-        location = creature_group.leader.location.get_point_in_radius_and_angle(leader_distance, group_member.angle)
-        creature_distance = group_member.creature.location.distance(location) - (elapsed * speed)
+        # Slots are shared by the whole group and only recomputed when the leader moves.
+        slot = creature_group.get_formation_slot(group_member)
+        creature_distance = group_member.creature.location.distance(slot) - (elapsed * speed)
 
         # Check if unit is lagging.
         if creature_distance > group_member.distance_leader:
             # If distance is greater than current cell size, teleport the unit to the location.
             if creature_distance > CellUtils.CELL_SIZE:
-                self.unit.near_teleport(location)
+                self.unit.near_teleport(slot.copy())
                 return None, 0
             if not self._is_lagging:
                 self._is_lagging = creature_distance > group_member.distance_leader * 2
@@ -112,6 +112,9 @@ class GroupMovement(BaseMovement):
             self._is_lagging = False
             return None, 0
 
+        leader_distance = max(0.2, group_member.distance_leader - (elapsed * speed))
+        location = creature_group.leader.location.get_point_in_radius_and_angle(leader_distance, group_member.angle)
+
         # Catch up if lagging behind.
         if self._is_lagging:
             speed += 0.05 * creature_distance * creature_distance * elapsed
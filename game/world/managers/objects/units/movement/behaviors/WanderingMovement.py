@@ -1,24 +1,33 @@
 import math
 import time
-from random import randint
+from random import randint, choice
 
 from game.world.managers.objects.units.movement.helpers.SplineBuilder import SplineBuilder
 from utils.ConfigManager import config
 from utils.constants.MiscCodes import MoveType
 from game.world.managers.objects.units.movement.behaviors.BaseMovement import BaseMovement
 
+# Validated wandering points kept per creature spawn.
+WANDER_POINTS_POOL_SIZE = 8
+# Candidate points tried per spawn before settling with the validated ones found so far.
+WANDER_POINTS_MAX_ATTEMPTS = 32
+# Node used for the spawn position in CreatureSpawn.wander_paths, pool points use their index.
+SPAWN_WANDER_NODE = -1
+
 
-# TODO: Namigator: FindRandomPointAroundCircle (Detour)
 class WanderingMovement(BaseMovement):
     def __init__(self, spline_callback, is_default):
         super().__init__(move_type=MoveType.WANDER, spline_callback=spline_callback, is_default=is_default)
         self.wandering_distance = 0
         self.last_wandering_movement = 0
         self.wait_time_seconds = 0
+        self.creature_spawn = None
 
     # override
     def initialize(self, unit):
         self.wandering_distance = unit.wander_distance
+        if unit.spawn_id:
+            self.creature_spawn = unit.get_map().get_creature_spawn_by_id(unit.spawn_id, unit.spawn_position)
         self.reset()
         return super().initialize(unit)
 
@@ -57,25 +66,97 @@ class WanderingMovement(BaseMovement):
         return not self.spline and now > self.last_wandering_movement + self.wait_time_seconds
 
     def _get_wandering_point(self):
+        # Creatures without a spawn (e.g. summons) validate a new point each time.
+        if not self.creature_spawn:
+            return self._find_wandering_point(self.unit.location)
+
         start_point = self.unit.spawn_position
-        random_point = start_point.get_random_point_in_radius(self.wandering_distance, map_id=self.unit.map_id)
-        map_ = self.unit.get_map()
-        # Check line of sight.
-        if not map_.los_check(self.unit.location, random_point.get_ray_vector(is_terrain=True)):
+        node = self._get_current_wander_node()
+        # Away from the spawn and its pool (e.g. after combat), validate a new point from here.
+        if node is None:
+            return self._find_wandering_point(self.unit.location)
+
+        # Grow this spawn's pool while standing on the spawn position, new points are validated from there.
+        wander_points = self.creature_spawn.wander_points
+        wander_paths = self.creature_spawn.wander_paths
+        if node == SPAWN_WANDER_NODE and len(wander_points) < WANDER_POINTS_POOL_SIZE and \
+                self.creature_spawn.wander_point_attempts < WANDER_POINTS_MAX_ATTEMPTS:
+            self.creature_spawn.wander_point_attempts += 1
+            success, point = self._find_wandering_point(start_point)
+            if success:
+                # The map pools random points too, reuse the node if this spawn already holds the point.
+                target = self._get_wander_node_at(point)
+                if target is None:
+                    wander_points.append(point)
+                    target = len(wander_points) - 1
+                wander_paths[(node, target)] = True
+                return True, wander_points[target].copy()
+
+        # Move between the spawn and pool points, each pair is only validated once.
+        candidates = [target for target in range(SPAWN_WANDER_NODE, len(wander_points))
+                      if target != node and wander_paths.get((node, target), True)]
+        if not candidates:
             return False, start_point
 
-        # Validate a path to the wandering point.
-        failed, in_place, path = map_.calculate_path(self.unit.location, random_point, los=True)
-        if failed or len(path) > 1 or in_place or start_point.distance(random_point) < 1:
+        target = choice(candidates)
+        origin = self._get_wander_node_position(node)
+        point = self._get_wander_node_position(target).copy()
+        if (node, target) not in wander_paths:
+            wander_paths[(node, target)] = self._is_reachable_wandering_point(origin, point)
+        if not wander_paths[(node, target)]:
             return False, start_point
 
-        # Ignore point if 'slope' above 2.5.
-        diff = math.fabs(random_point.z - self.unit.location.z)
-        if diff > 2.5:
+        # Do not wander into inactive cells.
+        if not self.unit.get_map().is_active_cell_for_location(point):
+            return False, start_point
+
+        return True, point
+
+    def _find_wandering_point(self, origin):
+        start_point = self.unit.spawn_position
+        map_ = self.unit.get_map()
+        found, random_point = map_.find_random_point_around_circle(start_point, self.wandering_distance)
+        if not found or start_point.distance(random_point) < 1:
             return False, start_point
-        
+
+        if not self._is_reachable_wandering_point(origin, random_point):
+            return False, start_point
+
         # Do not wander into inactive cells.
         if not map_.is_active_cell_for_location(random_point):
             return False, start_point
 
         return True, random_point
+
+    # Wander node the unit is standing on, SPAWN_WANDER_NODE for the spawn position or a pool index, None if neither.
+    def _get_current_wander_node(self):
+        return self._get_wander_node_at(self.unit.location)
+
+    def _get_wander_node_at(self, location):
+        if location.distance(self.unit.spawn_position) < 1:
+            return SPAWN_WANDER_NODE
+        for index, wander_point in enumerate(self.creature_spawn.wander_points):
+            if location.distance(wander_point) < 1:
+                return index
+        return None
+
+    def _get_wander_node_position(self, node):
+        return self.unit.spawn_position if node == SPAWN_WANDER_NODE else self.creature_spawn.wander_points[node]
+
+    # Static checks between two positions, results can be cached.
+    def _is_reachable_wandering_point(self, origin, point):
+        if origin.distance(point) < 1:
+            return False
+
+        # Ignore point if 'slope' above 2.5.
+        if math.fabs(point.z - origin.z) > 2.5:
+            return False
+
+        # Check line of sight.
+        map_ = self.unit.get_map()
+        if not map_.los_check(origin, point.get_ray_vector(is_terrain=True)):
+            return False
+
+        # Wandering splines are straight lines, the point must be reachable without intermediate waypoints.
+        failed, in_place, path = map_.calculate_path(origin, point, los=True)
+        return not failed and not in_place and len(path) <= 1
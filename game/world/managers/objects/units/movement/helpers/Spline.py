@@ -1,4 +1,5 @@
 import time
+from collections import deque
 from struct import pack, unpack
 
 from game.world import WorldManager
@@ -24,28 +25,37 @@ class Spline(object):
         self.facing = facing
         self.speed = speed
         self.elapsed = elapsed  # Milliseconds.
-        self.elapsed_since_last_location = 0  # Elapsed since we were able to update unit location on this spline.
         self.total_time = total_time  # Milliseconds.
         self.points = points
-        self.pending_waypoints: list[PendingWaypoint] = []
+        self.pending_waypoints: deque[PendingWaypoint] = deque()
         self.waypoints_bytes = b''
+        # Location the spline starts from and, for each point, the seconds at which it is reached.
+        self.start_location = None
+        self.point_timestamps: list[float] = []
+        # Movement packet parts which don't change once the spline is built.
+        self.facing_bytes = b''
+        self.points_bytes = b''
         self.total_waypoint_timer = 0
         self.extra_time_seconds = extra_time_seconds  # After real time ends, wait n secs.
         self.initialized = False
 
     def initialize(self):
-        self.waypoints_bytes = b''
+        self.start_location = self.unit.location.copy()
+        self.point_timestamps = []
         last_waypoint = self.unit.location
         total_time = 0
         for wp in self.points:
-            self.waypoints_bytes += wp.to_bytes(include_orientation=False)
             current_distance = last_waypoint.distance(wp)
             # Avoid div by zero. e.g. Facing spline.
             current_time = 0 if not self.speed else current_distance / self.speed
             total_time += current_time
+            self.point_timestamps.append(total_time)
             self.pending_waypoints.append(PendingWaypoint(self, len(self.pending_waypoints), total_time, wp))
             last_waypoint = wp
 
+        self.waypoints_bytes = b''.join([wp.to_bytes(include_orientation=False) for wp in self.points])
+        self.facing_bytes = self._get_facing_bytes()
+        self.points_bytes = pack(f'<I{len(self.waypoints_bytes)}s', len(self.points), self.waypoints_bytes)
         self.total_time = total_time * 1000
         self.initialized = True
 
@@ -61,7 +71,6 @@ class Spline(object):
 
         self.total_waypoint_timer += elapsed
         self.elapsed += elapsed * 1000  # Milliseconds.
-        self.elapsed_since_last_location += elapsed
 
         # Spline is complete but has extra time.
         if not self.pending_waypoints:
@@ -71,12 +80,11 @@ class Spline(object):
 
         is_complete = self.total_waypoint_timer >= current_waypoint.expected_timestamp
         if is_complete:
-            self.pending_waypoints.pop(0)
+            self.pending_waypoints.popleft()
 
-        new_position = self._get_position(current_waypoint, self.elapsed_since_last_location, is_complete)
+        new_position = self._get_position(current_waypoint, is_complete)
 
         if new_position:
-            self.elapsed_since_last_location = 0
             if config.Server.Settings.debug_movement:
                 self._debug_position(new_position)
             # While in movement (guessed position) always face target destination.
@@ -87,17 +95,31 @@ class Spline(object):
         # Position changed, vector, waypoint completed (Not guessed).
         return new_position is not None, new_position, is_complete
 
-    def _get_position(self, pending_waypoint, elapsed, is_complete=False):
+    def _get_position(self, pending_waypoint, is_complete=False):
         # Handle players collision due wrong pathing.
         if self.unit.movement_flags & MoveFlags.MOVEFLAG_REDIRECTED:
             return self.unit.location
         if is_complete:
             self._validate_orientation(self.unit, pending_waypoint)
             return pending_waypoint.location
-        guessed_distance = self.speed * elapsed
-        # This can return None.
-        return self.unit.location.get_point_in_between(guessed_distance, pending_waypoint.location,
-                                                       map_id=self.unit.map_id)
+
+        # Interpolate within the current segment from the precomputed point timestamps.
+        index = pending_waypoint.id_
+        segment_start = self.points[index - 1] if index else self.start_location
+        segment_start_time = self.point_timestamps[index - 1] if index else 0
+        segment_time = pending_waypoint.expected_timestamp - segment_start_time
+        if segment_time <= 0:
+            return None
+        factor = min(1.0, max(0.0, (self.total_waypoint_timer - segment_start_time) / segment_time))
+        segment_end = pending_waypoint.location
+
+        x = segment_start.x + factor * (segment_end.x - segment_start.x)
+        y = segment_start.y + factor * (segment_end.y - segment_start.y)
+        default_z = segment_start.z + factor * (segment_end.z - segment_start.z)
+        z, z_locked = Vector.calculate_z(x, y, self.unit.map_id, default_z, is_rand_point=True)
+        position = Vector(x, y, z, z_locked=z_locked)
+        position.set_orientation(self.unit.location.o)
+        return position
 
     # noinspection PyMethodMayBeStatic
     def _validate_orientation(self, unit, pending_waypoint):
@@ -152,6 +174,7 @@ class Spline(object):
 
         return PacketWriter.get_packet(OpCode.SMSG_MONSTER_MOVE, data)
 
+    # Current location and time change between packets, facing and waypoints are cached on initialize.
     def _get_header_bytes(self):
         location_bytes = self.unit.location.to_bytes(include_orientation=False)
         data = pack(
@@ -161,23 +184,20 @@ class Spline(object):
             int(WorldManager.get_seconds_since_startup() * 1000),
             int(self.spline_type)
         )
+        return data + self.facing_bytes
+
+    def _get_facing_bytes(self):
         if self.is_type(SplineType.SPLINE_TYPE_FACING_SPOT):
             spot_bytes = self.spot.to_bytes(include_orientation=False)
-            data += pack(f'<{len(spot_bytes)}s', spot_bytes)
+            return pack(f'<{len(spot_bytes)}s', spot_bytes)
         elif self.is_type(SplineType.SPLINE_TYPE_FACING_TARGET):
-            data += pack('<Q', self.guid)
+            return pack('<Q', self.guid)
         elif self.is_type(SplineType.SPLINE_TYPE_FACING_ANGLE):
-            data += pack('<f', self.facing)
-        return data
+            return pack('<f', self.facing)
+        return b''
 
     def _get_payload_bytes(self):
-        return pack(
-            f'<3I{len(self.waypoints_bytes)}s',
-            self.spline_flags,
-            int(self.total_time - int(self.elapsed)),
-            len(self.points),
-            self.waypoints_bytes
-        )
+        return pack('<2I', self.spline_flags, int(self.total_time - int(self.elapsed))) + self.points_bytes
 
     @staticmethod
     def from_bytes(unit, spline_bytes):
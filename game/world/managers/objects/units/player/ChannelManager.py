@@ -1,5 +1,6 @@
 from struct import pack
 
+from game.world.managers.objects.units.player.FriendsManager import FriendsManager
 from network.packet.PacketWriter import PacketWriter
 from utils.ConfigManager import config
 from utils.Logger import Logger
@@ -11,15 +12,16 @@ from utils.constants.UnitCodes import Teams
 class Channel(object):
     def __init__(self, name, members, password, is_default, owner, announce, moderators=None, banned=None, muted=None):
         self.name: str = name
-        self.members: list = members
+        # Player collections are keyed by guid, players themselves aren't hashable. Dicts keep join order.
+        self.members: dict = {player_mgr.guid: player_mgr for player_mgr in members}
         self.password: str = password
         self.is_default: bool = is_default
         self.owner = owner
         self.announce: bool = announce
         self.moderated: bool = False
-        self.moderators: list = moderators if moderators else []
-        self.banned: list = banned if banned else []
-        self.muted: list = muted if muted else []
+        self.moderators: set[int] = {player_mgr.guid for player_mgr in moderators} if moderators else set()
+        self.banned: set[int] = {player_mgr.guid for player_mgr in banned} if banned else set()
+        self.muted: set[int] = {player_mgr.guid for player_mgr in muted} if muted else set()
 
     # Addon channels should always start with 'Addon' plus description. e.g. 'AddonAuras'.
     def is_addon(self):
@@ -32,7 +34,7 @@ class Channel(object):
         return len(self.members)
 
     def get_members(self):
-        return list(self.members)
+        return list(self.members.values())
 
     def set_password(self, password):
         self.password = password
@@ -47,19 +49,19 @@ class Channel(object):
         self.announce = not self.announce
 
     def is_muted(self, player_mgr):
-        return player_mgr in self.muted
+        return player_mgr.guid in self.muted
 
     def mute(self, player_mgr):
-        self.muted.append(player_mgr)
+        self.muted.add(player_mgr.guid)
 
     def unmute(self, player_mgr):
-        self.muted.remove(player_mgr)
+        self.muted.discard(player_mgr.guid)
 
     def is_banned(self, player_mgr):
-        return player_mgr in self.banned
+        return player_mgr.guid in self.banned
 
     def is_moderator(self, player_mgr):
-        return player_mgr in self.moderators
+        return player_mgr.guid in self.moderators
 
     def set_owner(self, player_mgr):
         self.owner = player_mgr
@@ -68,7 +70,7 @@ class Channel(object):
         return self.owner == player_mgr
 
     def player_in_channel(self, player_mgr):
-        return player_mgr in self.members
+        return player_mgr.guid in self.members
 
     def toggle_moderation(self):
         self.moderated = not self.moderated
@@ -77,22 +79,22 @@ class Channel(object):
         return self.moderated
 
     def add_moderator(self, player_mgr):
-        self.moderators.append(player_mgr)
+        self.moderators.add(player_mgr.guid)
 
     def remove_moderator(self, player_mgr):
-        self.moderators.remove(player_mgr)
+        self.moderators.discard(player_mgr.guid)
 
     def add_member(self, player_mgr):
-        self.members.append(player_mgr)
+        self.members[player_mgr.guid] = player_mgr
 
     def remove_member(self, player_mgr):
-        self.members.remove(player_mgr)
+        self.members.pop(player_mgr.guid, None)
 
     def add_ban(self, player_mgr):
-        self.banned.append(player_mgr)
+        self.banned.add(player_mgr.guid)
 
     def remove_ban(self, player_mgr):
-        self.banned.remove(player_mgr)
+        self.banned.discard(player_mgr.guid)
 
     def broadcast_to_channel(self, sender, packet, ignore=None):
         if self.is_muted(sender):
@@ -100,17 +102,22 @@ class Channel(object):
             ChannelManager.send_to_player(sender, packet)
             return
 
-        for player in list(self.members):
-            if ignore and player in ignore or player.friends_manager.has_ignore(sender.guid):
-                continue
-            player.enqueue_packet(packet)
+        # The packet is built once and the same buffer is queued on every recipient session.
+        excluded = FriendsManager.get_ignoring_players(sender.guid)
+        if ignore:
+            excluded = excluded.union([player_mgr.guid for player_mgr in ignore])
+
+        sessions = [player_mgr.session for guid, player_mgr in list(self.members.items())
+                    if guid not in excluded and player_mgr.session]
+        for session in sessions:
+            session.enqueue_packet(packet)
 
     def get_channel_list_packet(self):
         name_bytes = PacketWriter.string_to_bytes(self.name)
         # TODO '0x3' Unknown 'channelflags', seems unused by client.
         data = pack(f'<{len(name_bytes)}sBI', name_bytes, 0x3, self.members_count())
 
-        for member in list(self.members):
+        for member in list(self.members.values()):
             data += pack('<Q', member.guid)
             mode = 0
             if self.is_muted(member):
@@ -9,12 +9,18 @@ from utils.constants.MiscCodes import FriendResults, FriendStatus
 from utils.constants.OpCodes import OpCode
 
 
+_EMPTY_SET = frozenset()
+
+
 class FriendsManager(object):
 
     # TODO: These values are from 1.12.1, confirm if they are the same for 0.5.3.
     MAX_FRIEND_LIMIT = 50
     MAX_IGNORE_LIMIT = 25
 
+    # Reverse ignore index for online players, ignored guid: {guids of players ignoring them}.
+    IGNORED_BY: dict[int, set[int]] = {}
+
     def __init__(self, owner):
         self.owner = owner
         self.friends: dict[int, CharacterSocial] = {}
@@ -28,6 +34,29 @@ class FriendsManager(object):
                 else:
                     self.ignored[entry.other_guid] = entry
 
+        for ignored_guid in self.ignored:
+            self._index_ignore(ignored_guid)
+
+    # Called on logout, only online players are part of the reverse ignore index.
+    def unload(self):
+        for ignored_guid in self.ignored:
+            self._unindex_ignore(ignored_guid)
+
+    def _index_ignore(self, ignored_guid):
+        FriendsManager.IGNORED_BY.setdefault(ignored_guid, set()).add(self.owner.guid)
+
+    def _unindex_ignore(self, ignored_guid):
+        ignoring = FriendsManager.IGNORED_BY.get(ignored_guid)
+        if ignoring is None:
+            return
+        ignoring.discard(self.owner.guid)
+        if not ignoring:
+            del FriendsManager.IGNORED_BY[ignored_guid]
+
+    @staticmethod
+    def get_ignoring_players(player_guid) -> set[int]:
+        return FriendsManager.IGNORED_BY.get(player_guid, _EMPTY_SET)
+
     def try_add_friend(self, target_name):
         online_player = WorldSessionStateHandler.find_player_by_name(target_name)
         target_guid = 0
@@ -89,6 +118,7 @@ class FriendsManager(object):
             status = FriendResults.FRIEND_IGNORE_REMOVED
             RealmDatabaseManager.character_social_delete_social(self.ignored[player_guid])
             self.ignored.pop(player_guid)
+            self._unindex_ignore(player_guid)
         else:
             status = FriendResults.FRIEND_IGNORE_NOT_FOUND
 
@@ -136,6 +166,7 @@ class FriendsManager(object):
             if status == FriendResults.FRIEND_IGNORE_ADDED:
                 self.ignored[target_guid] = self._create_social(target_guid, ignored=True)
                 RealmDatabaseManager.character_add_social(self.ignored[target_guid])
+                self._index_ignore(target_guid)
 
         data = pack('<BQ', status, target_guid)
         self.owner.enqueue_packet(PacketWriter.get_packet(OpCode.SMSG_FRIEND_STATUS, data))
@@ -329,12 +329,10 @@ class InventoryManager(object):
         for container_slot, container in list(self.containers.items()):
             if not container:
                 continue
-            for slot, item in list(container.sorted_slots.items()):
+            for slot, item in list(container.sorted_slots.get_items_by_entry(entry).items()):
                 if not include_bank and self.is_bank_slot(container_slot, slot):
                     continue
-
-                if item.item_template.entry == entry:
-                    count += item.item_instance.stackcount
+                count += item.item_instance.stackcount
         return count
 
     def get_container(self, slot):
@@ -354,9 +352,9 @@ class InventoryManager(object):
         for container_slot, container in list(self.containers.items()):
             if not container:
                 continue
-            for slot, item in list(container.sorted_slots.items()):
-                if item.item_template.entry == entry:
-                    return item
+            items = container.sorted_slots.get_items_by_entry(entry)
+            if items:
+                return next(iter(items.values()))
         return None
 
     # Clear_slot should be set as False if another item will be placed in this slot (swap_item)
@@ -432,20 +430,19 @@ class InventoryManager(object):
         if not target_container:
             return item_count
 
-        for slot, item in list(target_container.sorted_slots.items()):
+        for slot, item in list(target_container.sorted_slots.get_items_by_entry(item_entry).items()):
             if not include_bank and target_container.is_backpack and \
                     self.is_bank_slot(InventorySlots.SLOT_INBACKPACK, slot):
                 continue
 
-            if item.item_template.entry == item_entry:
-                if item_count < item.item_instance.stackcount:
-                    new_stack_count = item.item_instance.stackcount - item_count
-                    item.set_stack_count(new_stack_count)
-                    item_count = 0
-                    break
-                elif item_count >= item.item_instance.stackcount:
-                    self.remove_item(container_slot, slot, True)
-                    item_count -= item.item_instance.stackcount
+            if item_count < item.item_instance.stackcount:
+                new_stack_count = item.item_instance.stackcount - item_count
+                item.set_stack_count(new_stack_count)
+                item_count = 0
+                break
+            elif item_count >= item.item_instance.stackcount:
+                self.remove_item(container_slot, slot, True)
+                item_count -= item.item_instance.stackcount
 
         return item_count  # Return the amount of items not removed
 
@@ -453,17 +450,17 @@ class InventoryManager(object):
         for container_slot, container in list(self.containers.items()):
             if not container:
                 continue
-            for slot, item in list(container.sorted_slots.items()):
-                if item.guid == guid:
-                    return item
+            item = container.sorted_slots.get_item_by_guid(guid)
+            if item:
+                return item
 
     def get_item_info_by_guid(self, guid):
         for container_slot, container in list(self.containers.items()):
             if not container:
                 continue
-            for slot, item in list(container.sorted_slots.items()):
-                if item.guid == guid:
-                    return container_slot, container, slot, item
+            slot = container.sorted_slots.get_slot_by_guid(guid)
+            if slot != -1:
+                return container_slot, container, slot, container.sorted_slots[slot]
         return -1, None, -1, None
 
     def add_bag(self, slot, container):
@@ -509,28 +506,25 @@ class InventoryManager(object):
         if 0 < item_template.max_count <= self.get_item_count(item_template.entry, include_bank=True):
             return InventoryError.BAG_ITEM_MAX_COUNT_EXCEEDED
 
-        # Check bags
+        # Check bags, free slots hold a full stack each, partial stacks of this item hold the rest of a stack.
         if not on_bank:
             for slot, container in self.containers.items():
                 if not container or not container.can_contain_item(item_template):
                     continue
-                for x in range(container.start_slot, container.max_slot):
-                    if self.is_bank_slot(slot, x):
-                        continue
-                    if x not in container.sorted_slots:
-                        amount -= item_template.stackable
-                        continue  # Skip any reserved slots
-                    item_mgr = container.sorted_slots[x]
-                    if item_mgr.item_template.entry == item_template.entry:
-                        amount -= item_template.stackable - item_mgr.item_instance.stackcount
-        else:
-            for x in range(InventorySlots.SLOT_BANK_ITEM_START, InventorySlots.SLOT_BANK_ITEM_END):
-                if x not in self.get_backpack().sorted_slots:
-                    amount -= item_template.stackable
+                if container.is_backpack:
+                    # Backpack slots past the inventory are bank slots.
+                    start_slot, end_slot = InventorySlots.SLOT_ITEM_START, InventorySlots.SLOT_ITEM_END
+                elif self.is_bank_slot(slot, container.start_slot):
                     continue
-                item_mgr = self.get_backpack().sorted_slots[x]
-                if item_mgr.item_template.entry == item_template.entry:
-                    amount -= item_template.stackable - item_mgr.item_instance.stackcount
+                else:
+                    start_slot, end_slot = container.start_slot, container.max_slot
+                amount -= container.sorted_slots.get_free_count(start_slot, end_slot) * item_template.stackable
+                amount -= container.sorted_slots.get_stack_space(item_template, start_slot, end_slot)
+        else:
+            backpack_slots = self.get_backpack().sorted_slots
+            start_slot, end_slot = InventorySlots.SLOT_BANK_ITEM_START, InventorySlots.SLOT_BANK_ITEM_END
+            amount -= backpack_slots.get_free_count(start_slot, end_slot) * item_template.stackable
+            amount -= backpack_slots.get_stack_space(item_template, start_slot, end_slot)
 
         if amount <= 0:
             return InventoryError.BAG_OK
@@ -945,9 +939,7 @@ class InventoryManager(object):
 
     # noinspection PyMethodMayBeStatic
     def _get_single_item_full_update_packet(self, item, requester):
-        update_packet = UpdatePacketFactory.compress_if_needed(PacketWriter.get_packet(
-            OpCode.SMSG_UPDATE_OBJECT, item.get_object_create_bytes(requester)))
-        return update_packet
+        return item.generate_create_packet(requester)
 
     # noinspection PyMethodMayBeStatic
     def _get_single_item_partial_update_packet(self, item, requester):
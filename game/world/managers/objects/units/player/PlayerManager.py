@@ -330,6 +330,7 @@ class PlayerManager(UnitManager):
         self.get_map().remove_object(self)
 
         self.friends_manager.send_offline_notification()
+        self.friends_manager.unload()
         self.session.save_character()
 
         # Destroy all known objects to self.
@@ -1626,6 +1627,12 @@ class PlayerManager(UnitManager):
         else:
             Logger.warning('Tried to send packet to null session.')
 
+    def enqueue_broadcast_packet(self, data):
+        if self.session:
+            self.session.enqueue_broadcast_packet(data)
+        else:
+            Logger.warning('Tried to send packet to null session.')
+
     def check_swimming_state(self, elapsed):
         if not self.is_alive:
             return
@@ -1910,6 +1917,12 @@ class PlayerManager(UnitManager):
     def _on_relocation(self):
         self.notify_move_in_line_of_sight()
 
+    # override
+    def on_move_in_line_of_sight(self, target):
+        # Player standing still case, let our own relocation notify the moving creature.
+        if not self.pending_relocation and not self.beast_master:
+            self.pending_relocation = True
+
     # override
     def on_cell_change(self):
         self.quest_manager.update_surrounding_quest_status()
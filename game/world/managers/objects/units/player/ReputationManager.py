@@ -19,11 +19,14 @@ class ReputationManager(object):
     def __init__(self, player_mgr):
         self.player_mgr = player_mgr
         self.reputations = {}
+        # Faction id: reaction, kept in sync with standings so reaction lookups don't need to scan reputations.
+        self.reactions_by_faction = {}
 
     def load_reputations(self):
         reputations = RealmDatabaseManager.character_get_reputations(self.player_mgr.player.guid)
         for reputation in reputations:
             self.reputations[reputation.index] = reputation
+            self.reactions_by_faction[reputation.faction] = ReputationManager.reaction_by_standing(reputation.standing)
 
     def send_initialize_factions(self, set_visible=True):
         data = bytearray(pack('<I', CLIENT_MAX))
@@ -95,6 +98,7 @@ class ReputationManager(object):
         # Notify only if there was an actual change.
         if new_standing != self.reputations[faction.index].standing:
             self.reputations[faction.index].standing = new_standing
+            self.reactions_by_faction[faction.faction] = ReputationManager.reaction_by_standing(new_standing)
             RealmDatabaseManager.character_update_reputation(self.reputations[faction.index])
 
             # Notify the client
@@ -113,10 +117,7 @@ class ReputationManager(object):
         return ReputationFlag.HIDDEN.value
 
     def get_reaction_for_faction(self, faction):
-        for index, reputation in self.reputations.items():
-            if reputation.faction == faction:
-                return ReputationManager.reaction_by_standing(reputation.standing)
-        return UnitReaction.UNIT_REACTION_NEUTRAL
+        return self.reactions_by_faction.get(faction, UnitReaction.UNIT_REACTION_NEUTRAL)
 
     @staticmethod
     def faction_has_reputation(faction):
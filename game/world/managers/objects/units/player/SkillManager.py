@@ -236,6 +236,11 @@ class SkillManager(object):
         # Used to determine which talents should be excluded from the player (ie. 2H talents from rogues).
         self.full_proficiency_masks = {}
 
+        # Spell id: (skill, skill line ability). Only depends on race and class, filled as spells are resolved.
+        self.skill_lines_by_spell = {}
+        # (Skill id, skill value, max skill value): base chance of a weapon or spell skill gain.
+        self.offense_gain_chances = {}
+
     def load_skills(self):
         for skill in RealmDatabaseManager.character_get_skills(self.player_mgr.guid):
             self.skills[skill.skill] = skill
@@ -460,16 +465,7 @@ class SkillManager(object):
         if current_unmodified_skill >= maximum_skill:
             return False
 
-        # Magic values from VMaNGOS.
-        if maximum_skill * 0.9 > current_unmodified_skill:
-            chance = (maximum_skill * 0.9 * 0.5) / current_unmodified_skill
-        else:
-            level_modifier = self.get_max_rank(skill_id, level=config.Unit.Player.Defaults.max_level) / maximum_skill
-
-            chance = 0.5 - level_modifier * (0.0168966 * current_unmodified_skill - 0.0152069 * maximum_skill)
-            skill_diff_from_max = maximum_skill - current_unmodified_skill
-            if skill_diff_from_max <= 3:
-                chance *= (0.5 / (4 - skill_diff_from_max))
+        chance = self._get_offense_skill_gain_chance(skill_id, current_unmodified_skill, maximum_skill)
 
         # Can't find information in patch notes on intellect affecting skill gain, but it's implemented in VMaNGOS.
         chance += self.player_mgr.stat_manager.get_intellect_stat_gain_chance_bonus()
@@ -482,6 +478,27 @@ class SkillManager(object):
         self.build_update()
         return True
 
+    # Checked on every swing and spell cast, the curve only depends on the skill values so each point is cached.
+    def _get_offense_skill_gain_chance(self, skill_id, current_unmodified_skill, maximum_skill):
+        key = (skill_id, current_unmodified_skill, maximum_skill)
+        chance = self.offense_gain_chances.get(key)
+        if chance is not None:
+            return chance
+
+        # Magic values from VMaNGOS.
+        if maximum_skill * 0.9 > current_unmodified_skill:
+            chance = (maximum_skill * 0.9 * 0.5) / current_unmodified_skill
+        else:
+            level_modifier = self.get_max_rank(skill_id, level=config.Unit.Player.Defaults.max_level) / maximum_skill
+
+            chance = 0.5 - level_modifier * (0.0168966 * current_unmodified_skill - 0.0152069 * maximum_skill)
+            skill_diff_from_max = maximum_skill - current_unmodified_skill
+            if skill_diff_from_max <= 3:
+                chance *= (0.5 / (4 - skill_diff_from_max))
+
+        self.offense_gain_chances[key] = chance
+        return chance
+
     def handle_profession_skill_gain(self, spell_id):
         skill_gain_factor = 1
 
@@ -556,9 +573,7 @@ class SkillManager(object):
         return skill, skill_line_ability
 
     def get_skill_info_for_spell_id(self, spell_id):
-        race = self.player_mgr.race
-        class_ = self.player_mgr.class_
-        skill, skill_line_ability = SkillManager.get_skill_and_skill_line_for_spell_id(spell_id, race, class_)
+        skill, skill_line_ability = self._get_skill_line_for_spell_id(spell_id)
 
         if not skill:
             return None, None, None
@@ -761,11 +776,16 @@ class SkillManager(object):
         return spells
 
     def get_skill_for_spell_id(self, spell_id):
-        skill_line_ability = DbcDatabaseManager.SkillLineAbilityHolder.skill_line_ability_get_by_spell_race_and_class(
-            spell_id, self.player_mgr.race, self.player_mgr.class_)
-        if not skill_line_ability or not skill_line_ability.SkillLine:
-            return None
-        return DbcDatabaseManager.SkillHolder.skill_get_by_id(skill_line_ability.SkillLine)
+        skill, _ = self._get_skill_line_for_spell_id(spell_id)
+        return skill if skill else None
+
+    def _get_skill_line_for_spell_id(self, spell_id):
+        skill_line = self.skill_lines_by_spell.get(spell_id)
+        if not skill_line:
+            skill_line = SkillManager.get_skill_and_skill_line_for_spell_id(spell_id, self.player_mgr.race,
+                                                                            self.player_mgr.class_)
+            self.skill_lines_by_spell[spell_id] = skill_line
+        return skill_line
 
     def get_max_rank(self, skill_id, level=-1):
         skill = DbcDatabaseManager.SkillHolder.skill_get_by_id(skill_id)
@@ -373,6 +373,52 @@ class StatManager(object):
 
         return hp_diff, mana_diff
 
+    # Incremental counterpart of apply_bonuses() for aura stat bonus changes.
+    # Item stats can't change through these bonuses, so only values derived from the given stats are recalculated.
+    def apply_bonuses_for_stats(self, stat_types: UnitStats):
+        if self.unit_mgr.get_type_id() == ObjectTypeIds.ID_PLAYER and not self.unit_mgr.online:
+            return
+
+        attributes_changed = stat_types & ATTACK_POWER_ATTRIBUTES
+        if attributes_changed:
+            self.update_attack_base_damage(attack_type=AttackTypes.BASE_ATTACK)
+            if self.unit_mgr.has_offhand_weapon():
+                self.update_attack_base_damage(attack_type=AttackTypes.OFFHAND_ATTACK)
+            if self.unit_mgr.has_ranged_weapon():
+                self.update_attack_base_damage(attack_type=AttackTypes.RANGED_ATTACK)
+
+        if stat_types & SPEED_STATS:
+            self.unit_mgr.change_speed(self.get_base_stat(UnitStats.SPEED_RUNNING))
+
+        if stat_types & (UnitStats.STAMINA | UnitStats.HEALTH):
+            self.update_max_health()
+        if stat_types & (UnitStats.INTELLECT | UnitStats.MANA):
+            self.update_max_mana()
+
+        if stat_types & UnitStats.SPIRIT:
+            self.update_base_mana_regen()
+            self.update_base_health_regen()
+
+        if attributes_changed:
+            self.update_defense_bonuses()
+
+        if stat_types & UnitStats.ALL_ATTRIBUTES:
+            self.send_attributes()
+        if attributes_changed or stat_types & MELEE_ATTRIBUTE_STATS:
+            self.send_melee_attributes()
+        if stat_types & (UnitStats.DAMAGE_DONE_SCHOOL | UnitStats.DAMAGE_DONE_WEAPON):
+            self.send_damage_bonuses()
+        if stat_types & (UnitStats.RESISTANCE_PHYSICAL | UnitStats.ALL_RESISTANCES):
+            self.send_resistances()
+        # Defense skill bonuses affect the displayed percentages.
+        if attributes_changed or stat_types & (DEFENSE_STATS | UnitStats.SKILL):
+            self.send_defense_bonuses()
+        if stat_types & UnitStats.SPELL_CASTING_SPEED:
+            self.send_cast_time_mods()
+
+        if stat_types & UnitStats.SKILL and self.unit_mgr.get_type_id() == ObjectTypeIds.ID_PLAYER:
+            self.unit_mgr.skill_manager.build_update()
+
     def apply_bonuses_for_value(self, value: int, stat_type: UnitStats, misc_value=-1, misc_value_is_mask=False):
         flat = self.get_aura_stat_bonus(stat_type, misc_value=misc_value, misc_value_is_mask=misc_value_is_mask)
         percentual = self.get_aura_stat_bonus(stat_type, percentual=True, misc_value=misc_value, misc_value_is_mask=misc_value_is_mask)
@@ -385,15 +431,16 @@ class StatManager(object):
         else:
             self.aura_stats_flat[index] = (stat_type, amount, misc_value)
 
-        self.apply_bonuses()
+        self.apply_bonuses_for_stats(stat_type)
 
     def remove_aura_stat_bonus(self, index: int, percentual=False):
         if percentual:
-            self.aura_stats_percentual.pop(index, None)
+            stat_bonus = self.aura_stats_percentual.pop(index, None)
         else:
-            self.aura_stats_flat.pop(index, None)
+            stat_bonus = self.aura_stats_flat.pop(index, None)
 
-        self.apply_bonuses()
+        if stat_bonus:
+            self.apply_bonuses_for_stats(stat_bonus[0])
 
     def get_aura_stat_bonus(self, stat_type: UnitStats, percentual=False, misc_value=-1, misc_value_is_mask=False):
         if percentual:
@@ -1400,6 +1447,14 @@ INVENTORY_STAT_TO_UNIT_STAT = {
     InventoryStats.STAMINA: UnitStats.STAMINA
 }
 
+# Inputs of derived values recalculated by apply_bonuses_for_stats().
+# Base weapon damage and defense chances scale off strength and agility.
+ATTACK_POWER_ATTRIBUTES = UnitStats.STRENGTH | UnitStats.AGILITY
+SPEED_STATS = UnitStats.SPEED_RUNNING | UnitStats.SPEED_MOUNTED
+MELEE_ATTRIBUTE_STATS = UnitStats.MAIN_HAND_DAMAGE_MIN | UnitStats.MAIN_HAND_DAMAGE_MAX | UnitStats.MAIN_HAND_DELAY | \
+    UnitStats.OFF_HAND_DELAY
+DEFENSE_STATS = UnitStats.BLOCK_CHANCE | UnitStats.PARRY_CHANCE | UnitStats.DODGE_CHANCE
+
 NON_STACKING_STATS = {
     UnitStats.SPELL_CASTING_SPEED
 }
@@ -1,11 +1,14 @@
+import traceback
 from datetime import datetime
 from struct import pack
+from threading import RLock
 
 from database.realm.RealmDatabaseManager import RealmDatabaseManager, Guild, GuildMember
 from game.world.WorldSessionStateHandler import WorldSessionStateHandler
 from game.world.managers.objects.units.player.guild.GuildPendingInvite import GuildPendingInvite
 from network.packet.PacketWriter import PacketWriter
 from utils.ConfigManager import config
+from utils.Logger import Logger
 from utils.TextUtils import TextChecker
 from utils.constants.MiscCodes import GuildRank, GuildCommandResults, GuildTypeCommand, GuildEvents, \
     GuildChatMessageTypes, GuildEmblemResult
@@ -21,6 +24,14 @@ class GuildManager(object):
         self.guild: Guild = guild
         self.members = {}
         self.guild_master = None
+        # Rank and guild changes are kept in memory and written in a single transaction by flush().
+        self.dirty_members = set()  # Guids.
+        self.guild_dirty = False
+        self.flush_lock = RLock()
+        # Cached packets, reset when their contents change.
+        self.query_packet = None
+        self.roster_packet = None
+        self.accounts_count = -1
 
     def load_guild_members(self):
         members = RealmDatabaseManager.guild_get_members(self.guild)
@@ -61,21 +72,42 @@ class GuildManager(object):
             packet = PacketWriter.get_packet(OpCode.SMSG_GUILD_EVENT, data)
             self.send_message_to_guild(packet, GuildChatMessageTypes.G_MSGTYPE_ALL)
 
-        self.update_db_guild_members()
+        self.set_member_dirty(member)
+        self.set_member_dirty(previous_gm)
+        # Write the leader change right away, character deletion checks guild master status from the database.
+        self.flush()
         player_mgr = WorldSessionStateHandler.find_player_by_guid(player_guid)
         if player_mgr:
             player_mgr.set_uint32(PlayerFields.PLAYER_GUILDRANK, member.rank)
 
-    def update_db_guild_members(self):
-        for member in self.members.values():
-            RealmDatabaseManager.guild_update_member(member)
-
-    def update_db_guild(self):
-        RealmDatabaseManager.guild_update(self.guild)
+    def set_member_dirty(self, member):
+        with self.flush_lock:
+            self.dirty_members.add(member.guid)
+        self.roster_packet = None
+
+    def set_guild_dirty(self):
+        with self.flush_lock:
+            self.guild_dirty = True
+
+    # Writes pending guild and member changes, if any, in a single transaction.
+    def flush(self):
+        with self.flush_lock:
+            if not self.guild_dirty and not self.dirty_members:
+                return
+            guild = self.guild if self.guild_dirty else None
+            members = [self.members[guid] for guid in self.dirty_members if guid in self.members]
+            # Keep pending changes until they are committed, so a failed save is retried on the next flush.
+            try:
+                RealmDatabaseManager.guild_save(guild, members)
+            except Exception:
+                Logger.error(f'Unable to save guild {self.guild.name}: {traceback.format_exc()}')
+                return
+            self.guild_dirty = False
+            self.dirty_members.clear()
 
     def set_motd(self, motd):
         self.guild.motd = motd
-        self.update_db_guild()
+        self.set_guild_dirty()
         self.send_motd()
 
     def send_motd(self, player_mgr=None):
@@ -97,6 +129,7 @@ class GuildManager(object):
         rank = GuildRank.GUILDRANK_INITIATE
         guild_member = self._create_new_member(character.guid, rank)
         self.members[character.guid] = guild_member
+        self._reset_roster()
 
         data = pack('<2B', GuildEvents.GUILD_EVENT_JOINED, 1)
         name_bytes = PacketWriter.string_to_bytes(character.name)
@@ -112,6 +145,7 @@ class GuildManager(object):
 
         player_mgr.guild_manager = self
         self.members[player_mgr.guid] = guild_member
+        self._reset_roster()
 
         data = pack('<2B', GuildEvents.GUILD_EVENT_JOINED, 1)
         name_bytes = PacketWriter.string_to_bytes(player_mgr.get_name())
@@ -144,9 +178,8 @@ class GuildManager(object):
         self.send_message_to_guild(packet, GuildChatMessageTypes.G_MSGTYPE_ALL)
 
         # Pop it at the end, so he gets the above message.
-        RealmDatabaseManager.guild_remove_member(member)
+        self._remove_member(member)
         player_mgr = WorldSessionStateHandler.find_player_by_guid(player_guid)
-        self.members.pop(player_guid)
 
         if player_mgr:
             self.build_update(player_mgr, unset=True)
@@ -165,8 +198,7 @@ class GuildManager(object):
         packet = PacketWriter.get_packet(OpCode.SMSG_GUILD_EVENT, data)
         self.send_message_to_guild(packet, GuildChatMessageTypes.G_MSGTYPE_ALL)
 
-        RealmDatabaseManager.guild_remove_member(member)
-        self.members.pop(player_guid)
+        self._remove_member(member)
         player_mgr = WorldSessionStateHandler.find_player_by_guid(player_guid)
         if player_mgr:
             self.build_update(player_mgr, unset=True)
@@ -190,8 +222,12 @@ class GuildManager(object):
                 player_mgr.guild_manager = None
 
         GuildManager.GUILDS.pop(self.guild.name)
-        self.members.clear()
-        RealmDatabaseManager.guild_destroy(self.guild)
+        with self.flush_lock:
+            self.guild_dirty = False
+            self.dirty_members.clear()
+            self.members.clear()
+            self._reset_roster()
+            RealmDatabaseManager.guild_destroy(self.guild)
 
     def send_message_to_guild(self, packet, msg_type=None, source=None, exclude=None):
         for member in self.members.values():
@@ -248,7 +284,7 @@ class GuildManager(object):
         if player_mgr:
             player_mgr.set_uint32(PlayerFields.PLAYER_GUILDRANK, member.rank)
 
-        self.update_db_guild_members()
+        self.set_member_dirty(member)
         return True
 
     def demote_rank(self, player_guid):
@@ -282,7 +318,7 @@ class GuildManager(object):
         if player_mgr:
             player_mgr.set_uint32(PlayerFields.PLAYER_GUILDRANK, member.rank)
 
-        self.update_db_guild_members()
+        self.set_member_dirty(member)
         return True
 
     def has_members(self, ignore_gm=True):
@@ -311,7 +347,8 @@ class GuildManager(object):
         self.guild.border_style = border_style
         self.guild.border_color = border_color
         self.guild.background_color = background_color
-        self.update_db_guild()
+        self.query_packet = None
+        self.set_guild_dirty()
 
         GuildManager.send_emblem_result(player_mgr, GuildEmblemResult.ERR_GUILDEMBLEM_SUCCESS)
 
@@ -319,6 +356,9 @@ class GuildManager(object):
         player_mgr.get_map().send_surrounding(query_packet, player_mgr, include_self=True)
 
     def build_guild_query(self):
+        if self.query_packet:
+            return self.query_packet
+
         data = pack('<I', self.guild.guild_id)
 
         name_bytes = PacketWriter.string_to_bytes(self.guild.name)
@@ -331,7 +371,50 @@ class GuildManager(object):
                      self.guild.border_color,
                      self.guild.background_color)
 
-        return PacketWriter.get_packet(OpCode.SMSG_GUILD_QUERY_RESPONSE, data)
+        self.query_packet = PacketWriter.get_packet(OpCode.SMSG_GUILD_QUERY_RESPONSE, data)
+        return self.query_packet
+
+    def build_guild_roster(self):
+        if self.roster_packet:
+            return self.roster_packet
+
+        guild_name = PacketWriter.string_to_bytes(self.guild.name)
+        data = pack(
+            f'<{len(guild_name)}s',
+            guild_name
+        )
+
+        # Members count
+        data += pack('<2I', len(self.members), self.get_accounts_count())
+
+        for member in list(self.members.values()):
+            player_name = PacketWriter.string_to_bytes(member.character.name)
+            data += pack(
+                f'<{len(player_name)}sI',
+                player_name,
+                member.rank
+            )
+
+        self.roster_packet = PacketWriter.get_packet(OpCode.SMSG_GUILD_ROSTER, data)
+        return self.roster_packet
+
+    # Distinct accounts among guild members, only queried again after membership changes.
+    def get_accounts_count(self):
+        if self.accounts_count < 0:
+            self.accounts_count = len(RealmDatabaseManager.guild_get_accounts(guild_id=self.guild.guild_id))
+        return self.accounts_count
+
+    def _reset_roster(self):
+        self.roster_packet = None
+        self.accounts_count = -1
+
+    def _remove_member(self, member):
+        # Hold the flush lock so a pending flush can't write this member back after it's deleted.
+        with self.flush_lock:
+            self.dirty_members.discard(member.guid)
+            RealmDatabaseManager.guild_remove_member(member)
+            self.members.pop(member.guid)
+            self._reset_roster()
 
     def _create_new_member(self, player_guid, rank):
         member = GuildMember()
@@ -351,6 +434,11 @@ class GuildManager(object):
         packet = PacketWriter.get_packet(OpCode.MSG_SAVE_GUILD_EMBLEM, data)
         player_mgr.enqueue_packet(packet)
 
+    @staticmethod
+    def flush_guilds():
+        for guild_manager in list(GuildManager.GUILDS.values()):
+            guild_manager.flush()
+
     @staticmethod
     def load_guild(raw_guild):
         guild = GuildManager(raw_guild)
@@ -156,13 +156,4 @@ class TaxiManager(object):
 
     @staticmethod
     def get_nearest_taxi_node(player_mgr):
-        taxi_nodes = DbcDatabaseManager.TaxiNodesHolder.taxi_nodes_get_by_map_id(player_mgr.map_id)
-        last_near_distance = -1
-        last_near_taxi_node_id = -1
-        for taxi_node_id, taxi_node in taxi_nodes:
-            distance = player_mgr.location.distance(x=taxi_node.X, y=taxi_node.Y, z=taxi_node.Z)
-            if distance < last_near_distance or last_near_distance == -1:
-                last_near_distance = distance
-                last_near_taxi_node_id = taxi_node_id
-
-        return last_near_taxi_node_id
+        return DbcDatabaseManager.TaxiNodesHolder.taxi_node_get_nearest_id(player_mgr.map_id, player_mgr.location)
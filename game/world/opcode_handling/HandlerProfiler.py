@@ -0,0 +1,156 @@
+import json
+from bisect import bisect_left
+from datetime import datetime
+from os import path
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+
+from utils.ConfigManager import config
+from utils.Logger import Logger
+from utils.constants.OpCodes import OpCode
+
+# Upper bounds (seconds) of the latency histogram buckets, from 25us up to ~3.2s. Last bucket is unbounded.
+LATENCY_BUCKETS = [0.000025 * (2 ** i) for i in range(18)]
+
+
+class HandlerStats:
+    def __init__(self, opcode, handler_name):
+        self.opcode = opcode
+        self.handler_name = handler_name
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, elapsed, error):
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if error:
+            self.errors += 1
+        self.histogram[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.errors += other.errors
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+
+    def get_average(self):
+        return self.total_time / self.calls if self.calls else 0.0
+
+    # Estimated from the histogram, returns the upper bound of the bucket holding the given percentile.
+    def get_percentile(self, percentile):
+        if not self.calls:
+            return 0.0
+        threshold = self.calls * percentile / 100
+        accumulated = 0
+        for index, count in enumerate(self.histogram):
+            accumulated += count
+            if accumulated >= threshold:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max_time
+        return self.max_time
+
+    def to_dict(self):
+        return {
+            'opcode': self.opcode,
+            'handler': self.handler_name,
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_ms': round(self.total_time * 1000, 3),
+            'avg_ms': round(self.get_average() * 1000, 3),
+            'p50_ms': round(self.get_percentile(50) * 1000, 3),
+            'p95_ms': round(self.get_percentile(95) * 1000, 3),
+            'p99_ms': round(self.get_percentile(99) * 1000, 3),
+            'max_ms': round(self.max_time * 1000, 3)
+        }
+
+
+class HandlerProfiler:
+    PROFILING_PATH = config.Server.Logging.log_profiling_path
+    PROFILING_FILE_NAME = 'handlers.json'
+
+    PROFILING_FULL_PATH = path.join(PROFILING_PATH, PROFILING_FILE_NAME)
+
+    # Checked by the session before each dispatch, so a disabled profiler costs a single attribute lookup.
+    enabled = config.Server.Logging.profile_handlers
+    started = datetime.now()
+
+    _stats: dict[int, HandlerStats] = {}
+    _lock = Lock()
+
+    @staticmethod
+    def profile(handler, world_session, reader):
+        error = True
+        start = perf_counter()
+        try:
+            res = handler(world_session, reader)
+            error = False
+            return res
+        finally:
+            HandlerProfiler._record(reader.opcode, handler, perf_counter() - start, error)
+
+    @staticmethod
+    def _record(opcode, handler, elapsed, error):
+        with HandlerProfiler._lock:
+            stats = HandlerProfiler._stats.get(opcode)
+            if not stats:
+                stats = HandlerProfiler._stats[opcode] = HandlerStats(HandlerProfiler._get_opcode_name(opcode),
+                                                                      handler.__qualname__)
+            stats.record(elapsed, error)
+
+    @staticmethod
+    def set_enabled(enabled):
+        HandlerProfiler.enabled = enabled
+
+    @staticmethod
+    def reset():
+        with HandlerProfiler._lock:
+            HandlerProfiler._stats = {}
+            HandlerProfiler.started = datetime.now()
+
+    @staticmethod
+    def get_opcode_stats():
+        with HandlerProfiler._lock:
+            return sorted(HandlerProfiler._stats.values(), key=lambda stats: stats.total_time, reverse=True)
+
+    # Aggregates opcode stats by the handler serving them, e.g. all MSG_MOVE_* opcodes.
+    @staticmethod
+    def get_handler_stats():
+        handlers = {}
+        for opcode_stats in HandlerProfiler.get_opcode_stats():
+            handler_stats = handlers.get(opcode_stats.handler_name)
+            if not handler_stats:
+                handler_stats = handlers[opcode_stats.handler_name] = HandlerStats('', opcode_stats.handler_name)
+            handler_stats.merge(opcode_stats)
+        return sorted(handlers.values(), key=lambda stats: stats.total_time, reverse=True)
+
+    @staticmethod
+    def dump():
+        opcode_stats = HandlerProfiler.get_opcode_stats()
+        if not opcode_stats:
+            return
+
+        try:
+            Path(HandlerProfiler.PROFILING_PATH).mkdir(parents=True, exist_ok=True)
+            report = {
+                'since': HandlerProfiler.started.isoformat(),
+                'dumped': datetime.now().isoformat(),
+                'opcodes': [stats.to_dict() for stats in opcode_stats],
+                'handlers': [stats.to_dict() for stats in HandlerProfiler.get_handler_stats()]
+            }
+            with open(HandlerProfiler.PROFILING_FULL_PATH, 'w') as dump_file:
+                json.dump(report, dump_file, indent=2)
+        except OSError as e:
+            Logger.warning(f'[HandlerProfiler] Unable to write {HandlerProfiler.PROFILING_FULL_PATH}: {e}')
+
+    @staticmethod
+    def _get_opcode_name(opcode):
+        try:
+            return OpCode(opcode).name
+        except ValueError:
+            return str(opcode)
@@ -1,7 +1,9 @@
+import time
 from struct import error
 from game.world.opcode_handling.HandlerValidator import HandlerValidator
 from network.packet.PacketReader import *
 from network.packet.PacketWriter import *
+from utils.ConfigManager import config
 from utils.Logger import Logger
 from utils.constants.OpCodes import OpCode
 from utils.constants.UnitCodes import StandState
@@ -50,9 +52,25 @@ class MovementHandler:
 
                 # Broadcast unit mover movement to surroundings.
                 movement_packet = PacketWriter.get_packet(OpCode(reader.opcode), move_info.get_bytes())
-                player_mgr.get_map().send_surrounding(movement_packet, unit_mover, include_self=False)
+                MovementHandler._broadcast_movement(player_mgr.get_map(), unit_mover, reader.opcode, movement_packet)
 
             except (AttributeError, error):
                 Logger.error(f'Error while handling {reader.opcode_str()}, skipping. Data: {reader.data}')
 
         return 0
+
+    @staticmethod
+    def _broadcast_movement(map_, unit_mover, opcode, movement_packet):
+        near_dist = config.World.Gameplay.movement_near_dist
+        # Movement changes are sent to every observer, heartbeats are only sent at full rate to near observers.
+        if opcode != OpCode.MSG_MOVE_HEARTBEAT or near_dist >= config.World.Gameplay.update_dist:
+            map_.send_surrounding(movement_packet, unit_mover, include_self=False)
+            return
+
+        range_ = near_dist
+        now = time.time()
+        move_info = unit_mover.movement_info
+        if now - move_info.last_mid_heartbeat_timestamp >= config.World.Gameplay.movement_mid_heartbeat_interval:
+            move_info.last_mid_heartbeat_timestamp = now
+            range_ = config.World.Gameplay.movement_mid_dist
+        map_.send_surrounding_in_range(movement_packet, unit_mover, range_, include_self=False)
@@ -8,6 +8,7 @@ from game.realm.RealmManager import RealmManager
 from game.world import WorldManager
 from game.world.managers.maps.MapManager import MapManager
 from game.world.managers.maps.MapTile import MapTile
+from tools.load_test.LoadTest import LoadTest
 from tools.map_extractor.MapExtractor import MapExtractor
 from utils.ConfigManager import config, ConfigManager
 from utils.Logger import Logger
@@ -32,6 +33,13 @@ parser.add_argument(
     action='store_true',
     default=False
 )
+parser.add_argument(
+    '-b', '--bots',
+    help='-b in order to run the load test bots against a running world server',
+    dest='bots',
+    action='store_true',
+    default=False
+)
 args = parser.parse_args()
 
 
@@ -64,6 +72,10 @@ if __name__ == '__main__':
         MapExtractor.run()
         exit()
 
+    if args.bots:
+        LoadTest.run()
+        exit()
+
     # Validate if maps available and if version match.
     if not MapManager.validate_maps():
         Logger.error(f'Invalid maps version or maps missing, expected version {MapTile.EXPECTED_VERSION}')
@@ -20,6 +20,7 @@ class UpdatePacketFactory(object):
         self.update_values_bytes = []  # Values bytes representation, used for update packets.
         self.update_values = []  # Raw values, used to compare current vs new without having to pack or unpack.
         self.update_mask = UpdateMask()
+        self.fields_version = 0  # Increased on every field change, used to invalidate cached encoded fields.
 
     def init_values(self, owner_guid, fields_type):
         self.owner_guid = owner_guid
@@ -135,6 +136,7 @@ class UpdatePacketFactory(object):
             self.update(index + 1, int(value >> 32), 'I')
         else:
             self.update_timestamps[index] = time.time()
+            self.fields_version += 1
             self.update_values[index] = value
             self.update_values_bytes[index] = pack(f'<{value_type}', value)
             self.update_mask.set_bit(index)
@@ -0,0 +1,315 @@
+import math
+import random
+import socket
+import string
+import threading
+from struct import pack, unpack
+from time import perf_counter
+
+from network.packet.PacketWriter import PacketWriter
+from utils.Logger import Logger
+from utils.constants.AuthCodes import AuthCode
+from utils.constants.CharCodes import CharCreate
+from utils.constants.MiscCodes import ChatMsgs, Languages, HighGuid, MoveFlags
+from utils.constants.OpCodes import OpCode
+from utils.constants.SpellCodes import SpellTargetMask
+
+HEADER_SIZE = 6
+# Seconds to wait for any server response during the login sequence.
+RESPONSE_TIMEOUT = 15
+# Seconds between MSG_MOVE_HEARTBEAT while walking, the client sends them every 500ms.
+HEARTBEAT_INTERVAL = 0.5
+CHAT_LINES = ['Hello there!', 'Anyone up for a group?', 'Where is the mailbox?', 'Selling linen cloth.', 'lol']
+
+
+class BotClient:
+    def __init__(self, index, settings, stats):
+        self.index = index
+        self.settings = settings
+        self.stats = stats
+        self.username = f'{settings.account_prefix}{index}'
+        self.character_name = BotClient.get_character_name(settings.character_prefix, index)
+
+        self.socket = None
+        self.online = False
+        self.send_lock = threading.Lock()
+        self.receive_thread = None
+        # Opcode: Event, set when the opcode is received during the login sequence.
+        self.waiting = {}
+        # Opcode: last payload received for waited opcodes.
+        self.responses = {}
+
+        self.guid = 0
+        self.map_id = 0
+        self.x = self.y = self.z = self.o = 0.0
+        self.home = (0.0, 0.0, 0.0)
+        self.move_flags = MoveFlags.MOVEFLAG_NONE
+        # Guids of creatures seen moving around the bot, used as attack targets.
+        self.known_creatures = set()
+        # Guids of players seen moving around the bot, used for name queries.
+        self.known_players = set()
+        self.pending_pings = {}
+        self.ping_sequence = 0
+
+    # Character names must be 3 to 12 letters, so bot indexes are encoded in base 26.
+    @staticmethod
+    def get_character_name(prefix, index):
+        suffix = ''
+        while True:
+            index, remainder = divmod(index, 26)
+            suffix = string.ascii_lowercase[remainder] + suffix
+            if not index:
+                break
+        return (prefix + suffix.rjust(3, 'a'))[:12].capitalize()
+
+    def run(self, stop_event):
+        try:
+            start = perf_counter()
+            if not self.login():
+                self.stats.on_failure()
+                return
+            self.stats.on_login(perf_counter() - start)
+            self.play(stop_event)
+        except (OSError, ConnectionError) as e:
+            Logger.warning(f'[LoadTest] Bot {self.username} connection error: {e}')
+            self.stats.on_disconnect()
+        finally:
+            self.disconnect()
+
+    # Login sequence.
+
+    def login(self):
+        self.socket = socket.create_connection((self.settings.host, self.settings.port), timeout=RESPONSE_TIMEOUT)
+        self.online = True
+
+        # The auth challenge is read synchronously, the receive thread starts afterwards.
+        header = self._receive_all(HEADER_SIZE)
+        size, opcode = BotClient.read_header(header)
+        self._receive_all(size - 4)
+        if opcode != OpCode.SMSG_AUTH_CHALLENGE:
+            Logger.error(f'[LoadTest] Bot {self.username} expected auth challenge, got {opcode}.')
+            return False
+
+        self.socket.settimeout(None)
+        self.receive_thread = threading.Thread(target=self.receive_loop)
+        self.receive_thread.daemon = True
+        self.receive_thread.start()
+
+        credentials = PacketWriter.string_to_bytes(f'{self.username} {self.settings.password}')
+        data = self.send_and_wait(OpCode.CMSG_AUTH_SESSION, pack('<2I', self.settings.client_build, 0) + credentials,
+                                  OpCode.SMSG_AUTH_RESPONSE)
+        if data is None or data[0] != AuthCode.AUTH_OK:
+            Logger.error(f'[LoadTest] Bot {self.username} authentication failed.')
+            return False
+
+        if not self.select_character():
+            Logger.error(f'[LoadTest] Bot {self.username} unable to get a character.')
+            return False
+
+        data = self.send_and_wait(OpCode.CMSG_PLAYER_LOGIN, pack('<Q', self.guid), OpCode.SMSG_LOGIN_SETTIMESPEED,
+                                  fail_opcode=OpCode.SMSG_CHARACTER_LOGIN_FAILED)
+        if data is None:
+            Logger.error(f'[LoadTest] Bot {self.username} failed to enter world.')
+            return False
+
+        self.teleport_to_area()
+        self.home = (self.x, self.y, self.z)
+        return True
+
+    def select_character(self):
+        data = self.send_and_wait(OpCode.CMSG_CHAR_ENUM, b'', OpCode.SMSG_CHAR_ENUM)
+        if data is None:
+            return False
+
+        if data[0] == 0:
+            data = self.send_and_wait(OpCode.CMSG_CHAR_CREATE,
+                                      PacketWriter.string_to_bytes(self.character_name) +
+                                      pack('<9B', self.settings.race, self.settings.class_, 0, 0, 0, 0, 0, 0, 0),
+                                      OpCode.SMSG_CHAR_CREATE)
+            if data is None or data[0] != CharCreate.CHAR_CREATE_SUCCESS:
+                return False
+            data = self.send_and_wait(OpCode.CMSG_CHAR_ENUM, b'', OpCode.SMSG_CHAR_ENUM)
+            if data is None or data[0] == 0:
+                return False
+
+        # First character: guid, name, 9 bytes of appearance and level, zone, map and position.
+        self.guid = unpack('<Q', data[1:9])[0]
+        name_end = data.index(b'\x00', 9)
+        zone, self.map_id, self.x, self.y, self.z = unpack('<2I3f', data[name_end + 10:name_end + 30])
+        return True
+
+    # GM accounts can be moved to the configured area through CMSG_WORLD_TELEPORT.
+    def teleport_to_area(self):
+        area = self.settings.Area
+        if not area.teleport:
+            return
+        x = area.x + random.uniform(-area.spread, area.spread)
+        y = area.y + random.uniform(-area.spread, area.spread)
+        # Same map teleports answer with MSG_MOVE_TELEPORT_ACK, others with SMSG_NEW_WORLD. Both are acknowledged by
+        # handle_packet, which also updates our position.
+        self.send_and_wait(OpCode.CMSG_WORLD_TELEPORT, pack('<IB4f', 0, area.map_id, x, y, area.z, 0.0),
+                           OpCode.MSG_MOVE_TELEPORT_ACK, fail_opcode=OpCode.SMSG_NEW_WORLD)
+        if self.map_id != area.map_id or math.hypot(self.x - x, self.y - y) > 1.0:
+            Logger.warning(f'[LoadTest] Bot {self.username} was not teleported, is the account a GM?')
+
+    # Behavior.
+
+    def play(self, stop_event):
+        next_chat = perf_counter() + random.uniform(0, self.settings.chat_interval_seconds)
+        next_ping = perf_counter()
+        while not stop_event.is_set() and self.online:
+            now = perf_counter()
+            if now >= next_ping:
+                self.ping()
+                next_ping = now + self.settings.ping_interval_seconds
+            if now >= next_chat:
+                self.chat()
+                next_chat = now + self.settings.chat_interval_seconds
+
+            roll = random.random()
+            if roll < self.settings.fight_chance and self.known_creatures:
+                self.fight(stop_event)
+            elif roll < self.settings.fight_chance + self.settings.cast_chance and self.settings.cast_spell_id:
+                self.cast_self()
+                stop_event.wait(2.0)
+            else:
+                self.wander(stop_event)
+            self.query_names()
+
+    def wander(self, stop_event):
+        radius = self.settings.Area.wander_radius
+        target_x = self.home[0] + random.uniform(-radius, radius)
+        target_y = self.home[1] + random.uniform(-radius, radius)
+        distance = math.hypot(target_x - self.x, target_y - self.y)
+        if distance < 1.0:
+            return
+
+        self.o = math.atan2(target_y - self.y, target_x - self.x) % (2 * math.pi)
+        start_x, start_y = self.x, self.y
+        travel_time = distance / self.settings.run_speed
+        self.move_flags = MoveFlags.MOVEFLAG_FORWARD
+        self.send_movement(OpCode.MSG_MOVE_START_FORWARD)
+
+        start = perf_counter()
+        while not stop_event.wait(HEARTBEAT_INTERVAL) and self.online:
+            progress = min(1.0, (perf_counter() - start) / travel_time)
+            self.x = start_x + (target_x - start_x) * progress
+            self.y = start_y + (target_y - start_y) * progress
+            if progress >= 1.0:
+                break
+            self.send_movement(OpCode.MSG_MOVE_HEARTBEAT)
+
+        self.move_flags = MoveFlags.MOVEFLAG_NONE
+        self.send_movement(OpCode.MSG_MOVE_STOP)
+        stop_event.wait(random.uniform(0.5, 3.0))
+
+    def fight(self, stop_event):
+        target_guid = random.choice(list(self.known_creatures))
+        self.send(OpCode.CMSG_SET_SELECTION, pack('<Q', target_guid))
+        self.send(OpCode.CMSG_ATTACKSWING, pack('<Q', target_guid))
+        stop_event.wait(random.uniform(3.0, 8.0))
+        self.send(OpCode.CMSG_ATTACKSTOP)
+        # Creatures come and go, forget this one and wait to see it again.
+        self.known_creatures.discard(target_guid)
+
+    def cast_self(self):
+        self.send(OpCode.CMSG_CAST_SPELL, pack('<IH', self.settings.cast_spell_id, SpellTargetMask.SELF))
+
+    def chat(self):
+        message = PacketWriter.string_to_bytes(random.choice(CHAT_LINES))
+        self.send(OpCode.CMSG_MESSAGECHAT, pack('<2I', ChatMsgs.CHAT_MSG_SAY, Languages.LANG_COMMON) + message)
+
+    def query_names(self):
+        while self.known_players:
+            self.send(OpCode.CMSG_NAME_QUERY, pack('<Q', self.known_players.pop()))
+
+    def ping(self):
+        self.ping_sequence += 1
+        self.pending_pings[self.ping_sequence] = perf_counter()
+        self.send(OpCode.CMSG_PING, pack('<I', self.ping_sequence))
+
+    def send_movement(self, opcode):
+        self.send(opcode, pack('<Q9fI', 0, 0.0, 0.0, 0.0, 0.0, self.x, self.y, self.z, self.o, 0.0, self.move_flags))
+
+    # Network.
+
+    def send(self, opcode, data=b''):
+        packet = PacketWriter.get_packet(opcode, data)
+        with self.send_lock:
+            self.socket.sendall(packet)
+        self.stats.on_packet_out(len(packet))
+
+    def send_and_wait(self, opcode, data, response_opcode, fail_opcode=None):
+        event = self.waiting[response_opcode] = threading.Event()
+        if fail_opcode:
+            self.waiting[fail_opcode] = event
+        self.send(opcode, data)
+        received = event.wait(RESPONSE_TIMEOUT)
+        self.waiting.pop(response_opcode, None)
+        if fail_opcode:
+            self.waiting.pop(fail_opcode, None)
+        if not received:
+            return None
+        # Only the opcode we were waiting for counts as success.
+        return self.responses.pop(response_opcode, None)
+
+    def receive_loop(self):
+        try:
+            while self.online:
+                header = self._receive_all(HEADER_SIZE)
+                size, opcode = BotClient.read_header(header)
+                data = self._receive_all(size - 4)
+                self.stats.on_packet_in(HEADER_SIZE + len(data))
+                self.handle_packet(opcode, bytes(data))
+        except (OSError, ConnectionError):
+            if self.online:
+                self.stats.on_disconnect()
+            self.online = False
+
+    def handle_packet(self, opcode, data):
+        if opcode == OpCode.SMSG_PONG:
+            sent = self.pending_pings.pop(unpack('<I', data[:4])[0], None)
+            if sent:
+                self.stats.on_rtt(perf_counter() - sent)
+        elif opcode == OpCode.SMSG_MONSTER_MOVE:
+            guid = unpack('<Q', data[:8])[0]
+            if guid & HighGuid.HIGHGUID_UNIT == HighGuid.HIGHGUID_UNIT:
+                self.known_creatures.add(guid)
+        elif opcode in (OpCode.MSG_MOVE_START_FORWARD, OpCode.MSG_MOVE_HEARTBEAT, OpCode.MSG_MOVE_STOP):
+            # Other players movement, prefixed with their guid.
+            self.known_players.add(unpack('<Q', data[:8])[0])
+        elif opcode == OpCode.MSG_MOVE_TELEPORT_ACK:
+            self.x, self.y, self.z, self.o = unpack('<4f', data[24:40])
+            self.send(OpCode.MSG_MOVE_TELEPORT_ACK)
+        elif opcode == OpCode.SMSG_NEW_WORLD:
+            self.map_id, self.x, self.y, self.z, self.o = unpack('<B4f', data[:17])
+            self.send(OpCode.MSG_MOVE_WORLDPORT_ACK)
+
+        event = self.waiting.get(opcode)
+        if event:
+            self.responses[opcode] = data
+            event.set()
+
+    # Size is big endian and includes the opcode, opcode is little endian.
+    @staticmethod
+    def read_header(header):
+        return unpack('>H', header[:2])[0], unpack('<I', header[2:6])[0]
+
+    def _receive_all(self, size):
+        buffer = bytearray()
+        while len(buffer) < size:
+            received = self.socket.recv(size - len(buffer))
+            if not received:
+                raise ConnectionError('Connection closed by server.')
+            buffer.extend(received)
+        return buffer
+
+    def disconnect(self):
+        if not self.socket:
+            return
+        self.online = False
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+            self.socket.close()
+        except OSError:
+            pass
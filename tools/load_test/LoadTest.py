@@ -0,0 +1,126 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from tools.load_test.BotClient import BotClient
+from tools.load_test.LoadTestStats import LoadTestStats
+from utils.ConfigManager import config
+from utils.Logger import Logger
+
+TICK_PHASE_LAST_METRIC = 'alpha_tick_phase_last_duration_seconds'
+TICK_PHASE_MAX_METRIC = 'alpha_tick_phase_max_duration_seconds'
+
+
+class LoadTest:
+
+    @staticmethod
+    def run():
+        settings = config.LoadTest.Bots
+        stats = LoadTestStats()
+        stop_event = threading.Event()
+        bot_threads = []
+
+        Logger.info(f'[LoadTest] Launching {settings.count} bots against {settings.host}:{settings.port}, '
+                    f'{settings.spawn_rate} per second.')
+        start = perf_counter()
+        next_report = start + settings.report_interval_seconds
+        try:
+            for index in range(settings.count):
+                bot = BotClient(index, settings, stats)
+                bot_thread = threading.Thread(target=bot.run, args=(stop_event,))
+                bot_thread.daemon = True
+                bot_thread.start()
+                bot_threads.append(bot_thread)
+                stop_event.wait(1.0 / settings.spawn_rate)
+                if perf_counter() >= next_report:
+                    LoadTest.report(stats, perf_counter() - start)
+                    next_report += settings.report_interval_seconds
+
+            end = start + settings.duration_seconds
+            while perf_counter() < end and any(bot_thread.is_alive() for bot_thread in bot_threads):
+                stop_event.wait(min(settings.report_interval_seconds, max(0.0, end - perf_counter())))
+                LoadTest.report(stats, perf_counter() - start)
+        except KeyboardInterrupt:
+            Logger.info('[LoadTest] Interrupted, stopping bots...')
+
+        stop_event.set()
+        for bot_thread in bot_threads:
+            bot_thread.join(timeout=5)
+
+        LoadTest.save_results(stats, perf_counter() - start)
+
+    @staticmethod
+    def report(stats, elapsed):
+        LoadTest.scrape_tick_phases(stats)
+        snapshot = stats.snapshot()
+        rtt = LoadTestStats.summarize(snapshot['rtt_samples'])
+        Logger.info(f'[LoadTest] {elapsed:.0f}s, bots in world: {snapshot["logins"] - snapshot["disconnects"]}, '
+                    f'failures: {snapshot["failures"]}, '
+                    f'in: {snapshot["packets_in"] / elapsed:.0f} pkt/s ({snapshot["bytes_in"] / elapsed / 1024:.1f} '
+                    f'KiB/s), out: {snapshot["packets_out"] / elapsed:.0f} pkt/s, '
+                    f'rtt p50/p95: {rtt["p50_ms"]}/{rtt["p95_ms"]} ms')
+        for phase, (last, max_) in snapshot['tick_phases'].items():
+            Logger.info(f'[LoadTest] Tick {phase}: last {last * 1000:.1f} ms, max {max_ * 1000:.1f} ms')
+
+    # Reads tick phase durations from the world server metrics endpoint, if enabled.
+    @staticmethod
+    def scrape_tick_phases(stats):
+        metrics_url = config.LoadTest.Bots.metrics_url
+        if not metrics_url:
+            return
+
+        try:
+            with urlopen(metrics_url, timeout=2) as response:
+                body = response.read().decode('utf-8')
+        except (URLError, OSError):
+            return
+
+        phases = {}
+        for line in body.splitlines():
+            if not line.startswith((TICK_PHASE_LAST_METRIC, TICK_PHASE_MAX_METRIC)):
+                continue
+            name, value = line.rsplit(' ', 1)
+            phase = name[name.index('"') + 1:name.rindex('"')]
+            values = phases.setdefault(phase, [0.0, 0.0])
+            values[0 if name.startswith(TICK_PHASE_LAST_METRIC) else 1] = float(value)
+
+        for phase, (last, max_) in phases.items():
+            stats.set_tick_phase(phase, last, max_)
+
+    @staticmethod
+    def save_results(stats, elapsed):
+        LoadTest.scrape_tick_phases(stats)
+        snapshot = stats.snapshot()
+        results = {
+            'date': datetime.now().isoformat(),
+            'bots': config.LoadTest.Bots.count,
+            'duration_seconds': round(elapsed, 3),
+            'logins': snapshot['logins'],
+            'failures': snapshot['failures'],
+            'disconnects': snapshot['disconnects'],
+            'packets_in': snapshot['packets_in'],
+            'packets_out': snapshot['packets_out'],
+            'packets_in_per_second': round(snapshot['packets_in'] / elapsed, 3),
+            'packets_out_per_second': round(snapshot['packets_out'] / elapsed, 3),
+            'bytes_in_per_second': round(snapshot['bytes_in'] / elapsed, 3),
+            'bytes_out_per_second': round(snapshot['bytes_out'] / elapsed, 3),
+            'rtt': LoadTestStats.summarize(snapshot['rtt_samples']),
+            'login_time': LoadTestStats.summarize(snapshot['login_samples']),
+            'tick_phases': {phase: {'last_ms': round(last * 1000, 3), 'max_ms': round(max_ * 1000, 3)}
+                            for phase, (last, max_) in snapshot['tick_phases'].items()}
+        }
+
+        results_path = config.LoadTest.Bots.results_path
+        try:
+            Path(results_path).mkdir(parents=True, exist_ok=True)
+            file_name = f'load_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+            with open(Path(results_path, file_name), 'w') as results_file:
+                json.dump(results, results_file, indent=2)
+            Logger.success(f'[LoadTest] Results saved to {Path(results_path, file_name)}')
+        except OSError as e:
+            Logger.warning(f'[LoadTest] Unable to write results to {results_path}: {e}')
+            Logger.info(json.dumps(results, indent=2))
@@ -0,0 +1,85 @@
+from threading import Lock
+
+
+class LoadTestStats:
+    def __init__(self):
+        self.lock = Lock()
+        self.packets_in = 0
+        self.packets_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.logins = 0
+        self.failures = 0
+        self.disconnects = 0
+        # Round trip times in seconds, measured through CMSG_PING / SMSG_PONG.
+        self.rtt_samples = []
+        # Login times in seconds, from socket connect until the bot is in world.
+        self.login_samples = []
+        # Phase name: [last duration, max duration], scraped from the world server metrics endpoint.
+        self.tick_phases = {}
+
+    def on_packet_in(self, size):
+        with self.lock:
+            self.packets_in += 1
+            self.bytes_in += size
+
+    def on_packet_out(self, size):
+        with self.lock:
+            self.packets_out += 1
+            self.bytes_out += size
+
+    def on_login(self, elapsed):
+        with self.lock:
+            self.logins += 1
+            self.login_samples.append(elapsed)
+
+    def on_failure(self):
+        with self.lock:
+            self.failures += 1
+
+    def on_disconnect(self):
+        with self.lock:
+            self.disconnects += 1
+
+    def on_rtt(self, elapsed):
+        with self.lock:
+            self.rtt_samples.append(elapsed)
+
+    def set_tick_phase(self, phase, last, max_):
+        with self.lock:
+            self.tick_phases[phase] = [last, max_]
+
+    # Returns a copy of the counters so reports can be computed without holding the lock.
+    def snapshot(self):
+        with self.lock:
+            return {
+                'packets_in': self.packets_in,
+                'packets_out': self.packets_out,
+                'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'logins': self.logins,
+                'failures': self.failures,
+                'disconnects': self.disconnects,
+                'rtt_samples': list(self.rtt_samples),
+                'login_samples': list(self.login_samples),
+                'tick_phases': {phase: list(values) for phase, values in self.tick_phases.items()}
+            }
+
+    @staticmethod
+    def get_percentile(samples, percentile):
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    @staticmethod
+    def summarize(samples):
+        return {
+            'count': len(samples),
+            'avg_ms': round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+            'p50_ms': round(LoadTestStats.get_percentile(samples, 50) * 1000, 3),
+            'p95_ms': round(LoadTestStats.get_percentile(samples, 95) * 1000, 3),
+            'p99_ms': round(LoadTestStats.get_percentile(samples, 99) * 1000, 3),
+            'max_ms': round(max(samples) * 1000, 3) if samples else 0.0
+        }